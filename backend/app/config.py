@@ -2,6 +2,25 @@ from pydantic import BaseSettings, AnyUrl
 
 class Settings(BaseSettings):
     DATABASE_URL: AnyUrl
+    # limite pentru PDF-urile trimise ca răspuns
+    PDF_MAX_BYTES: int = 10 * 1024 * 1024
+    PDF_MAX_PAGES: int = 50
+    PDF_WORKERS: int = 2
+    PDF_TIMEOUT: float = 30.0  # secunde per extragere
+    # stoc de întrebări pre-generate pentru /generate (per tip, dificultate, ensure)
+    QUESTION_POOL_ENABLED: bool = True
+    QUESTION_POOL_SIZE: int = 20
+    QUESTION_POOL_BATCH: int = 10
+    QUESTION_POOL_INTERVAL: float = 2.0
+    # cache pentru analizele de matrice (cheie: hash matrice + tip analiză)
+    ANALYSIS_CACHE_SIZE: int = 1024
+    ANALYSIS_CACHE_TTL: float = 3600.0
+    ANALYSIS_CACHE_CANONICAL: bool = False  # partajează rezultatele între jocuri izomorfe (permutări de linii/coloane)
+    # fișiere de payoff încărcate (.npy/.csv), analizate prin memory-map
+    UPLOAD_DIR: str = "uploads"
+    MATRIX_MAX_BYTES: int = 2 * 1024 * 1024 * 1024
+    # catalogul JSON de scenarii pentru search (gol = fișierul din app/services/search_custom)
+    SEARCH_SCENARIOS_PATH: str = ""
     # adaugă aici orice alte secrete/config necesare
     # JWT_SECRET: str = "changeme"
     # DEBUG: bool = False
@@ -7,6 +7,9 @@ from app.routers.nash.questions_custom_nash import router as questions_custom_ro
 from app.routers.csp import csp
 from app.routers.minmax import questions_minmax
 from app.routers.gametheory import questions_gametheory
+from app.services.question_pool import question_pool
+from app.services.minmax_parallel import shutdown_pool
+from app.services.nash import pdf_extract
 
 app = FastAPI(title="SmarTest L6 API")
 
@@ -31,6 +34,15 @@ def on_startup():
         print("Could not connect to DB after multiple retries.")
         # Optional: raise e or sys.exit(1)
 
+    # routers registered their generators on import; start stocking the buckets
+    question_pool.start()
+
+@app.on_event("shutdown")
+def on_shutdown():
+    question_pool.stop()
+    shutdown_pool()
+    pdf_extract.shutdown_pool()
+
 # CORS for frontend dev
 app.add_middleware(
     CORSMiddleware,
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import Dict, List
-from app.services.csp.evaluator_csp import CSP, solve_csp_wrapper
+from app.services.csp.evaluator_csp import CSP, solve_csp_wrapper, generate_problem
+from app.services.question_pool import question_pool
 from app.database import engine
 from app.models import Question
 from sqlmodel import Session
-import random
 import uuid
 from datetime import datetime
 
@@ -16,6 +16,8 @@ def get_db():
     with Session(engine) as session:
         yield session
 
+question_pool.register("csp_generated", lambda difficulty, ensure, count: [generate_problem() for _ in range(count)])
+
 class CSPRequest(BaseModel):
     variables: List[str]
     domains: Dict[str, List[int]]
@@ -96,75 +98,24 @@ def solve_csp(req: CSPRequest):
 
 @router.post("/generate_problem")
 def generate_csp_problem(req: CSPGenerateRequest):
-    # Generăm variabile aleatorii (ex: X1, X2, X3)
-    num_variables = random.randint(3, 5)  # Număr aleatoriu de variabile (3 până la 5)
-    variables = [f"X{i+1}" for i in range(num_variables)]
-
-    # Generăm domenii aleatorii pentru fiecare variabilă (ex: [1, 2, 3], [1, 2, 3, 4], etc.)
-    domains = {var: random.sample(range(1, 6), random.randint(2, 4)) for var in variables}
-
-    # Generăm constrângeri aleatorii (de ex: X1 != X2, X2 = X3, X3 > X4)
-    conditions = ["!=", "=", ">", "<"]
-    constraints_dicts = []
-    
-    # Logic to ensure valid structure
-    for i in range(len(variables) - 1):
-        x = variables[i]
-        y = variables[i + 1]
-        condition = random.choice(conditions)
-        constraints_dicts.append({"var1": x, "var2": y, "condition": condition})
-
-    # Prepare real constraints for solver (tuples with lambdas)
-    real_constraints = []
-    for constraint in constraints_dicts:
-        c = constraint["condition"]
-        x = constraint["var1"]
-        y = constraint["var2"]
-        if c == "!=":
-            real_constraints.append((x, y, lambda a, b: a != b))
-        elif c == "=":
-            real_constraints.append((x, y, lambda a, b: a == b))
-        elif c == ">":
-            real_constraints.append((x, y, lambda a, b: a > b))
-        elif c == "<":
-            real_constraints.append((x, y, lambda a, b: a < b))
-
-    # Crearea problemei CSP
-    csp = CSP(
-        variables=variables,
-        domains=domains,
-        constraints=real_constraints,
-    )
-
-    # Randomly select algorithm (33% chance each)
-    algorithm = random.choice(["fc", "mrv", "ac3"])
-
-    # Solve using selected algorithm
-    steps = []
-    assignment = {}
-    solution = solve_csp_wrapper(csp, assignment, domains, steps, algorithm=algorithm)
+    # problemă generată și rezolvată în fundal (vezi question_pool)
+    generated = question_pool.take("csp_generated")[0]
+    problem = generated["problem"]
 
     # --- Save to History (CSP Generated) ---
     try:
         with Session(engine) as db:
             q_id = str(uuid.uuid4())
-            prompt_text = f"CSP Generated ({algorithm.upper()}): {len(variables)} vars"
-            
-            problem_struct = {
-                "variables": variables,
-                "domains": domains,
-                "constraints": constraints_dicts,
-                "algorithm": algorithm # Store algorithm
-            }
+            prompt_text = f"CSP Generated ({problem['algorithm'].upper()}): {len(problem['variables'])} vars"
 
             q = Question(
                 id=q_id,
                 type="csp_generated",
                 prompt=prompt_text,
                 data={
-                    "problem": problem_struct,
-                    "solution": solution,
-                    "steps": steps
+                    "problem": problem,
+                    "solution": generated["solution"],
+                    "steps": generated["steps"]
                 }
             )
             db.add(q)
@@ -174,13 +125,8 @@ def generate_csp_problem(req: CSPGenerateRequest):
 
     # Returnăm problema generată și soluția
     return {
-        "problem": {
-            "variables": variables,
-            "domains": domains,
-            "constraints": constraints_dicts,
-            "algorithm": algorithm
-        },
-        "solution": solution
+        "problem": problem,
+        "solution": generated["solution"]
     }
 
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from sqlmodel import Session
 from app.database import engine
 from app.models import Question
@@ -7,6 +7,12 @@ from typing import List, Optional, Any, Dict
 import uuid
 from datetime import datetime
 from app.services.gametheory.custom_gametheory import solve_gametheory_scenario
+from app.services.analysis_cache import analysis_cache, matrix_digest
+from app.services.gametheory.matrix_store import (
+    MatrixLimitError, approx_nash_stored, dominant_strategies, open_matrix,
+    pareto_blocked, pure_nash_blocked, store_matrix_upload,
+)
+from app.services.nash.approx_nash import METHODS
 
 router = APIRouter()
 
@@ -23,16 +29,30 @@ class SolveRequest(BaseModel):
     player_col: str = "Player B"
 
 @router.post("/solve")
-def solve_custom(req: SolveRequest, db: Session = Depends(get_db)):
-    # 1. Solve the scenario
-    result = solve_gametheory_scenario(
-        matrix=req.matrix,
-        q_type=req.q_type,
-        row_labels=req.row_labels,
-        col_labels=req.col_labels,
-        player_row=req.player_row,
-        player_col=req.player_col
-    )
+def solve_custom(req: SolveRequest, explain: bool = Query(True), db: Session = Depends(get_db)):
+    # 0. Identical request solved before: same result and same history row
+    params = [req.q_type, req.row_labels, req.col_labels, req.player_row, req.player_col, explain]
+    try:
+        cache_key = ("gametheory_solve", matrix_digest(req.matrix, params))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    cached = analysis_cache.get(cache_key)
+    if cached is not None and db.get(Question, cached["question_id"]) is not None:
+        return cached
+
+    # 1. Solve the scenario (explanation text only if asked; GET /api/questions/{qid}/explain renders it later)
+    try:
+        result = solve_gametheory_scenario(
+            matrix=req.matrix,
+            q_type=req.q_type,
+            row_labels=req.row_labels,
+            col_labels=req.col_labels,
+            player_row=req.player_row,
+            player_col=req.player_col,
+            explain=explain
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     # 2. Save as a Question for history
     q_id = str(uuid.uuid4())
@@ -52,7 +72,7 @@ def solve_custom(req: SolveRequest, db: Session = Depends(get_db)):
             "player_col": req.player_col,
             "q_type": req.q_type,
             "solution": result["solution"],
-            "explanation": result["explanation"],
+            "details": result.get("details"),
             "is_solver": True # Flag to indicate this was a solver run
         }
     )
@@ -61,9 +81,71 @@ def solve_custom(req: SolveRequest, db: Session = Depends(get_db)):
     db.refresh(q)
 
     # Return result + question info
-    return {
+    response = {
         "solution": result["solution"],
-        "explanation": result["explanation"],
+        "explanation": result.get("explanation"),
+        "details": result.get("details"),
         "question_id": q.id,
         "created_at": q.created_at
     }
+    analysis_cache.put(cache_key, response)
+    return response
+
+# --- Large matrices: uploaded once, analyzed through a memory map ---
+
+def _stored_analysis(matrix_id: str, kind: str, params: List[Any], compute):
+    # matrix ids are content hashes, so results can be cached by id
+    key = ("stored_" + kind, matrix_id, tuple(params))
+    cached = analysis_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        arr = open_matrix(matrix_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Matrix not found")
+    try:
+        result = {"matrix_id": matrix_id, "rows": arr.shape[0], "cols": arr.shape[1], **compute(arr)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    analysis_cache.put(key, result)
+    return result
+
+@router.post("/matrices")
+async def upload_matrix(file: UploadFile = File(...)):
+    """
+    Payoff file: .npy of shape (m, n, 2) or CSV with one row per line and
+    u_row,u_col for every column. The returned matrix_id is the file's SHA-256.
+    """
+    try:
+        return await store_matrix_upload(file)
+    except MatrixLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/matrices/{matrix_id}/dominance")
+def matrix_dominance(matrix_id: str):
+    return _stored_analysis(matrix_id, "dominance", [], dominant_strategies)
+
+@router.get("/matrices/{matrix_id}/pareto")
+def matrix_pareto(matrix_id: str, limit: int = Query(1000, ge=0, le=100_000)):
+    return _stored_analysis(matrix_id, "pareto", [limit], lambda arr: pareto_blocked(arr, limit))
+
+@router.get("/matrices/{matrix_id}/nash")
+def matrix_nash(
+    matrix_id: str,
+    mode: str = Query("pure"),
+    limit: int = Query(1000, ge=0, le=100_000),
+    method: str = Query("regret_matching"),
+    max_iterations: int = Query(10000, ge=1, le=1_000_000),
+    time_budget_ms: int = Query(1000, ge=1, le=30_000),
+    target_epsilon: float = Query(1e-3, gt=0),
+):
+    if mode == "pure":
+        return _stored_analysis(matrix_id, "nash_pure", [limit], lambda arr: pure_nash_blocked(arr, limit))
+    if mode == "approx":
+        if method not in METHODS:
+            raise HTTPException(status_code=400, detail=f"Unknown method: {method}")
+        budget = dict(method=method, max_iterations=max_iterations, time_budget_ms=time_budget_ms, target_epsilon=target_epsilon)
+        return _stored_analysis(matrix_id, "nash_approx", sorted(budget.items()), lambda arr: approx_nash_stored(arr, **budget))
+    raise HTTPException(status_code=400, detail="mode must be 'pure' or 'approx'")
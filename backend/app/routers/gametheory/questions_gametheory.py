@@ -4,11 +4,14 @@ from app.database import engine
 from app.models import Question, Evaluation
 from app.services.gametheory.generator_gametheory import generate_gametheory_question
 from app.services.gametheory.evaluator_gametheory import evaluate_gametheory
+from app.services.question_pool import question_pool
 import json
 from typing import Optional, List
 
 router = APIRouter()
 
+question_pool.register("gametheory", lambda difficulty, ensure, count: generate_gametheory_question(count=count))
+
 def get_db():
     with Session(engine) as session:
         yield session
@@ -25,7 +28,7 @@ def _hide_solution(q_json: dict) -> dict:
 
 @router.post("/generate")
 def generate(count: int = Query(1, ge=1, le=50), db: Session = Depends(get_db)):
-    qdatas = generate_gametheory_question(count=count)
+    qdatas = question_pool.take("gametheory", count=count)
     
     created = []
     for qdata in qdatas:
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException, Body, Depends
 from pydantic import BaseModel
 from typing import Optional, Dict
-from app.services.minmax_service import minmax_service
+from app.services.minmax_service import minmax_service, parse_compact_tree
+from app.services.minmax_parallel import solve_root_split
+from app.services.minmax_mcts import ProceduralNode, solve_mcts
+from app.services.minmax_games import POSITION_SOLUTION_KEYS, generate_game_tree
+from app.services.question_pool import question_pool
 from sqlmodel import Session
 from app.database import engine
 from app.models import Question
@@ -14,13 +18,30 @@ def get_db():
     with Session(engine) as session:
         yield session
 
+def _generate_minmax(difficulty: str, game: str, count: int):
+    """Pool producer; `game` is the bucket's ensure slot ("random" or a game name)."""
+    if game == "random":
+        return [{"tree": minmax_service.generate_tree(difficulty)} for _ in range(count)]
+    return [generate_game_tree(game, difficulty) for _ in range(count)]
+
+question_pool.register(
+    "minmax_generated", _generate_minmax,
+    difficulties=("easy", "medium", "hard"), ensures=("random", "tictactoe", "connect4"),
+)
+
 class GenerateRequest(BaseModel):
     difficulty: str = "easy"  # easy, medium, hard
+    game: str = "random"  # random, tictactoe, connect4
 
 class SubmitRequest(BaseModel):
-    tree: Dict
+    tree: Optional[Dict] = None
+    # compact alternative to `tree`, e.g. "((3 5) (2 9))" (see parse_compact_tree)
+    tree_text: Optional[str] = None
     root_value: int
     visited_leaves: int
+    # false skips the step log; GET /api/questions/{qid}/explain renders it later only for
+    # custom trees (minmax_custom), generated questions stay locked since it reveals the answer
+    explain: bool = True
 
 class CheckResponse(BaseModel):
     correct: bool
@@ -30,8 +51,19 @@ class CheckResponse(BaseModel):
     reference: Optional[str] = None
     message: str
 
+class SolveRequest(BaseModel):
+    tree: Optional[Dict] = None
+    tree_text: Optional[str] = None
+    # seeded tree generated on demand: {"seed", "depth", "branching": [lo, hi], "values": [lo, hi]}
+    procedural: Optional[Dict] = None
+    mode: str = "parallel"  # parallel, mcts
+    workers: Optional[int] = None  # capped at the CPU count
+    with_leaf_count: bool = False  # canonical leaf count = one more full sequential solve
+    time_budget_ms: int = 200  # mcts only
+
 class CreateCustomRequest(BaseModel):
-    tree: Dict
+    tree: Optional[Dict] = None
+    tree_text: Optional[str] = None
     prompt: Optional[str] = "Custom MinMax Tree"
     custom_input: Optional[str] = None
     user_answer: Optional[Dict] = None
@@ -41,30 +73,52 @@ class CreateCustomRequest(BaseModel):
 def generate_question(req: GenerateRequest, db: Session = Depends(get_db)):
     """
     Generates a MinMax tree based on difficulty and saves it to DB for history.
+    With game=tictactoe|connect4 the tree is built from a real game position.
     """
-    tree = minmax_service.generate_tree(req.difficulty)
-    
+    try:
+        position = question_pool.take("minmax_generated", difficulty=req.difficulty, ensure=req.game)[0]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    tree = position.pop("tree")
+    position = position or None
+
     # Save to History
     q_id = str(uuid.uuid4())
+    data = {
+        "tree": tree,
+        "difficulty": req.difficulty
+    }
+    if position:
+        data["position"] = position
     q = Question(
         id=q_id,
         type="minmax_generated",
-        prompt=f"MinMax Tree ({req.difficulty})",
-        data={
-            "tree": tree,
-            "difficulty": req.difficulty
-        }
+        prompt=f"MinMax Tree ({req.difficulty})" if not position else f"MinMax {req.game} ({req.difficulty})",
+        data=data
     )
     db.add(q)
     db.commit()
     
-    return {"tree": tree, "difficulty": req.difficulty, "id": q_id}
+    response = {"tree": tree, "difficulty": req.difficulty, "id": q_id}
+    if position:
+        # best_move / game_value are the answer: kept in data, never sent
+        response["position"] = {k: v for k, v in position.items() if k not in POSITION_SOLUTION_KEYS}
+    return response
 
 @router.post("/create_custom")
 def create_custom_question(req: CreateCustomRequest, db: Session = Depends(get_db)):
     """
     Saves a custom MinMax tree (and optionally its last result) to DB history.
     """
+    if req.tree is None and not req.tree_text:
+        raise HTTPException(status_code=400, detail="Either tree or tree_text is required")
+    if req.tree is None:
+        # validate the compact form before storing it as-is
+        try:
+            parse_compact_tree(req.tree_text)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     q_id = str(uuid.uuid4())
     q = Question(
         id=q_id,
@@ -72,6 +126,7 @@ def create_custom_question(req: CreateCustomRequest, db: Session = Depends(get_d
         prompt=req.prompt,
         data={
             "tree": req.tree,
+            "tree_text": req.tree_text,
             "customInput": req.custom_input,
             "userAnswer": req.user_answer,
             "checkResult": req.check_result
@@ -86,7 +141,13 @@ def submit_answer(req: SubmitRequest):
     """
     Validates the user's answer against the server-calculated result.
     """
-    real_root_val, real_visited_leaves, explanation = minmax_service.solve_alpha_beta(req.tree)
+    tree = req.tree if req.tree is not None else req.tree_text
+    if tree is None:
+        raise HTTPException(status_code=400, detail="Either tree or tree_text is required")
+    try:
+        real_root_val, real_visited_leaves, explanation = minmax_service.solve_alpha_beta(tree, explain=req.explain)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     correct_root = (req.root_value == real_root_val)
     correct_leaves = (req.visited_leaves == real_visited_leaves)
@@ -101,3 +162,32 @@ def submit_answer(req: SubmitRequest):
         explanation=explanation,
         message=msg
     )
+
+
+@router.post("/solve")
+def solve_tree(req: SolveRequest):
+    """
+    Fast answer (root value + best move) for large trees, without the step-by-step log.
+    - parallel: exact alpha-beta with root splitting; the canonical sequential leaf
+      count is computed separately when requested.
+    - mcts: anytime UCT estimate within time_budget_ms, for trees too large to search.
+    """
+    if req.procedural is not None:
+        try:
+            tree = ProceduralNode.from_spec(req.procedural)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid procedural tree: {e}")
+    else:
+        tree = req.tree if req.tree is not None else req.tree_text
+    if tree is None:
+        raise HTTPException(status_code=400, detail="One of tree, tree_text or procedural is required")
+
+    try:
+        if req.mode == "parallel":
+            return solve_root_split(tree, workers=req.workers, with_leaf_count=req.with_leaf_count)
+        if req.mode == "mcts":
+            budget = max(1, min(req.time_budget_ms, 10000))
+            return solve_mcts(tree, time_budget_ms=budget)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    raise HTTPException(status_code=400, detail=f"Unknown solve mode: {req.mode}")
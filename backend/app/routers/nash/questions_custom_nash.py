@@ -1,18 +1,31 @@
 # modifică endpointul generate pentru a accepta fixed_rows / fixed_cols
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 from sqlmodel import Session
 from app.database import engine
 from app.models import Question
 import uuid
 from datetime import datetime
-from app.services.nash_custom import generator_custom_nash
+from app.services.nash_custom import generator_custom_nash, incremental_nash
+from app.services.question_pool import question_pool
+from app.services.analysis_cache import cached_analysis
 
 router = APIRouter()  # router fără prefix intern, main.py va include cu prefixul dorit
 
 def get_db_session():
     return Session(engine)
 
+_STUDENT_INPUT = "normal_form_game_custom_student_input"
+for _kind, _student_input in (("normal_form_game_custom", False), (_STUDENT_INPUT, True)):
+    question_pool.register(
+        _kind,
+        lambda difficulty, ensure, count, student_input=_student_input: generator_custom_nash.generate_batch(
+            count=count, distribution=None, ensure=ensure, student_input=student_input, difficulty=difficulty,
+        ),
+        difficulties=("easy", "medium", "hard"),
+    )
+
 @router.post("/generate")
 def generate_questions_endpoint(
     request: Request,
@@ -31,14 +44,20 @@ def generate_questions_endpoint(
     created_items: List[Dict[str, Any]] = []
     with get_db_session() as db:
         
-        qdatas = generator_custom_nash.generate_batch(
-            count=count,
-            distribution=None,
-            student_input=(save_as == "normal_form_game_custom_student_input"),
-            fixed_rows=fixed_rows,
-            fixed_cols=fixed_cols,
-            difficulty=difficulty,
-        )
+        student_input = save_as == _STUDENT_INPUT
+        if fixed_rows or fixed_cols:
+            # explicit sizes are not pooled
+            qdatas = generator_custom_nash.generate_batch(
+                count=count,
+                distribution=None,
+                student_input=student_input,
+                fixed_rows=fixed_rows,
+                fixed_cols=fixed_cols,
+                difficulty=difficulty,
+            )
+        else:
+            kind = _STUDENT_INPUT if student_input else "normal_form_game_custom"
+            qdatas = question_pool.take(kind, count=count, difficulty=difficulty)
 
         for qd in qdatas:
             if save_as == "normal_form_game_custom_student_input":
@@ -81,4 +100,78 @@ def generate_questions_endpoint(
                 "data": q.data,
             })
 
-    return {"created": created_items}
\ No newline at end of file
+    return {"created": created_items}
+
+class AnalyzeRequest(BaseModel):
+    payoff_matrix: List[List[List[float]]]
+    mode: str = "pure"  # "pure" | "mixed" | "approx"
+    # approx only: "regret_matching" | "fictitious_play" and its budgets
+    method: str = "regret_matching"
+    max_iterations: int = Field(10000, ge=1, le=1_000_000)
+    time_budget_ms: int = Field(1000, ge=1, le=30_000)
+    target_epsilon: float = 1e-3
+
+@router.post("/analyze")
+def analyze_endpoint(req: AnalyzeRequest):
+    # identical matrices posted again are answered from the analysis cache
+    try:
+        if req.mode == "mixed":
+            return cached_analysis("nash_mixed", req.payoff_matrix, generator_custom_nash.analyze_matrix_mixed)
+        if req.mode == "pure":
+            return cached_analysis("nash_pure", req.payoff_matrix, generator_custom_nash.analyze_matrix)
+        if req.mode == "approx":
+            params = [req.method, req.max_iterations, req.time_budget_ms, req.target_epsilon]
+            return cached_analysis(
+                "nash_approx", req.payoff_matrix,
+                lambda arr: generator_custom_nash.analyze_matrix_approx(arr, *params), params,
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    raise HTTPException(status_code=400, detail=f"Unknown mode: {req.mode}")
+
+class EditorOpenRequest(BaseModel):
+    payoff_matrix: Optional[List[List[List[float]]]] = None
+    rows: Optional[int] = None
+    cols: Optional[int] = None
+    target_has_pure: Optional[bool] = None
+
+class EditorCellRequest(BaseModel):
+    row: int  # 1-based
+    col: int  # 1-based
+    value: List[float]  # [row_payoff, col_payoff]
+
+@router.post("/editor")
+def open_editor(req: EditorOpenRequest):
+    """Start a live-feedback session, from a matrix or an all-zero rows x cols matrix."""
+    try:
+        if req.payoff_matrix is not None:
+            payoff = generator_custom_nash.payoff_array(req.payoff_matrix)
+        elif req.rows and req.cols:
+            # validated before allocating anything
+            incremental_nash.check_editor_size(req.rows, req.cols)
+            payoff = [[[0, 0]] * req.cols for _ in range(req.rows)]
+        else:
+            raise ValueError("give payoff_matrix or positive rows and cols")
+        session_id, analyzer = incremental_nash.open_session(payoff, req.target_has_pure)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"session_id": session_id, **analyzer.state()}
+
+@router.patch("/editor/{session_id}")
+def edit_cell(session_id: str, req: EditorCellRequest):
+    analyzer = incremental_nash.get_session(session_id)
+    if analyzer is None:
+        raise HTTPException(status_code=404, detail="Editor session not found")
+    if len(req.value) != 2:
+        raise HTTPException(status_code=400, detail="value must be a pair [row_payoff, col_payoff]")
+    try:
+        added, removed = analyzer.set_cell(req.row - 1, req.col - 1, req.value[0], req.value[1])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"added": added, "removed": removed, **analyzer.state()}
+
+@router.delete("/editor/{session_id}")
+def close_editor(session_id: str):
+    if not incremental_nash.close_session(session_id):
+        raise HTTPException(status_code=404, detail="Editor session not found")
+    return {"closed": session_id}
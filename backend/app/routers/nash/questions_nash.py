@@ -4,11 +4,28 @@ from app.database import engine
 from app.models import Question, Evaluation
 from app.services.nash.generator_nash import generate_batch
 from app.services.nash.evaluator_nash import parse_nfg_answer, evaluate_normal_form
+from app.services.nash import nplayer_nash
+from app.services.nash.pdf_extract import PdfExtractError, PdfLimitError, extract_pdf_text
+from app.services.question_pool import question_pool
+from app.services.explain import ExplanationLocked, explain_question
+from app.services.minmax_games import POSITION_SOLUTION_KEYS
 import json
 from typing import Optional
 
 router = APIRouter()
 
+_DIFFICULTIES = ("easy", "medium", "hard")
+question_pool.register(
+    "normal_form_game",
+    lambda difficulty, ensure, count: generate_batch(count=count, difficulty=difficulty),
+    difficulties=_DIFFICULTIES,
+)
+question_pool.register(
+    nplayer_nash.QUESTION_TYPE,
+    lambda difficulty, ensure, count: nplayer_nash.generate_nplayer_batch(count=count, difficulty=difficulty),
+    difficulties=_DIFFICULTIES,
+)
+
 def get_db():
     with Session(engine) as session:
         yield session
@@ -19,6 +36,9 @@ def _hide_solution_from_question_json(q_json: dict) -> dict:
     if isinstance(data, dict):
         d = dict(data)
         d.pop("equilibria", None)
+        d.pop("best_responses", None)
+        if isinstance(d.get("position"), dict):
+            d["position"] = {k: v for k, v in d["position"].items() if k not in POSITION_SOLUTION_KEYS}
         q["data"] = d
     return q
 
@@ -27,14 +47,8 @@ def _hide_solution_from_question_json(q_json: dict) -> dict:
 def generate(count: int = Query(1, ge=1, le=1000),
              difficulty: Optional[str] = Query("medium", regex="^(easy|medium|hard)$"),
              db: Session = Depends(get_db)):
-    # Legacy params removed or ignored
-    parsed_dist = None
-    
-    qdatas = generate_batch(
-        count=count,
-        distribution=parsed_dist,
-        difficulty=difficulty
-    )
+    # pre-generated and solved in the background (see question_pool)
+    qdatas = question_pool.take("normal_form_game", count=count, difficulty=difficulty)
 
     created = []
     for qdata in qdatas:
@@ -47,16 +61,63 @@ def generate(count: int = Query(1, ge=1, le=1000),
                 "row_labels": qdata["row_labels"],
                 "col_labels": qdata["col_labels"],
                 "matrix_lines": qdata["matrix_lines"],
+                "equilibria": qdata["equilibria"],
+                "best_responses": qdata["best_responses"]
+            }
+        )
+        db.add(q)
+        # serialize before commit: all fields are set client-side, no refresh round-trip needed
+        created.append(_hide_solution_from_question_json(json.loads(q.json())))
+
+    # single transaction for the whole batch
+    db.commit()
+    return {"created": created}
+
+
+@router.post("/generate_nplayer")
+def generate_nplayer(count: int = Query(1, ge=1, le=1000),
+                     difficulty: Optional[str] = Query("medium", regex="^(easy|medium|hard)$"),
+                     db: Session = Depends(get_db)):
+    qdatas = question_pool.take(nplayer_nash.QUESTION_TYPE, count=count, difficulty=difficulty)
+
+    created = []
+    for qdata in qdatas:
+        q = Question(
+            id=qdata["id"],
+            type=qdata["type"],
+            prompt=qdata["prompt"],
+            data={
+                "players": qdata["players"],
+                "strategies": qdata["strategies"],
+                "shape": qdata["shape"],
+                "payoff_flat": qdata["payoff_flat"],
                 "equilibria": qdata["equilibria"]
             }
         )
         db.add(q)
-        db.commit()
-        db.refresh(q)
-        created.append(q)
+        created.append(_hide_solution_from_question_json(json.loads(q.json())))
 
-    return {"created": [ _hide_solution_from_question_json(json.loads(q.json())) for q in created ]}
+    db.commit()
+    return {"created": created}
 
+def _save_nplayer_evaluation(q: Question, text: str, eval_res: dict, db: Session) -> dict:
+    eval_record = Evaluation(
+        question_id=q.id,
+        submission_text=text,
+        submission_positions=[list(p) for p in eval_res.get("provided_equilibria", [])],
+        score_percent=eval_res.get("score_percent", 0),
+        meta={
+            "provided_has": eval_res.get("provided_has"),
+            "matched_equilibria": eval_res.get("matched_equilibria"),
+            "missing_equilibria": eval_res.get("missing_equilibria"),
+            "extra_equilibria": eval_res.get("extra_equilibria"),
+            "note": eval_res.get("note"),
+        },
+    )
+    db.add(eval_record)
+    db.commit()
+    db.refresh(eval_record)
+    return {"result": eval_res, "evaluation_id": eval_record.id}
 
 @router.get("/")
 def list_questions(type: Optional[str] = Query(None), db: Session = Depends(get_db)):
@@ -97,12 +158,34 @@ def get_question(qid: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Question not found")
     return _hide_solution_from_question_json(json.loads(q.json()))
 
+@router.get("/{qid}/explain")
+def explain_endpoint(qid: str, evaluation_id: Optional[int] = Query(None), db: Session = Depends(get_db)):
+    """
+    Explanation of one graded submission (memoized); without evaluation_id only
+    for solver/custom rows, since for generated questions it reveals the answer.
+    """
+    q = db.get(Question, qid)
+    if not q:
+        raise HTTPException(status_code=404, detail="Question not found")
+    evaluation = None
+    if evaluation_id is not None:
+        evaluation = db.get(Evaluation, evaluation_id)
+        if not evaluation or evaluation.question_id != qid:
+            raise HTTPException(status_code=404, detail="Evaluation not found")
+    try:
+        return {"question_id": qid, "evaluation_id": evaluation_id, "explanation": explain_question(q, evaluation)}
+    except ExplanationLocked as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/{qid}/submit")
 async def submit_answer(
     qid: str,
     request: Request,
     submission_text: str = Form(default=""),
     submission_pdf: UploadFile = File(default=None),
+    explain: bool = Query(True),
     db: Session = Depends(get_db),
 ):
     q = db.get(Question, qid)
@@ -117,7 +200,7 @@ async def submit_answer(
         claimed_equilibria = body.get("claimed_equilibria")
         submission_text_body = body.get("submission_text", "")
 
-        # Only custom student-input questions support JSON submit
+        # JSON submit: custom student-input questions and N-player questions
         if q.type == "normal_form_game_custom_student_input":
             from app.services.nash_custom.evaluator_custom_nash import evaluate_custom_submission
 
@@ -156,17 +239,36 @@ async def submit_answer(
             db.refresh(eval_record)
             return {"result": eval_res, "evaluation_id": eval_record.id}
 
-        raise HTTPException(status_code=400, detail="JSON submit is only supported for custom student-input questions")
+        if q.type == nplayer_nash.QUESTION_TYPE:
+            data = q.data or {}
+            profiles = body.get("profiles")
+            if profiles is None:
+                parsed = nplayer_nash.parse_profiles(submission_text_body, data.get("players", 0),
+                                                     nplayer_nash.strategy_counts(data))
+                provided_has, profiles = parsed["has_equilibrium"], parsed["equilibria"]
+            else:
+                limit = nplayer_nash.profile_limit(data)
+                if not isinstance(profiles, list) or (limit is not None and len(profiles) > limit):
+                    raise HTTPException(status_code=400, detail=f"profiles must be a list of at most {limit} profiles")
+                provided_has = bool(body.get("has_equilibrium", bool(profiles)))
+            try:
+                eval_res = nplayer_nash.evaluate_nplayer(data, provided_has, profiles)
+            except (TypeError, ValueError) as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return _save_nplayer_evaluation(q, submission_text_body, eval_res, db)
+
+        raise HTTPException(status_code=400, detail="JSON submit is only supported for custom student-input and N-player questions")
 
     # Form / multipart path (existing behavior): extract text (form or PDF) and evaluate using evaluate_normal_form
     text = submission_text or ""
     if submission_pdf and submission_pdf.filename:
         try:
-            from PyPDF2 import PdfReader
-
-            reader = PdfReader(submission_pdf.file)
-            pages_text = [p.extract_text() or "" for p in reader.pages]
-            text = f"{text}\n" + "\n".join(pages_text) if text else "\n".join(pages_text)
+            pdf_text = await extract_pdf_text(submission_pdf)
+            text = f"{text}\n{pdf_text}" if text else pdf_text
+        except PdfLimitError as e:
+            raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+        except PdfExtractError as e:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
         except Exception:
             # ignore PDF extraction errors and continue with available text
             pass
@@ -174,9 +276,19 @@ async def submit_answer(
     if not text.strip():
         raise HTTPException(status_code=400, detail="Empty submission")
 
+    if q.type == nplayer_nash.QUESTION_TYPE:
+        data = q.data or {}
+        parsed = nplayer_nash.parse_profiles(text, data.get("players", 0), nplayer_nash.strategy_counts(data))
+        try:
+            eval_res = nplayer_nash.evaluate_nplayer(data, parsed["has_equilibrium"], parsed["equilibria"])
+        except (TypeError, ValueError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return _save_nplayer_evaluation(q, text, eval_res, db)
+
     q_json = json.loads(q.json())
     question_data = q_json.get("data", {})
-    eval_res = evaluate_normal_form(question_data, text)
+    # explain=false skips the explanation text; GET /{qid}/explain?evaluation_id= renders it later
+    eval_res = evaluate_normal_form(question_data, text, explain=explain)
 
     meta_dict = {
         "provided_has": eval_res.get("provided_has"),
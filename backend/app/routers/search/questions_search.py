@@ -4,11 +4,15 @@ from app.database import engine
 from app.models import Question, Evaluation
 from app.services.search.generator_search import generate_batch
 from app.services.search.evaluator_search import evaluate_search_submission
+from app.services.search_custom.catalog import reload_catalog
+from app.services.question_pool import question_pool
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 
 router = APIRouter()
 
+question_pool.register("search_problem_identification", lambda difficulty, ensure, count: generate_batch(count=count))
+
 def get_db():
     with Session(engine) as session:
         yield session
@@ -26,7 +30,7 @@ def generate_search_questions(count: int = Query(1, ge=1, le=50), db: Session =
     """
     Generates new search problem identification questions.
     """
-    raw_questions = generate_batch(count=count)
+    raw_questions = question_pool.take("search_problem_identification", count=count)
     created = []
 
     for qd in raw_questions:
@@ -59,6 +63,19 @@ def generate_search_questions(count: int = Query(1, ge=1, le=50), db: Session =
     
     return {"questions": created}
 
+@router.post("/scenarios/reload")
+def reload_search_scenarios():
+    """
+    Re-reads the scenario catalog (SEARCH_SCENARIOS_PATH) and swaps it in; requests
+    already running finish on the previous catalog. Stocked questions are dropped.
+    """
+    try:
+        catalog = reload_catalog()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    question_pool.discard("search_problem_identification")
+    return {"scenarios": len(catalog.scenarios), "path": catalog.path, "loaded_at": catalog.loaded_at}
+
 @router.post("/create_custom")
 def create_custom_search_question(payload: CustomSearchCreate, db: Session = Depends(get_db)):
     """
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.config import settings
+
+class AnalysisCache:
+    """LRU cache with a time-to-live; values are shared, callers must not mutate them."""
+
+    def __init__(self):
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > settings.ANALYSIS_CACHE_TTL:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.ANALYSIS_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+analysis_cache = AnalysisCache()
+
+def matrix_digest(payoff, params: Any = None) -> str:
+    """SHA-256 of the matrix values (int and float payoffs hash alike) plus JSON params."""
+    arr = np.ascontiguousarray(np.asarray(payoff, dtype=np.float64))
+    digest = hashlib.sha256()
+    digest.update(repr(arr.shape).encode())
+    digest.update(arr.tobytes())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+def _canonical_order(arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Row and column orders that map every row/column permutation of a game to the
+    same matrix whenever the strategies' payoff multisets are distinct: rows are
+    sorted by their cells sorted as (u_row, u_col) pairs, columns likewise. Both
+    keys ignore the other player's order, so they can be computed independently.
+    Equal multisets keep their input order (a possible miss, never a wrong hit).
+    """
+    def order(a: np.ndarray) -> np.ndarray:
+        cells = np.take_along_axis(a, np.lexsort((a[..., 1], a[..., 0]), axis=1)[..., None], axis=1)
+        flat = cells.reshape(a.shape[0], -1)
+        return np.lexsort(flat.T[::-1])
+    return order(arr), order(arr.transpose(1, 0, 2))
+
+def _strategy_map(order: np.ndarray) -> Callable[[int], int]:
+    return lambda s: int(order[s - 1]) + 1
+
+def _remap_dominance(res: Dict[str, Any], rows: np.ndarray, cols: np.ndarray) -> Dict[str, Any]:
+    out = {}
+    for player, order in (("row", rows), ("col", cols)):
+        f = _strategy_map(order)
+        rel = res[player]
+        out[player] = {
+            "dominant": sorted(map(f, rel["dominant"])),
+            "strictly_dominant": sorted(map(f, rel["strictly_dominant"])),
+            **{
+                kind: sorted(
+                    ({"strategy": f(d["strategy"]), "dominated_by": sorted(map(f, d["dominated_by"]))} for d in rel[kind]),
+                    key=lambda d: d["strategy"],
+                )
+                for kind in ("strictly_dominated", "weakly_dominated")
+            },
+        }
+    return out
+
+def _remap_pareto(res: Dict[str, Any], rows: np.ndarray, cols: np.ndarray) -> Dict[str, Any]:
+    fr, fc = _strategy_map(rows), _strategy_map(cols)
+    cell = lambda rc: (fr(rc[0]), fc(rc[1]))
+    return {
+        "frontier": sorted(cell(rc) for rc in res["frontier"]),
+        "dominated": sorted(
+            ({"cell": cell(d["cell"]), "dominated_by": cell(d["dominated_by"])} for d in res["dominated"]),
+            key=lambda d: d["cell"],
+        ),
+    }
+
+def _remap_pure_nash(res: Dict[str, Any], rows: np.ndarray, cols: np.ndarray) -> Dict[str, Any]:
+    fr, fc = _strategy_map(rows), _strategy_map(cols)
+    order = [
+        {**step, "strategy": (fr if step["player"] == "row" else fc)(step["strategy"]),
+         "dominated_by": (fr if step["player"] == "row" else fc)(step["dominated_by"])}
+        for step in res["elimination_order"]
+    ]
+    order.sort(key=lambda step: (step["round"], step["player"] != "row", step["strategy"]))
+    return {
+        "equilibria": sorted((fr(r), fc(c)) for r, c in res["equilibria"]),
+        "elimination_order": order,
+    }
+
+# analyses whose results can be mapped back from the canonical strategy order
+_REMAP: Dict[str, Callable[[Dict[str, Any], np.ndarray, np.ndarray], Dict[str, Any]]] = {
+    "dominance": _remap_dominance,
+    "pareto": _remap_pareto,
+    "pure_nash": _remap_pure_nash,
+}
+
+def cached_analysis(kind: str, payoff, compute: Callable[[np.ndarray], Any],
+                    params: Sequence[Any] = (), canonical: Optional[bool] = None) -> Any:
+    """
+    compute(payoff array) through the cache, keyed on (kind, matrix hash, params).
+    With canonicalization (ANALYSIS_CACHE_CANONICAL, only for the kinds in _REMAP)
+    the analysis runs on the canonically permuted matrix and its indices are mapped
+    back, so isomorphic games share one entry.
+    """
+    try:
+        arr = np.asarray(payoff)
+    except ValueError:
+        arr = None
+    if arr is None or arr.dtype.kind not in "iuf":
+        # malformed input: no key to compute, let the analysis report the error
+        return compute(payoff)
+    if canonical is None:
+        canonical = settings.ANALYSIS_CACHE_CANONICAL
+    if canonical and kind in _REMAP and arr.ndim == 3 and arr.shape[2] == 2 and arr.size:
+        rows, cols = _canonical_order(arr)
+        carr = arr[np.ix_(rows, cols)]
+        key = (kind, matrix_digest(carr, list(params)), True)
+        result = analysis_cache.get(key)
+        if result is None:
+            result = compute(carr)
+            analysis_cache.put(key, result)
+        return _REMAP[kind](result, rows, cols)
+
+    key = (kind, matrix_digest(arr, list(params)), False)
+    result = analysis_cache.get(key)
+    if result is None:
+        result = compute(arr)
+        analysis_cache.put(key, result)
+    return result
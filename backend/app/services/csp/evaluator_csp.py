@@ -1,3 +1,4 @@
+import random
 from copy import deepcopy
 
 class CSP:
@@ -180,3 +181,50 @@ def solve_csp_wrapper(csp, partial_assignment, domains, steps, algorithm="fc"):
     
     return backtracking_search(csp, partial_assignment, current_domains, steps, algorithm)
 
+_CONDITIONS = {
+    "!=": lambda a, b: a != b,
+    "=": lambda a, b: a == b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+}
+
+def build_constraints(constraints_dicts):
+    """{"var1", "var2", "condition"} dicts -> (x, y, predicate) tuples for CSP."""
+    return [
+        (c["var1"], c["var2"], _CONDITIONS[c["condition"]])
+        for c in constraints_dicts if c["condition"] in _CONDITIONS
+    ]
+
+def generate_problem():
+    """
+    Random chain CSP (3-5 variables, constraints between neighbours) solved with a
+    randomly chosen algorithm. Returns {"problem", "solution", "steps"}.
+    """
+    # Generăm variabile aleatorii (ex: X1, X2, X3)
+    num_variables = random.randint(3, 5)
+    variables = [f"X{i+1}" for i in range(num_variables)]
+
+    # Generăm domenii aleatorii pentru fiecare variabilă (ex: [1, 2, 3], [1, 2, 3, 4], etc.)
+    domains = {var: random.sample(range(1, 6), random.randint(2, 4)) for var in variables}
+
+    # Generăm constrângeri aleatorii (de ex: X1 != X2, X2 = X3, X3 > X4)
+    constraints_dicts = [
+        {"var1": variables[i], "var2": variables[i + 1], "condition": random.choice(list(_CONDITIONS))}
+        for i in range(len(variables) - 1)
+    ]
+    csp = CSP(variables=variables, domains=domains, constraints=build_constraints(constraints_dicts))
+
+    # Randomly select algorithm (33% chance each)
+    algorithm = random.choice(["fc", "mrv", "ac3"])
+    steps = []
+    solution = solve_csp_wrapper(csp, {}, domains, steps, algorithm=algorithm)
+    return {
+        "problem": {
+            "variables": variables,
+            "domains": domains,
+            "constraints": constraints_dicts,
+            "algorithm": algorithm,
+        },
+        "solution": solution,
+        "steps": steps,
+    }
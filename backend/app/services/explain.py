@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.models import Evaluation, Question
+from app.services.gametheory.custom_gametheory import explain_gametheory_scenario
+from app.services.minmax_service import minmax_service
+from app.services.nash.evaluator_nash import explain_normal_form
+
+_CACHE_SIZE = 512
+
+# user-supplied rows whose solution is not secret (the author already has the input)
+_OPEN_TYPES = {"minmax_custom"}
+
+# Rendered explanations by (question id, evaluation id or None); questions are never edited.
+# Entries without an evaluation only ever exist for open questions (see _is_open).
+_explanations: "OrderedDict[Tuple[str, Optional[int]], str]" = OrderedDict()
+
+class ExplanationLocked(PermissionError):
+    """A generated question's explanation reveals its answer; it needs a graded submission."""
+
+def _is_open(q: Question) -> bool:
+    data = q.data or {}
+    return bool(data.get("is_solver") or data.get("is_custom")) or q.type in _OPEN_TYPES
+
+def _render(q: Question, evaluation: Optional[Evaluation]) -> str:
+    data = q.data or {}
+    if evaluation is None and data.get("explanation"):
+        # rows stored before explanations became lazy
+        return data["explanation"]
+
+    if data.get("is_solver") and q.type.startswith("game_theory_"):
+        return explain_gametheory_scenario(
+            data["payoff_matrix"], data["q_type"], data,
+            data.get("row_labels"), data.get("col_labels"),
+            data.get("player_row") or "Player A", data.get("player_col") or "Player B",
+        )
+
+    if q.type == "normal_form_game":
+        if evaluation is not None:
+            meta = evaluation.meta or {}
+            return explain_normal_form(data, meta.get("matched_equilibria") or [], meta.get("extra_equilibria") or [])
+        return explain_normal_form(data, data.get("equilibria") or [], []) or "Nu există echilibru Nash pur."
+
+    if q.type.startswith("minmax_"):
+        tree = data.get("tree") or data.get("tree_text")
+        if tree:
+            return minmax_service.solve_alpha_beta(tree)[2]
+
+    raise ValueError(f"No explanation available for question type {q.type}")
+
+def explain_question(q: Question, evaluation: Optional[Evaluation] = None) -> str:
+    """
+    Explanation text for a stored question, or for one graded submission of it,
+    rendered from the stored structured result on first request and memoized.
+    Generated questions are only explained for an evaluation of them (the text
+    contains the solution): ExplanationLocked otherwise.
+    Raises ValueError for question types without an explanation.
+    """
+    if evaluation is None and not _is_open(q):
+        raise ExplanationLocked("Explanation is available after submitting an answer (evaluation_id is required)")
+    key = (q.id, evaluation.id if evaluation is not None else None)
+    cached = _explanations.get(key)
+    if cached is not None:
+        _explanations.move_to_end(key)
+        return cached
+    text = _render(q, evaluation)
+    _explanations[key] = text
+    while len(_explanations) > _CACHE_SIZE:
+        _explanations.popitem(last=False)
+    return text
@@ -1,85 +1,139 @@
-from typing import List, Dict, Any
-from app.services.gametheory.generator_gametheory import _find_dominant_strategy, _generate_dominant_explanation_ro, _is_pareto_optimal
+from typing import List, Dict, Any, Optional
+from app.services.gametheory.generator_gametheory import _generate_dominant_explanation_ro
+from app.services.gametheory.dominance_gametheory import dominance_relations
+from app.services.gametheory.pareto_gametheory import pareto_frontier
+from app.services.gametheory.lp_gametheory import solve_correlated_equilibrium, solve_zero_sum
+from app.services.analysis_cache import cached_analysis
+
+def _labels(matrix: List[List[List[int]]], row_labels: Optional[List[str]], col_labels: Optional[List[str]]):
+    m = len(matrix)
+    n = len(matrix[0])
+    return row_labels or [f"R{i+1}" for i in range(m)], col_labels or [f"C{i+1}" for i in range(n)]
 
 def solve_gametheory_scenario(
-    matrix: List[List[List[int]]], 
-    q_type: str, 
-    row_labels: List[str] = None, 
+    matrix: List[List[List[int]]],
+    q_type: str,
+    row_labels: List[str] = None,
     col_labels: List[str] = None,
     player_row: str = "Player A",
-    player_col: str = "Player B"
+    player_col: str = "Player B",
+    explain: bool = True
 ) -> Dict[str, Any]:
     """
     Solve a custom scenario provided by user.
-    q_type: 'dominant_strategy', 'best_strategy', 'pareto_optimality'
+    q_type: 'dominant_strategy', 'best_strategy', 'pareto_optimality', 'zero_sum', 'correlated_equilibrium'
+    Returns the solution and the structured details; the explanation text is only
+    rendered with explain=True (explain_gametheory_scenario renders it later from
+    the same result).
     """
-    m = len(matrix)
-    n = len(matrix[0])
-    
-    if not row_labels: row_labels = [f"R{i+1}" for i in range(m)]
-    if not col_labels: col_labels = [f"C{i+1}" for i in range(n)]
-    
-    solution = ""
-    explanation = ""
-    
+    row_labels, col_labels = _labels(matrix, row_labels, col_labels)
+
     if q_type == "dominant_strategy" or q_type == "best_strategy":
-        dom_info = _find_dominant_strategy(matrix)
-        dom_idx = dom_info.get("row_dominant", -1) # 1-based
-        dom_strat = row_labels[dom_idx - 1] if dom_idx != -1 else None
-        
+        details = cached_analysis("dominance", matrix, dominance_relations)
+        row_dominant = details["row"]["dominant"]
+        dom_strat = row_labels[row_dominant[0] - 1] if row_dominant else None
         if q_type == "dominant_strategy":
             # "Does Player A have a dominant strategy?"
-            if dom_strat:
-                solution = "Yes"
-                explanation = _generate_dominant_explanation_ro(matrix, row_labels, col_labels, player_name=player_row, opponent_name=player_col)
-                if "Yes." not in explanation: explanation = f"Yes. {explanation}"
-            else:
-                solution = "No"
-                explanation = _generate_dominant_explanation_ro(matrix, row_labels, col_labels, player_name=player_row, opponent_name=player_col)
-                
+            solution = "Yes" if dom_strat else "No"
         else:
-            # "Best strategy"
-            if dom_strat:
-                solution = dom_strat
-                
-                # Intermediate explanation: More than one line, but less than the full proof
-                lines = []
-                lines.append(f"Strategia cea mai bună pentru **{player_row}** este **{dom_strat}**.")
-                lines.append(f"\nAceastă strategie oferă rezultate superioare indiferent de ce joacă **{player_col}**:")
-                
-                # Iterate columns to show dominance briefly
-                for c in range(n):
-                    c_label = col_labels[c]
-                    # dom_idx is 1-based
-                    dom_val = matrix[dom_idx-1][c][0]
-                    
-                    other_vals = []
-                    for r in range(m):
-                        if r != (dom_idx - 1):
-                            other_vals.append(f"{row_labels[r]} ({matrix[r][c][0]})")
-                            
-                    others_str = ", ".join(other_vals)
-                    lines.append(f"- Împotriva **{c_label}**: **{dom_strat}** ({dom_val}) este mai bun (sau egal) decât {others_str}.")
-                    
-                lines.append(f"\nFiind cea mai avantajoasă în toate scenariile, **{dom_strat}** este strategia dominantă.")
-                explanation = "\n".join(lines)
-            else:
-                solution = "None"
-                explanation = f"Nu există o singură strategie 'cea mai bună' care să fie dominantă. Cea mai bună alegere pentru **{player_row}** depinde de ce alege **{player_col}**."
+            solution = dom_strat or "None"
 
     elif q_type == "pareto_optimality":
         # Return the list of Pareto Optimal outcomes for the whole matrix.
-        pareto_cells = []
-        for r in range(m):
-            for c in range(n):
-                is_p, _ = _is_pareto_optimal(matrix, r, c)
-                if is_p:
-                     pareto_cells.append(f"({row_labels[r]}, {col_labels[c]})")
-        
-        solution = ", ".join(pareto_cells)
-        explanation = f"Rezultatele Pareto optimale sunt: {solution}. Orice alt rezultat este dominat de unul dintre acestea."
-
-    return {
+        details = cached_analysis("pareto", matrix, pareto_frontier)
+        solution = ", ".join(f"({row_labels[r - 1]}, {col_labels[c - 1]})" for r, c in details["frontier"])
+
+    elif q_type == "zero_sum":
+        details = solve_zero_sum(matrix)
+        solution = f"v = {details['value']}"
+
+    elif q_type == "correlated_equilibrium":
+        details = solve_correlated_equilibrium(matrix)
+        dist = details["distribution"]
+        solution = ", ".join(
+            f"({row_labels[r]}, {col_labels[c]}): {dist[r][c]}"
+            for r in range(len(dist)) for c in range(len(dist[0])) if dist[r][c] > 0
+        )
+
+    else:
+        raise ValueError(f"Unknown q_type: {q_type}")
+
+    result = {
         "solution": solution,
-        "explanation": explanation
+        "details": details
     }
+    if explain:
+        result["explanation"] = explain_gametheory_scenario(
+            matrix, q_type, result, row_labels, col_labels, player_row, player_col
+        )
+    return result
+
+def explain_gametheory_scenario(
+    matrix: List[List[List[int]]],
+    q_type: str,
+    result: Dict[str, Any],
+    row_labels: List[str] = None,
+    col_labels: List[str] = None,
+    player_row: str = "Player A",
+    player_col: str = "Player B"
+) -> str:
+    """Render the explanation of a solve_gametheory_scenario result (solution + details)."""
+    row_labels, col_labels = _labels(matrix, row_labels, col_labels)
+    m = len(matrix)
+    n = len(matrix[0])
+    solution = result["solution"]
+    details = result.get("details") or {}
+
+    if q_type == "dominant_strategy":
+        explanation = _generate_dominant_explanation_ro(matrix, row_labels, col_labels, player_name=player_row, opponent_name=player_col)
+        if solution == "Yes" and "Yes." not in explanation:
+            explanation = f"Yes. {explanation}"
+        return explanation
+
+    if q_type == "best_strategy":
+        if solution == "None":
+            return f"Nu există o singură strategie 'cea mai bună' care să fie dominantă. Cea mai bună alegere pentru **{player_row}** depinde de ce alege **{player_col}**."
+        dom_strat = solution
+        dom_idx = details["row"]["dominant"][0]  # 1-based
+
+        # Intermediate explanation: More than one line, but less than the full proof
+        lines = []
+        lines.append(f"Strategia cea mai bună pentru **{player_row}** este **{dom_strat}**.")
+        lines.append(f"\nAceastă strategie oferă rezultate superioare indiferent de ce joacă **{player_col}**:")
+
+        # Iterate columns to show dominance briefly
+        for c in range(n):
+            c_label = col_labels[c]
+            dom_val = matrix[dom_idx-1][c][0]
+
+            other_vals = []
+            for r in range(m):
+                if r != (dom_idx - 1):
+                    other_vals.append(f"{row_labels[r]} ({matrix[r][c][0]})")
+
+            others_str = ", ".join(other_vals)
+            lines.append(f"- Împotriva **{c_label}**: **{dom_strat}** ({dom_val}) este mai bun (sau egal) decât {others_str}.")
+
+        lines.append(f"\nFiind cea mai avantajoasă în toate scenariile, **{dom_strat}** este strategia dominantă.")
+        return "\n".join(lines)
+
+    if q_type == "pareto_optimality":
+        return f"Rezultatele Pareto optimale sunt: {solution}. Orice alt rezultat este dominat de unul dintre acestea."
+
+    if q_type == "zero_sum":
+        row_mix = ", ".join(f"{row_labels[i]}: {p}" for i, p in enumerate(details["row_strategy"]) if p > 0)
+        col_mix = ", ".join(f"{col_labels[j]}: {q}" for j, q in enumerate(details["col_strategy"]) if q > 0)
+        return (
+            f"Valoarea jocului este **{details['value']}**.\n"
+            f"Strategia optimă pentru **{player_row}**: {row_mix} (garantează cel puțin {details['value']}).\n"
+            f"Strategia optimă pentru **{player_col}**: {col_mix} (limitează câștigul adversarului la {details['value']})."
+        )
+
+    if q_type == "correlated_equilibrium":
+        return (
+            f"Echilibrul corelat care maximizează bunăstarea totală recomandă: {solution}.\n"
+            f"Niciun jucător nu câștigă ignorând recomandarea primită. "
+            f"Payoff așteptat: {player_row} {details['expected_payoffs'][0]}, {player_col} {details['expected_payoffs'][1]}."
+        )
+
+    raise ValueError(f"Unknown q_type: {q_type}")
@@ -0,0 +1,129 @@
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# boolean cells materialised per block of the pairwise comparison
+_BLOCK_CELLS = 1 << 22
+
+def _pairwise(U: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    For payoffs U[s, t] of one player (own strategy s, opponent strategy t) compare
+    every pair of strategies at once: ge[a, b] / gt[a, b] say whether a is >= / >
+    than b against every t, gt_any[a, b] whether a is > than b against some t.
+    Rows of the relation are built in blocks so large matrices stay within memory.
+    """
+    k, t = U.shape
+    ge = np.empty((k, k), dtype=bool)
+    gt = np.empty((k, k), dtype=bool)
+    gt_any = np.empty((k, k), dtype=bool)
+    step = max(1, _BLOCK_CELLS // max(1, k * t))
+    for a0 in range(0, k, step):
+        block = U[a0:a0 + step, None, :]
+        ge[a0:a0 + step] = (block >= U[None, :, :]).all(axis=2)
+        greater = block > U[None, :, :]
+        gt[a0:a0 + step] = greater.all(axis=2)
+        gt_any[a0:a0 + step] = greater.any(axis=2)
+    return ge, gt, gt_any
+
+def _dominated_by(U: np.ndarray, weak: bool) -> np.ndarray:
+    """For every own strategy s, the index of a strategy dominating it, or -1."""
+    ge, gt, gt_any = _pairwise(U)
+    dominates = ge & gt_any if weak else gt
+    has_dominator = dominates.any(axis=0)
+    return np.where(has_dominator, dominates.argmax(axis=0), -1)
+
+def _player_dominance(U: np.ndarray) -> Dict[str, Any]:
+    ge, gt, gt_any = _pairwise(U)
+    k = U.shape[0]
+    eye = np.eye(k, dtype=bool)
+    # a strategy at least as good as every other one against everything (old "weak" sense)
+    dominant = ge.all(axis=1)
+    strictly_dominant = (gt | eye).all(axis=1)
+    weakly_dominates = ge & gt_any
+
+    def dominated(relation: np.ndarray) -> List[Dict[str, Any]]:
+        return [
+            {"strategy": int(s) + 1, "dominated_by": [int(b) + 1 for b in np.flatnonzero(relation[:, s])]}
+            for s in np.flatnonzero(relation.any(axis=0))
+        ]
+
+    return {
+        "dominant": [int(s) + 1 for s in np.flatnonzero(dominant)],
+        "strictly_dominant": [int(s) + 1 for s in np.flatnonzero(strictly_dominant)],
+        "strictly_dominated": dominated(gt),
+        "weakly_dominated": dominated(weakly_dominates),
+    }
+
+def dominance_relations(payoff) -> Dict[str, Any]:
+    """
+    Full dominance relation of both players for payoff[i][j] = [u_row, u_col]:
+    every dominant strategy (>= all others against every opponent strategy; listed
+    again under strictly_dominant when > everywhere) and every strictly / weakly
+    dominated strategy with all of its dominators. Strategies are 1-based.
+    """
+    arr = np.asarray(payoff)
+    if arr.ndim != 3 or arr.shape[2] != 2 or arr.shape[0] == 0 or arr.shape[1] == 0:
+        raise ValueError("payoff must be m x n cells of [row_payoff, col_payoff]")
+    return {
+        "row": _player_dominance(arr[..., 0]),
+        "col": _player_dominance(arr[..., 1].T),
+    }
+
+def _eliminate(arr: np.ndarray, weak: bool) -> Tuple[np.ndarray, np.ndarray, List[Dict[str, Any]], int]:
+    """Core of eliminate_dominated on a validated (m, n, 2) array: 0-based survivors, order, rounds."""
+    rows = np.arange(arr.shape[0])
+    cols = np.arange(arr.shape[1])
+    order: List[Dict[str, Any]] = []
+    rounds = 0
+    changed = True
+    while changed:
+        changed = False
+        rounds += 1
+        if rows.size > 1:
+            dom = _dominated_by(arr[np.ix_(rows, cols)][..., 0], weak)
+            if (dom >= 0).any():
+                order.extend(
+                    {"player": "row", "strategy": int(rows[s]) + 1,
+                     "dominated_by": int(rows[d]) + 1, "round": rounds}
+                    for s, d in enumerate(dom) if d >= 0
+                )
+                rows = rows[dom < 0]
+                changed = True
+        if cols.size > 1:
+            dom = _dominated_by(arr[np.ix_(rows, cols)][..., 1].T, weak)
+            if (dom >= 0).any():
+                order.extend(
+                    {"player": "col", "strategy": int(cols[s]) + 1,
+                     "dominated_by": int(cols[d]) + 1, "round": rounds}
+                    for s, d in enumerate(dom) if d >= 0
+                )
+                cols = cols[dom < 0]
+                changed = True
+    return rows, cols, order, rounds - 1
+
+def eliminate_dominated(payoff, weak: bool = False) -> Dict[str, Any]:
+    """
+    Iterated elimination of dominated pure strategies for payoff[i][j] = [u_row, u_col].
+    Each round removes every row dominated given the surviving columns, then every
+    column dominated given the surviving rows, until nothing changes.
+
+    Strict elimination keeps every Nash equilibrium (pure and mixed) and its result
+    does not depend on the order. Weak elimination can remove equilibria and is
+    order-dependent; it is offered for exercises that ask for it.
+
+    Returns the surviving strategies (1-based), the reduced payoff matrix and the
+    elimination order with the dominating strategy for each step.
+    """
+    arr = np.asarray(payoff)
+    if arr.ndim != 3 or arr.shape[2] != 2 or arr.shape[0] == 0 or arr.shape[1] == 0:
+        raise ValueError("payoff must be m x n cells of [row_payoff, col_payoff]")
+
+    rows, cols, order, rounds = _eliminate(arr, weak)
+    return {
+        "kind": "weak" if weak else "strict",
+        "rows": [int(r) + 1 for r in rows],
+        "cols": [int(c) + 1 for c in cols],
+        "reduced_payoff": arr[np.ix_(rows, cols)].tolist(),
+        "order": order,
+        "rounds": rounds,
+    }
@@ -2,6 +2,8 @@ import random
 import uuid
 from typing import List, Tuple, Dict, Any, Optional
 
+from app.services.gametheory.dominance_gametheory import dominance_relations
+
 def _random_payoffs(m: int, n: int, low: int = -9, high: int = 9):
     """Return an m x n matrix of [row_payoff, col_payoff] pairs."""
     mat = []
@@ -65,78 +67,20 @@ def _generate_prisoners_dilemma() -> Tuple[List[List[List[int]]], Dict[str, Any]
 def _find_dominant_strategy(payoff: List[List[List[int]]]) -> Dict[str, Any]:
     """
     Check for dominant strategies for Row and Col players.
-    Returns info dict.
+    Returns info dict: the first dominant strategy of each player (1-based, -1 if
+    none) and whether it is strict or weak; the full relation comes from
+    dominance_relations.
     """
-    m = len(payoff)
-    n = len(payoff[0]) if m > 0 else 0
-    
-    # Row player dominant strategy
-    # Strategy r is dominant if for all c, u_row(r, c) >= u_row(k, c) for all k != r
-    # Strictly dominant if >
-    
-    row_dom_idx = -1
-    row_dom_type = None # "strict" or "weak"
-    
-    for r in range(m):
-        is_weak = True
-        is_strict = True
-        
-        for k in range(m):
-            if r == k: continue
-            
-            # Check if r dominates k
-            # For all c
-            for c in range(n):
-                u_r = payoff[r][c][0]
-                u_k = payoff[k][c][0]
-                if u_r < u_k:
-                    is_weak = False
-                    is_strict = False
-                    break
-                if u_r == u_k:
-                    is_strict = False
-            
-            if not is_weak: break
-            
-        if is_weak:
-            row_dom_idx = r + 1
-            row_dom_type = "strict" if is_strict else "weak"
-            break # Can assume only one dominant strategy usually, or just pick first found
-            
-    # Col player dominant strategy
-    col_dom_idx = -1
-    col_dom_type = None
-    
-    for c in range(n):
-        is_weak = True
-        is_strict = True
-        
-        for k in range(n):
-            if c == k: continue
-            
-            for r in range(m):
-                u_c = payoff[r][c][1]
-                u_k = payoff[r][k][1]
-                if u_c < u_k:
-                    is_weak = False
-                    is_strict = False
-                    break
-                if u_c == u_k:
-                    is_strict = False
-            
-            if not is_weak: break
-        
-        if is_weak:
-            col_dom_idx = c + 1
-            col_dom_type = "strict" if is_strict else "weak"
-            break
-
-    return {
-        "row_dominant": row_dom_idx,
-        "row_dominant_type": row_dom_type,
-        "col_dominant": col_dom_idx,
-        "col_dominant_type": col_dom_type
-    }
+    relations = dominance_relations(payoff)
+    info: Dict[str, Any] = {}
+    for player in ("row", "col"):
+        rel = relations[player]
+        first = rel["dominant"][0] if rel["dominant"] else -1
+        info[f"{player}_dominant"] = first
+        info[f"{player}_dominant_type"] = (
+            None if first == -1 else "strict" if first in rel["strictly_dominant"] else "weak"
+        )
+    return info
 
 def _generate_dominant_explanation_ro(mat: List[List[List[int]]], row_labels: List[str], col_labels: List[str], 
                                       player_name: str = "Jucătorul A", opponent_name: str = "adversarul") -> str:
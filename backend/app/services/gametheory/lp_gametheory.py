@@ -0,0 +1,208 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_TOL = 1e-9
+# The tableau is recomputed from the original data every this many pivots
+_REFACTOR_EVERY = 50
+# Last optimal basis per problem shape, reused as a warm start for the next solve
+_WARM_CACHE_SIZE = 64
+_warm_bases: "OrderedDict[Tuple, List[int]]" = OrderedDict()
+_warm_lock = threading.Lock()
+
+class LPResult:
+    __slots__ = ("x", "duals", "objective", "basis", "iterations", "warm_started")
+
+    def __init__(self, x, duals, objective, basis, iterations, warm_started):
+        self.x = x
+        self.duals = duals
+        self.objective = objective
+        self.basis = basis
+        self.iterations = iterations
+        self.warm_started = warm_started
+
+def _tableau_for_basis(full: np.ndarray, basis: List[int]) -> Optional[np.ndarray]:
+    """Tableau B^-1 [A | I | b] for a given basis, or None if it is singular or infeasible."""
+    try:
+        binv = np.linalg.inv(full[:, basis])
+    except np.linalg.LinAlgError:
+        return None
+    tableau = binv @ full
+    if (tableau[:, -1] < -_TOL).any():
+        return None
+    tableau[:, -1] = np.clip(tableau[:, -1], 0.0, None)
+    return tableau
+
+def simplex_max(c: np.ndarray, A: np.ndarray, b: np.ndarray,
+                warm_basis: Optional[List[int]] = None, initial_basis: Optional[List[int]] = None,
+                max_iterations: int = 10000) -> LPResult:
+    """
+    Dense primal simplex for: maximize c.x subject to A x <= b, x >= 0.
+    Bases are lists of column indices into [A | I]. The search starts from
+    `warm_basis` if it is still primal feasible, else from `initial_basis`, else
+    from the slack basis (which needs b >= 0). Dantzig pricing, switching to
+    Bland's rule after a degenerate pivot so the method cannot cycle.
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, n = A.shape
+    full = np.hstack([A, np.eye(m), b[:, None]])
+    cost = np.concatenate([c, np.zeros(m)])
+
+    tableau = None
+    warm_started = False
+    for candidate in (warm_basis, initial_basis):
+        if candidate is not None and len(candidate) == m:
+            tableau = _tableau_for_basis(full, list(candidate))
+            if tableau is not None:
+                basis = list(candidate)
+                warm_started = candidate is warm_basis
+                break
+    if tableau is None:
+        if (b < 0).any():
+            raise ValueError("no feasible starting basis")
+        tableau = full.copy()
+        basis = list(range(n, n + m))
+
+    iterations = 0
+    bland = False
+    while iterations < max_iterations:
+        reduced = cost - cost[basis] @ tableau[:, :-1]
+        improving = np.nonzero(reduced > _TOL)[0]
+        if improving.size == 0:
+            break
+        entering = int(improving[0]) if bland else int(improving[np.argmax(reduced[improving])])
+
+        col = tableau[:, entering]
+        rows = np.nonzero(col > _TOL)[0]
+        if rows.size == 0:
+            raise ValueError("LP is unbounded")
+        ratios = tableau[rows, -1] / col[rows]
+        best = ratios.min()
+        ties = rows[ratios <= best + _TOL]
+        # Bland: among tied rows the basic variable with the smallest index leaves
+        row = int(min(ties, key=lambda r: basis[r]))
+
+        tableau[row] /= tableau[row, entering]
+        factors = tableau[:, entering].copy()
+        factors[row] = 0.0
+        tableau -= np.outer(factors, tableau[row])
+        basis[row] = entering
+        bland = best <= _TOL
+        iterations += 1
+        if iterations % _REFACTOR_EVERY == 0:
+            # bound round-off drift on long runs
+            tableau = np.linalg.solve(full[:, basis], full)
+    else:
+        raise ValueError("simplex iteration limit reached")
+
+    x = np.zeros(n + m)
+    x[basis] = tableau[:, -1]
+    # duals y = c_B B^-1, read from the slack columns
+    duals = cost[basis] @ tableau[:, n:n + m]
+    return LPResult(x[:n], duals, float(cost @ x), basis, iterations, warm_started)
+
+def _solve_cached(kind: str, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+                  initial_basis: Optional[List[int]] = None) -> LPResult:
+    key = (kind, A.shape)
+    # solves run in worker threads; the lock only covers the cache, not the simplex
+    with _warm_lock:
+        warm = _warm_bases.get(key)
+    result = simplex_max(c, A, b, warm_basis=warm, initial_basis=initial_basis)
+    with _warm_lock:
+        _warm_bases[key] = list(result.basis)
+        _warm_bases.move_to_end(key)
+        while len(_warm_bases) > _WARM_CACHE_SIZE:
+            _warm_bases.popitem(last=False)
+    return result
+
+def _payoff_arrays(matrix) -> Tuple[np.ndarray, np.ndarray]:
+    arr = np.asarray(matrix, dtype=float)
+    if arr.ndim != 3 or arr.shape[2] != 2 or arr.shape[0] == 0 or arr.shape[1] == 0:
+        raise ValueError("matrix must be m x n cells of [row_payoff, col_payoff]")
+    return arr[..., 0], arr[..., 1]
+
+def solve_zero_sum(matrix) -> Dict[str, Any]:
+    """
+    Value and optimal mixed strategies of a zero-sum (or constant-sum) game, from the
+    row player's payoffs. With M shifted to be positive, the column player solves
+    max sum(y) s.t. M y <= 1; then v = 1 / sum(y), q = v*y, and the row player's
+    strategy is v times the LP duals.
+    """
+    A, B = _payoff_arrays(matrix)
+    sums = A + B
+    if np.ptp(sums) > _TOL:
+        raise ValueError("game is not zero-sum (u_row + u_col is not constant)")
+
+    shift = 1.0 - A.min()
+    M = A + shift
+    m, n = M.shape
+    res = _solve_cached("zero_sum", np.ones(n), M, np.ones(m))
+    value = 1.0 / res.objective
+    return {
+        "value": round(float(value - shift), 6),
+        "row_strategy": [round(float(p), 6) for p in np.clip(res.duals * value, 0.0, None)],
+        "col_strategy": [round(float(q), 6) for q in res.x * value],
+        "iterations": res.iterations,
+        "warm_started": res.warm_started,
+    }
+
+def solve_correlated_equilibrium(matrix) -> Dict[str, Any]:
+    """
+    Welfare-maximizing correlated equilibrium: a distribution p over cells such that
+    no player gains by deviating from a recommended strategy,
+
+        max w.p  s.t.  G p <= 0 (incentive constraints), sum(p) <= 1, p >= 0.
+
+    The feasible set is a cone cut by the simplex, so its vertex at p = 0 is
+    massively degenerate and the primal simplex stalls there. Instead the dual
+    (variables lambda >= 0 per incentive constraint and mu for the mass)
+
+        max -mu  s.t.  -G^T lambda - mu <= -w
+
+    is solved from the vertex lambda = 0, mu = max(w), and p is read from its duals.
+    Welfare is shifted to be positive, so the optimal p has total mass 1.
+    """
+    A, B = _payoff_arrays(matrix)
+    m, n = A.shape
+    rows = []
+    # row player told i must not prefer i2: sum_j p[i,j] (A[i2,j] - A[i,j]) <= 0
+    for i in range(m):
+        for i2 in range(m):
+            if i2 != i:
+                coeffs = np.zeros((m, n))
+                coeffs[i] = A[i2] - A[i]
+                rows.append(coeffs.ravel())
+    # column player told j must not prefer j2: sum_i p[i,j] (B[i,j2] - B[i,j]) <= 0
+    for j in range(n):
+        for j2 in range(n):
+            if j2 != j:
+                coeffs = np.zeros((m, n))
+                coeffs[:, j] = B[:, j2] - B[:, j]
+                rows.append(coeffs.ravel())
+    G = np.vstack(rows) if rows else np.zeros((0, m * n))
+    k = G.shape[0]
+
+    welfare = (A + B).ravel()
+    weights = welfare - welfare.min() + 1.0
+    # dual variables: lambda (k of them), then mu
+    dual_A = -np.hstack([G.T, np.ones((m * n, 1))])
+    dual_c = np.zeros(k + 1)
+    dual_c[k] = -1.0
+    # start: mu basic, every cell's slack basic except the best-welfare cell
+    top = int(np.argmax(weights))
+    start = [k] + [k + 1 + cell for cell in range(m * n) if cell != top]
+    res = _solve_cached("correlated", dual_c, dual_A, -weights, initial_basis=start)
+
+    p = np.clip(res.duals, 0.0, None)
+    dist = (p / p.sum()).reshape(m, n)
+    return {
+        "distribution": [[round(float(v), 6) for v in row] for row in dist],
+        "expected_payoffs": [round(float((dist * A).sum()), 6), round(float((dist * B).sum()), 6)],
+        "welfare": round(float((dist * (A + B)).sum()), 6),
+        "iterations": res.iterations,
+        "warm_started": res.warm_started,
+    }
@@ -0,0 +1,221 @@
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+from typing import Any, Dict, Iterator
+
+import numpy as np
+from fastapi import UploadFile
+
+from app.config import settings
+from app.services.gametheory.pareto_gametheory import skyline
+from app.services.nash.approx_nash import approximate_equilibrium
+
+_CHUNK_SIZE = 1024 * 1024
+# matrix cells read from the memory map per block
+_BLOCK_CELLS = 1 << 20
+_ID_RE = re.compile(r"^[0-9a-f]{64}$")
+
+class MatrixLimitError(ValueError):
+    """The upload exceeds MATRIX_MAX_BYTES."""
+
+def _matrix_dir() -> str:
+    path = os.path.join(settings.UPLOAD_DIR, "matrices")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def _matrix_path(matrix_id: str) -> str:
+    if not _ID_RE.match(matrix_id or ""):
+        raise KeyError(matrix_id)
+    return os.path.join(_matrix_dir(), f"{matrix_id}.npy")
+
+def _check_payoff(arr: np.ndarray) -> None:
+    if arr.ndim != 3 or arr.shape[2] != 2 or arr.shape[0] == 0 or arr.shape[1] == 0 \
+            or arr.dtype.kind not in "iuf":
+        raise ValueError(f"payoff file must hold m x n cells of [row_payoff, col_payoff], got shape {arr.shape} ({arr.dtype})")
+
+def _csv_to_npy(src: str, dst: str) -> None:
+    """
+    CSV with one matrix row per line and 2n numbers per line (u_row, u_col of
+    column 1, then column 2, ...), written straight into a .npy memory map.
+    """
+    rows, width = 0, None
+    with open(src, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            count = line.count(",") + 1
+            if width is None:
+                width = count
+            elif count != width:
+                raise ValueError(f"CSV line {rows + 1} has {count} values, expected {width}")
+            rows += 1
+    if not rows or width % 2:
+        raise ValueError("CSV must have a non-empty, even number of values per line (u_row, u_col per cell)")
+
+    out = np.lib.format.open_memmap(dst, mode="w+", dtype=np.float64, shape=(rows, width // 2, 2))
+    try:
+        with open(src, "r") as f:
+            i = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                out[i] = np.array(line.split(","), dtype=np.float64).reshape(-1, 2)
+                i += 1
+        out.flush()
+    finally:
+        del out
+
+def _finalize(tmp: str, suffix: str, final: str) -> None:
+    """Validate the uploaded file and move it (converted to .npy if needed) into the store."""
+    if suffix == ".npy":
+        _check_payoff(np.load(tmp, mmap_mode="r"))
+        os.replace(tmp, final)
+        return
+    part = final + ".part"
+    try:
+        _csv_to_npy(tmp, part)
+        os.replace(part, final)
+    finally:
+        if os.path.exists(part):
+            os.unlink(part)
+
+async def store_matrix_upload(upload: UploadFile) -> Dict[str, Any]:
+    """
+    Stream an uploaded .npy or .csv payoff file to UPLOAD_DIR while hashing it.
+    The SHA-256 of the upload is the matrix id, so re-uploads are free.
+    Raises MatrixLimitError above MATRIX_MAX_BYTES and ValueError for bad files.
+    """
+    suffix = os.path.splitext(upload.filename or "")[1].lower()
+    if suffix not in (".npy", ".csv"):
+        raise ValueError("payoff file must be .npy or .csv")
+
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp = tempfile.mkstemp(suffix=suffix, dir=_matrix_dir())
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await upload.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > settings.MATRIX_MAX_BYTES:
+                    raise MatrixLimitError(f"payoff file is larger than {settings.MATRIX_MAX_BYTES} bytes")
+                digest.update(chunk)
+                out.write(chunk)
+
+        matrix_id = digest.hexdigest()
+        final = _matrix_path(matrix_id)
+        if not os.path.exists(final):
+            # parsing a large CSV must not block the event loop
+            await asyncio.get_running_loop().run_in_executor(None, _finalize, tmp, suffix, final)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+    arr = open_matrix(matrix_id)
+    return {"matrix_id": matrix_id, "rows": arr.shape[0], "cols": arr.shape[1], "dtype": str(arr.dtype)}
+
+def open_matrix(matrix_id: str) -> np.ndarray:
+    """Read-only memory map of a stored matrix; KeyError if it does not exist."""
+    path = _matrix_path(matrix_id)
+    if not os.path.exists(path):
+        raise KeyError(matrix_id)
+    return np.load(path, mmap_mode="r")
+
+def _row_blocks(arr: np.ndarray) -> Iterator[slice]:
+    m, n = arr.shape[:2]
+    step = max(1, _BLOCK_CELLS // n)
+    for start in range(0, m, step):
+        yield slice(start, min(start + step, m))
+
+def _column_best(arr: np.ndarray):
+    """Row player's best payoff in every column and how many rows reach it (one pass)."""
+    best = np.full(arr.shape[1], -np.inf)
+    count = np.zeros(arr.shape[1], dtype=np.int64)
+    for rows in _row_blocks(arr):
+        u = np.asarray(arr[rows, :, 0], dtype=float)
+        block_best = u.max(axis=0)
+        block_count = (u == block_best).sum(axis=0)
+        count = np.where(block_best > best, block_count, count + np.where(block_best == best, block_count, 0))
+        best = np.maximum(best, block_best)
+    return best, count
+
+def dominant_strategies(arr: np.ndarray) -> Dict[str, Any]:
+    """
+    Dominant strategies of both players in two streaming passes, O(m * n): a row
+    is dominant iff it reaches the column maximum in every column (strictly if it
+    is the only one everywhere), and symmetrically for columns. Same keys as the
+    dominant part of dominance_relations; the full pairwise dominated-strategy
+    relation (O(m^2 n)) is left to /solve for small games.
+    """
+    col_best, col_count = _column_best(arr)
+    strict_cols = bool((col_count == 1).all())
+    row_dominant, row_strict = [], []
+    col_weak = np.ones(arr.shape[1], dtype=bool)
+    col_strict = np.ones(arr.shape[1], dtype=bool)
+    for rows in _row_blocks(arr):
+        block = np.asarray(arr[rows], dtype=float)
+        weak = (block[..., 0] == col_best).all(axis=1)
+        for r in np.flatnonzero(weak) + rows.start:
+            row_dominant.append(int(r) + 1)
+            if strict_cols:
+                row_strict.append(int(r) + 1)
+        u_col = block[..., 1]
+        at_best = u_col == u_col.max(axis=1, keepdims=True)
+        unique = at_best.sum(axis=1, keepdims=True) == 1
+        col_weak &= at_best.all(axis=0)
+        col_strict &= (at_best & unique).all(axis=0)
+    return {
+        "row": {"dominant": row_dominant, "strictly_dominant": row_strict},
+        "col": {
+            "dominant": [int(c) + 1 for c in np.flatnonzero(col_weak)],
+            "strictly_dominant": [int(c) + 1 for c in np.flatnonzero(col_strict)],
+        },
+    }
+
+def pure_nash_blocked(arr: np.ndarray, limit: int = 1000) -> Dict[str, Any]:
+    """Pure equilibria: column maxima in a first pass, then each block checks its own row maxima."""
+    col_best, _ = _column_best(arr)
+    equilibria, total = [], 0
+    for rows in _row_blocks(arr):
+        block = np.asarray(arr[rows], dtype=float)
+        mask = (block[..., 0] == col_best) & (block[..., 1] == block[..., 1].max(axis=1, keepdims=True))
+        cells = np.argwhere(mask)
+        total += len(cells)
+        for r, c in cells[:max(0, limit - len(equilibria))]:
+            equilibria.append((int(r) + rows.start + 1, int(c) + 1))
+    return {"has_pure_nash": total > 0, "count": total, "equilibria": equilibria, "truncated": total > len(equilibria)}
+
+def pareto_blocked(arr: np.ndarray, limit: int = 1000) -> Dict[str, Any]:
+    """
+    Pareto frontier by blocks: the skyline of every row block, then the skyline of
+    the surviving candidates. A cell on the global frontier survives its block, and
+    a block survivor that is globally dominated is dominated by a frontier cell,
+    which is among the candidates, so the second pass removes it.
+    """
+    n = arr.shape[1]
+    idx, u1, u2 = [], [], []
+    for rows in _row_blocks(arr):
+        block = np.asarray(arr[rows], dtype=float)
+        b1, b2 = block[..., 0].ravel(), block[..., 1].ravel()
+        dominated, _ = skyline(b1, b2)
+        keep = np.flatnonzero(~dominated)
+        idx.append(keep + rows.start * n)
+        u1.append(b1[keep])
+        u2.append(b2[keep])
+    idx, u1, u2 = np.concatenate(idx), np.concatenate(u1), np.concatenate(u2)
+    dominated, _ = skyline(u1, u2)
+    frontier = np.sort(idx[~dominated])
+    return {
+        "count": int(frontier.size),
+        "frontier": [(int(k) // n + 1, int(k) % n + 1) for k in frontier[:limit]],
+        "truncated": int(frontier.size) > limit,
+    }
+
+def approx_nash_stored(arr: np.ndarray, **budget: Any) -> Dict[str, Any]:
+    """approximate_equilibrium on a stored matrix; the two payoff planes are read into contiguous arrays once."""
+    planes = np.stack([np.ascontiguousarray(arr[..., 0], dtype=float), np.ascontiguousarray(arr[..., 1], dtype=float)], axis=-1)
+    return approximate_equilibrium(planes, **budget)
@@ -0,0 +1,63 @@
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+def skyline(u1: np.ndarray, u2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pareto skyline of the points (u1[k], u2[k]). Points are sorted once by u1
+    descending and grouped by equal u1. A point is dominated either by an earlier
+    group (strictly larger u1) whose best u2 is >= its own, or by its own group's
+    best u2 when that is strictly larger. Prefix maxima over the groups give both
+    checks for all points at once: O(k log k).
+
+    Returns (dominated mask, index of a dominating point; meaningless where not dominated).
+    """
+    u1 = np.asarray(u1, dtype=float)
+    u2 = np.asarray(u2, dtype=float)
+    order = np.argsort(-u1)
+    s1, s2 = u1[order], u2[order]
+    new_group = np.r_[True, s1[1:] != s1[:-1]]
+    starts = np.flatnonzero(new_group)
+    group = np.cumsum(new_group) - 1
+
+    # best u2 of each group and the first point reaching it
+    group_best = np.maximum.reduceat(s2, starts)
+    positions = np.arange(s2.size)
+    best_at = order[np.minimum.reduceat(np.where(s2 == group_best[group], positions, s2.size), starts)]
+    running = np.maximum.accumulate(group_best)
+    # group that reached the running maximum last (witness for the later groups)
+    running_at = np.maximum.accumulate(np.where(group_best >= running, np.arange(starts.size), 0))
+    prev_best = np.r_[-np.inf, running[:-1]][group]
+    prev_witness = best_at[np.r_[0, running_at[:-1]]][group]
+
+    beaten_by_earlier = s2 <= prev_best
+    beaten_in_group = s2 < group_best[group]
+    witness = np.where(beaten_by_earlier, prev_witness, best_at[group])
+
+    dominated = np.zeros(u1.size, dtype=bool)
+    dominated[order] = beaten_by_earlier | beaten_in_group
+    witness_of = np.empty(u1.size, dtype=np.int64)
+    witness_of[order] = witness
+    return dominated, witness_of
+
+def pareto_frontier(payoff) -> Dict[str, Any]:
+    """
+    Pareto-optimal outcomes of payoff[i][j] = [u_row, u_col] as a 2-D skyline
+    (see skyline): O(k log k) for k = m * n outcomes instead of O(k^2).
+
+    Returns the frontier (1-based (r, c), row-major) and, for every other cell,
+    one outcome that Pareto-dominates it.
+    """
+    arr = np.asarray(payoff)
+    if arr.ndim != 3 or arr.shape[2] != 2 or arr.shape[0] == 0 or arr.shape[1] == 0:
+        raise ValueError("payoff must be m x n cells of [row_payoff, col_payoff]")
+    n = arr.shape[1]
+    dominated, witness_of = skyline(arr[..., 0].ravel(), arr[..., 1].ravel())
+
+    frontier = [(int(k) // n + 1, int(k) % n + 1) for k in np.flatnonzero(~dominated)]
+    dominated_cells = [
+        {"cell": (int(k) // n + 1, int(k) % n + 1),
+         "dominated_by": (int(witness_of[k]) // n + 1, int(witness_of[k]) % n + 1)}
+        for k in np.flatnonzero(dominated)
+    ]
+    return {"frontier": frontier, "dominated": dominated_cells}
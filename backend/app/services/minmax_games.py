@@ -0,0 +1,335 @@
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+# fields of a generated position that give the answer away (stored, never sent)
+POSITION_SOLUTION_KEYS = ("best_move", "game_value")
+
+# Transposition-table entry flags
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# ---------------------------------------------------------
+# Tic-tac-toe: one 9-bit board per player, cell i = bit i (row-major)
+# ---------------------------------------------------------
+TTT_FULL = 0x1FF
+TTT_WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100,               # diagonals
+)
+
+def _ttt_has_won(bits: int) -> bool:
+    for w in TTT_WIN_MASKS:
+        if bits & w == w:
+            return True
+    return False
+
+def _ttt_moves(x: int, o: int) -> List[int]:
+    empty = TTT_FULL & ~(x | o)
+    return [i for i in range(9) if empty >> i & 1]
+
+class TicTacToe:
+    """Full solver for tic-tac-toe positions (x moves first)."""
+
+    def __init__(self):
+        # key -> (flag, score); the key (x | o << 9) identifies the position exactly
+        self.table: Dict[int, Tuple[int, int]] = {}
+
+    @staticmethod
+    def to_move_is_x(x: int, o: int) -> bool:
+        return bin(x).count("1") == bin(o).count("1")
+
+    @staticmethod
+    def terminal_score(x: int, o: int) -> Optional[int]:
+        """Score from X's point of view, or None if the game is not over. Faster wins score higher."""
+        empties = 9 - bin(x | o).count("1")
+        if _ttt_has_won(x):
+            return 1 + empties
+        if _ttt_has_won(o):
+            return -(1 + empties)
+        if not empties:
+            return 0
+        return None
+
+    def negamax(self, me: int, opp: int, alpha: int, beta: int) -> int:
+        """Score for the side to move (`me`), alpha-beta with a transposition table."""
+        key = me | opp << 9
+        entry = self.table.get(key)
+        if entry is not None:
+            flag, score = entry
+            if flag == EXACT or (flag == LOWER and score >= beta) or (flag == UPPER and score <= alpha):
+                return score
+
+        empties = 9 - bin(me | opp).count("1")
+        if _ttt_has_won(opp):
+            return -(1 + empties)
+        if not empties:
+            return 0
+
+        alpha_orig = alpha
+        best = -100
+        for cell in _ttt_moves(me, opp):
+            score = -self.negamax(opp, me | 1 << cell, -beta, -alpha)
+            if score > best:
+                best = score
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+
+        flag = EXACT if alpha_orig < best < beta else (LOWER if best >= beta else UPPER)
+        self.table[key] = (flag, best)
+        return best
+
+    def solve(self, x: int, o: int) -> Tuple[int, Optional[int]]:
+        """Return (score from X's view, best cell for the side to move)."""
+        x_to_move = self.to_move_is_x(x, o)
+        me, opp = (x, o) if x_to_move else (o, x)
+        best_cell, best = None, -100
+        for cell in _ttt_moves(me, opp):
+            score = -self.negamax(opp, me | 1 << cell, -100, 100)
+            if score > best:
+                best, best_cell = score, cell
+        if best_cell is None:
+            return self.terminal_score(x, o) or 0, None
+        return (best if x_to_move else -best), best_cell
+
+# ---------------------------------------------------------
+# Connect-Four: 7 columns x 6 rows, column-major bitboard with one
+# sentinel bit per column (bit index = col * 7 + row)
+# ---------------------------------------------------------
+C4_WIDTH = 7
+C4_HEIGHT = 6
+C4_H1 = C4_HEIGHT + 1
+C4_BOTTOM = sum(1 << (c * C4_H1) for c in range(C4_WIDTH))
+C4_BOARD = C4_BOTTOM * ((1 << C4_HEIGHT) - 1)
+C4_ORDER = (3, 2, 4, 1, 5, 0, 6)  # center-first move ordering
+C4_WIN_SCORE = 1000
+
+def _c4_top(col: int) -> int:
+    return 1 << (C4_HEIGHT - 1 + col * C4_H1)
+
+def _c4_bottom(col: int) -> int:
+    return 1 << (col * C4_H1)
+
+def _c4_has_won(pos: int) -> bool:
+    for shift in (1, C4_H1, C4_H1 - 1, C4_H1 + 1):  # vertical, horizontal, both diagonals
+        m = pos & (pos >> shift)
+        if m & (m >> (2 * shift)):
+            return True
+    return False
+
+def _c4_cell_weights() -> Dict[int, int]:
+    """Number of 4-in-a-row windows through each cell, the classic positional weight."""
+    weights = {}
+    for c in range(C4_WIDTH):
+        for r in range(C4_HEIGHT):
+            count = 0
+            for dc, dr in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                for k in range(4):
+                    c0, r0 = c - k * dc, r - k * dr
+                    c3, r3 = c0 + 3 * dc, r0 + 3 * dr
+                    if 0 <= c0 < C4_WIDTH and 0 <= c3 < C4_WIDTH and 0 <= r0 < C4_HEIGHT and 0 <= r3 < C4_HEIGHT:
+                        count += 1
+            weights[c * C4_H1 + r] = count
+    return weights
+
+C4_WEIGHTS = _c4_cell_weights()
+
+class ConnectFour:
+    """
+    Position = (current, mask): stones of the side to move and all stones.
+    key = current + mask is a unique position hash (Pascal Pons' encoding).
+    """
+
+    def __init__(self):
+        self.table: Dict[Tuple[int, int], Tuple[int, int]] = {}  # (key, depth) -> (flag, score)
+        self.nodes = 0
+
+    @staticmethod
+    def can_play(mask: int, col: int) -> bool:
+        return not mask & _c4_top(col)
+
+    @staticmethod
+    def play(current: int, mask: int, col: int) -> Tuple[int, int]:
+        """Return the position after playing `col`, seen from the new side to move."""
+        return current ^ mask, mask | (mask + _c4_bottom(col))
+
+    @staticmethod
+    def moves(mask: int) -> List[int]:
+        return [c for c in C4_ORDER if not mask & _c4_top(c)]
+
+    @staticmethod
+    def evaluate(current: int, mask: int) -> int:
+        """Static positional score for the side to move."""
+        opp = current ^ mask
+        score = 0
+        bits = current
+        while bits:
+            low = bits & -bits
+            score += C4_WEIGHTS[low.bit_length() - 1]
+            bits ^= low
+        bits = opp
+        while bits:
+            low = bits & -bits
+            score -= C4_WEIGHTS[low.bit_length() - 1]
+            bits ^= low
+        return score
+
+    def negamax(self, current: int, mask: int, depth: int, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        # the previous mover is `current ^ mask`; if they just connected four we lost
+        if _c4_has_won(current ^ mask):
+            return -(C4_WIN_SCORE + depth)
+        if mask == C4_BOARD:
+            return 0
+        if depth == 0:
+            return self.evaluate(current, mask)
+
+        key = (current + mask, depth)
+        entry = self.table.get(key)
+        if entry is not None:
+            flag, score = entry
+            if flag == EXACT or (flag == LOWER and score >= beta) or (flag == UPPER and score <= alpha):
+                return score
+
+        alpha_orig = alpha
+        best = -10 * C4_WIN_SCORE
+        for col in self.moves(mask):
+            nxt, nmask = self.play(current, mask, col)
+            score = -self.negamax(nxt, nmask, depth - 1, -beta, -alpha)
+            if score > best:
+                best = score
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+
+        flag = EXACT if alpha_orig < best < beta else (LOWER if best >= beta else UPPER)
+        self.table[key] = (flag, best)
+        return best
+
+def _c4_wins_with(current: int, mask: int, col: int) -> bool:
+    nxt, nmask = ConnectFour.play(current, mask, col)
+    return _c4_has_won(nxt ^ nmask)
+
+def _ttt_board(x: int, o: int) -> List[str]:
+    cells = ["X" if x >> i & 1 else "O" if o >> i & 1 else "." for i in range(9)]
+    return ["".join(cells[r * 3:r * 3 + 3]) for r in range(3)]
+
+def _c4_board(current: int, mask: int, current_symbol: str) -> List[str]:
+    other_symbol = "O" if current_symbol == "X" else "X"
+    rows = []
+    for r in range(C4_HEIGHT - 1, -1, -1):
+        line = ""
+        for c in range(C4_WIDTH):
+            bit = 1 << (c * C4_H1 + r)
+            line += current_symbol if current & bit else other_symbol if mask & bit else "."
+        rows.append(line)
+    return rows
+
+def _random_ttt_position(empties: int) -> Tuple[int, int]:
+    """Random reachable position with `empties` free cells and no winner yet."""
+    while True:
+        x = o = 0
+        cells = random.sample(range(9), 9 - empties)
+        for ply, cell in enumerate(cells):
+            if ply % 2 == 0:
+                x |= 1 << cell
+            else:
+                o |= 1 << cell
+        if not _ttt_has_won(x) and not _ttt_has_won(o):
+            return x, o
+
+def _random_c4_position(plies: int) -> Tuple[int, int]:
+    """Random position after `plies` moves where nobody has won and no win is available in one."""
+    while True:
+        current = mask = 0
+        ok = True
+        for _ in range(plies):
+            cols = ConnectFour.moves(mask)
+            current, mask = ConnectFour.play(current, mask, random.choice(cols))
+            if _c4_has_won(current ^ mask):
+                ok = False
+                break
+        if ok and not any(_c4_wins_with(current, mask, c) for c in ConnectFour.moves(mask)):
+            return current, mask
+
+def _ttt_tree(x: int, o: int, node_id: str, is_max: bool, max_is_x: bool, move: Optional[int]) -> Dict[str, Any]:
+    node = {"id": node_id, "value": None, "children": [], "is_max": is_max}
+    if move is not None:
+        node["move"] = f"r{move // 3 + 1}c{move % 3 + 1}"
+    score = TicTacToe.terminal_score(x, o)
+    if score is not None:
+        node["value"] = score if max_is_x else -score
+        return node
+    x_to_move = TicTacToe.to_move_is_x(x, o)
+    for i, cell in enumerate(_ttt_moves(x, o)):
+        nx, no = (x | 1 << cell, o) if x_to_move else (x, o | 1 << cell)
+        node["children"].append(_ttt_tree(nx, no, f"{node_id}-{i}", not is_max, max_is_x, cell))
+    return node
+
+def _c4_tree(engine: ConnectFour, current: int, mask: int, depth: int, width: int, leaf_depth: int,
+             node_id: str, is_max: bool, move: Optional[int]) -> Dict[str, Any]:
+    node = {"id": node_id, "value": None, "children": [], "is_max": is_max}
+    if move is not None:
+        node["move"] = f"col{move + 1}"
+    if depth == 0 or _c4_has_won(current ^ mask) or mask == C4_BOARD:
+        # deep search from the leaf; scores are for the side to move, flip to MAX's view
+        score = engine.negamax(current, mask, leaf_depth, -10 * C4_WIN_SCORE, 10 * C4_WIN_SCORE)
+        node["value"] = score if is_max else -score
+        return node
+    for i, col in enumerate(engine.moves(mask)[:width]):
+        nxt, nmask = engine.play(current, mask, col)
+        node["children"].append(_c4_tree(engine, nxt, nmask, depth - 1, width, leaf_depth,
+                                         f"{node_id}-{i}", not is_max, col))
+    return node
+
+def _tree_minimax(node: Dict[str, Any]) -> Tuple[int, Optional[str]]:
+    """Exact minimax value of a generated tree and the move label of the root's best child."""
+    if not node["children"]:
+        return node["value"], None
+    results = [(_tree_minimax(child)[0], child.get("move")) for child in node["children"]]
+    pick = max if node["is_max"] else min
+    return pick(results, key=lambda r: r[0])
+
+def generate_game_tree(game: str, difficulty: str) -> Dict[str, Any]:
+    """
+    Build a MinMax question tree from a real game position. The tree uses the same
+    dict format as MinMaxService.generate_tree (plus a "move" label per node), and
+    the root player is MAX.
+    - tictactoe: complete game tree from a position with 3/4/5 empty cells, leaves
+      are final outcomes (faster wins score higher).
+    - connect4: the `width` most central moves to depth 2/2/3, each leaf scored by
+      a deeper alpha-beta search with a transposition table.
+    best_move / game_value are the answer for the generated tree (for connect4 its
+    depth-limited minimax, not a full-depth engine value); they are stored
+    server-side only and must not be sent with the question.
+    """
+    if game == "tictactoe":
+        empties = {"easy": 3, "medium": 4, "hard": 5}.get(difficulty, 3)
+        x, o = _random_ttt_position(empties)
+        max_is_x = TicTacToe.to_move_is_x(x, o)
+        score, best = TicTacToe().solve(x, o)
+        return {
+            "tree": _ttt_tree(x, o, "root", True, max_is_x, None),
+            "game": game,
+            "board": _ttt_board(x, o),
+            "to_move": "X" if max_is_x else "O",
+            "best_move": f"r{best // 3 + 1}c{best % 3 + 1}" if best is not None else None,
+            "game_value": score if max_is_x else -score,
+        }
+    if game == "connect4":
+        depth, width, plies = {"easy": (2, 3, 6), "medium": (2, 4, 10), "hard": (3, 3, 14)}.get(difficulty, (2, 3, 6))
+        current, mask = _random_c4_position(plies)
+        to_move = "X" if plies % 2 == 0 else "O"
+        tree = _c4_tree(ConnectFour(), current, mask, depth, width, 4, "root", True, None)
+        score, best = _tree_minimax(tree)
+        return {
+            "tree": tree,
+            "game": game,
+            "board": _c4_board(current, mask, to_move),
+            "to_move": to_move,
+            "best_move": best,
+            "game_value": score,
+        }
+    raise ValueError(f"Unknown game: {game}")
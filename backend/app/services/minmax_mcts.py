@@ -0,0 +1,223 @@
+import math
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.minmax_service import minmax_service
+
+# limits for client-supplied procedural trees
+MAX_PROCEDURAL_DEPTH = 40
+MAX_PROCEDURAL_BRANCHING = 20
+# exact (alpha-beta) search is only offered when branching_max ** depth stays below this;
+# every procedural leaf seeds its own random.Random, so larger trees belong to mcts
+MAX_EXACT_LEAVES = 10 ** 5
+
+def _int_pair(value, name: str) -> Tuple[int, int]:
+    try:
+        lo, hi = value
+        lo, hi = int(lo), int(hi)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a pair of integers [lo, hi]")
+    if lo > hi:
+        raise ValueError(f"{name}: lo must be <= hi")
+    return lo, hi
+
+class ProceduralNode:
+    """
+    Node of a tree that is never stored: the branching factor of every node and
+    every leaf value are derived from (seed, node id), so the same tree can be
+    re-walked anywhere. Quacks like Node, so both MCTS and AlphaBetaSolver accept it.
+    """
+    __slots__ = ("id", "is_max", "_seed", "_depth", "_branching", "_values")
+
+    def __init__(self, seed: int, depth: int, branching=(2, 3), values=(1, 20),
+                 id: str = "root", is_max: bool = True):
+        self.id = id
+        self.is_max = is_max
+        self._seed = seed
+        self._depth = depth
+        self._branching = tuple(branching)
+        self._values = tuple(values)
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> 'ProceduralNode':
+        """
+        Root of a procedural tree from a client spec {"seed", "depth", "branching":
+        [lo, hi], "values": [lo, hi]}; ValueError if it is malformed or too large.
+        """
+        if not isinstance(spec, dict):
+            raise ValueError("procedural spec must be an object")
+        try:
+            seed, depth = int(spec.get("seed", 0)), int(spec.get("depth", 4))
+        except (TypeError, ValueError):
+            raise ValueError("seed and depth must be integers")
+        if not 0 <= depth <= MAX_PROCEDURAL_DEPTH:
+            raise ValueError(f"depth must be between 0 and {MAX_PROCEDURAL_DEPTH}")
+        branching = _int_pair(spec.get("branching", (2, 3)), "branching")
+        if branching[0] < 1 or branching[1] > MAX_PROCEDURAL_BRANCHING:
+            raise ValueError(f"branching must be within [1, {MAX_PROCEDURAL_BRANCHING}]")
+        values = _int_pair(spec.get("values", (1, 20)), "values")
+        return cls(seed=seed, depth=depth, branching=branching, values=values)
+
+    @property
+    def max_leaves(self) -> int:
+        return self._branching[1] ** max(self._depth, 0)
+
+    def _rng(self) -> random.Random:
+        return random.Random(f"{self._seed}/{self.id}")
+
+    @property
+    def value(self) -> Optional[int]:
+        if self._depth > 0:
+            return None
+        return self._rng().randint(*self._values)
+
+    @property
+    def children(self) -> List['ProceduralNode']:
+        if self._depth <= 0:
+            return []
+        count = self._rng().randint(*self._branching)
+        return [
+            ProceduralNode(self._seed, self._depth - 1, self._branching, self._values,
+                           id=f"{self.id}-{i}", is_max=not self.is_max)
+            for i in range(count)
+        ]
+
+class _SearchNode:
+    __slots__ = ("node", "parent", "children", "untried", "visits", "total")
+
+    def __init__(self, node, parent: Optional['_SearchNode']):
+        self.node = node
+        self.parent = parent
+        self.children: List['_SearchNode'] = []
+        self.untried = None  # lazily filled list of source children not expanded yet
+        self.visits = 0
+        self.total = 0.0  # sum of raw leaf values backed up through this node
+
+class MctsSolver:
+    """
+    Anytime UCT search over a game tree. Leaf values are raw tree values seen from
+    MAX; they are rescaled to [0, 1] with the range observed so far when computing
+    UCB scores, so no value bounds need to be known up front.
+    """
+
+    def __init__(self, exploration: float = math.sqrt(2), seed: Optional[int] = None):
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.lo = math.inf
+        self.hi = -math.inf
+
+    def _leaf_value(self, node) -> float:
+        v = node.value if node.value is not None else 0
+        if v < self.lo:
+            self.lo = v
+        if v > self.hi:
+            self.hi = v
+        return v
+
+    def _select_child(self, parent: _SearchNode) -> _SearchNode:
+        span = (self.hi - self.lo) or 1.0
+        log_n = math.log(parent.visits)
+        maximizing = parent.node.is_max
+        best, best_score = None, -math.inf
+        for child in parent.children:
+            mean = (child.total / child.visits - self.lo) / span
+            exploit = mean if maximizing else 1.0 - mean
+            score = exploit + self.exploration * math.sqrt(log_n / child.visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _iterate(self, root: _SearchNode) -> None:
+        # 1. selection
+        current = root
+        while current.untried is not None and not current.untried and current.children:
+            current = self._select_child(current)
+
+        # 2. expansion
+        if current.untried is None:
+            current.untried = list(current.node.children)
+            self.rng.shuffle(current.untried)
+        if current.untried:
+            child = _SearchNode(current.untried.pop(), current)
+            current.children.append(child)
+            current = child
+
+        # 3. simulation: random playout to a leaf
+        node = current.node
+        children = node.children
+        while children:
+            node = children[self.rng.randrange(len(children))]
+            children = node.children
+        value = self._leaf_value(node)
+
+        # 4. backpropagation
+        while current is not None:
+            current.visits += 1
+            current.total += value
+            current = current.parent
+
+    def search(self, root_node, time_budget_ms: int = 200, max_iterations: Optional[int] = None) -> Dict[str, Any]:
+        """Run until the time budget or iteration cap is hit and report the best move."""
+        root = _SearchNode(root_node, None)
+        deadline = time.perf_counter() + time_budget_ms / 1000.0
+        started = time.perf_counter()
+
+        iterations = 0
+        best_move_changes = 0
+        stable_since = 0
+        last_best = None
+        while True:
+            if max_iterations is not None and iterations >= max_iterations:
+                break
+            # the clock and the best-move tracker are only checked every 32 iterations
+            if iterations % 32 == 0:
+                if time.perf_counter() >= deadline:
+                    break
+                if root.children:
+                    leader = max(root.children, key=lambda c: c.visits)
+                    if leader is not last_best:
+                        if last_best is not None:
+                            best_move_changes += 1
+                        last_best = leader
+                        stable_since = iterations
+            self._iterate(root)
+            iterations += 1
+            if root.untried == [] and not root.children:
+                break  # the root is a leaf
+
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if not root.children:
+            return {
+                "mode": "mcts",
+                "root_value": root_node.value or 0,
+                "best_move": None,
+                "iterations": iterations,
+                "elapsed_ms": round(elapsed_ms, 2),
+            }
+
+        best = max(root.children, key=lambda c: c.visits)
+        moves = sorted(root.children, key=lambda c: -c.visits)
+        return {
+            "mode": "mcts",
+            "root_value": round(best.total / best.visits, 3),
+            "best_move": best.node.id,
+            "iterations": iterations,
+            "elapsed_ms": round(elapsed_ms, 2),
+            "convergence": {
+                "best_visit_share": round(best.visits / root.visits, 4),
+                "best_move_changes": best_move_changes,
+                "stable_since_iteration": stable_since,
+                "unexpanded_root_moves": len(root.untried or []),
+            },
+            "moves": [
+                {"id": c.node.id, "visits": c.visits, "mean_value": round(c.total / c.visits, 3)}
+                for c in moves
+            ],
+        }
+
+def solve_mcts(tree, time_budget_ms: int = 200, max_iterations: Optional[int] = None,
+               seed: Optional[int] = None) -> Dict[str, Any]:
+    """MCTS on a dict, compact text, or any node-like tree (e.g. ProceduralNode)."""
+    root = minmax_service.to_node(tree)
+    return MctsSolver(seed=seed).search(root, time_budget_ms=time_budget_ms, max_iterations=max_iterations)
@@ -0,0 +1,204 @@
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.services.minmax_mcts import MAX_EXACT_LEAVES, ProceduralNode
+from app.services.minmax_service import AlphaBetaSolver, CompactNode, Node, minmax_service
+
+# How many node entries a worker processes between reads of the shared root bound
+BOUND_POLL_INTERVAL = 256
+
+# One process pool for the whole server, created on first use with the spawn start
+# method (forking would copy the server's threads, e.g. the question pool). Its
+# workers get one shared array of root bounds; each running solve holds one slot.
+MAX_CONCURRENT_SOLVES = 32
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_bounds = None
+_pool_lock = threading.Lock()
+_free_slots: List[int] = list(range(MAX_CONCURRENT_SOLVES))
+
+# Set in each worker process by _init_worker
+_shared_bounds = None
+_shared_bound_slot: Optional[int] = None
+
+def _init_worker(shared_bounds) -> None:
+    global _shared_bounds
+    _shared_bounds = shared_bounds
+
+def max_workers() -> int:
+    return os.cpu_count() or 1
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool, _pool_bounds
+    with _pool_lock:
+        if _pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            _pool_bounds = ctx.Array("d", MAX_CONCURRENT_SOLVES, lock=True)
+            _pool = ProcessPoolExecutor(max_workers=max_workers(), mp_context=ctx,
+                                        initializer=_init_worker, initargs=(_pool_bounds,))
+        return _pool
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+def _acquire_slot() -> Optional[int]:
+    with _pool_lock:
+        return _free_slots.pop() if _free_slots else None
+
+def _release_slot(slot: int) -> None:
+    with _pool_lock:
+        _free_slots.append(slot)
+
+def _read_bound() -> Optional[float]:
+    if _shared_bounds is None or _shared_bound_slot is None:
+        return None
+    return _shared_bounds[_shared_bound_slot]
+
+class _SharedBoundSolver(AlphaBetaSolver):
+    """
+    Alpha-beta for one root subtree that periodically tightens its window with the
+    best root value found so far by any worker. For a MAX root the shared value is
+    a lower bound (alpha), for a MIN root an upper bound (beta).
+    """
+
+    def __init__(self, root_is_max: bool):
+        super().__init__(record_steps=False)
+        self.root_is_max = root_is_max
+        self.bound_seen = -math.inf if root_is_max else math.inf
+        self._entries = 0
+
+    def _alpha_beta(self, node, alpha: float, beta: float) -> int:
+        self._entries += 1
+        shared = _read_bound() if self._entries % BOUND_POLL_INTERVAL == 0 else None
+        if shared is not None:
+            if self.root_is_max and shared > alpha:
+                alpha = shared
+                self.bound_seen = max(self.bound_seen, shared)
+            elif not self.root_is_max and shared < beta:
+                beta = shared
+                self.bound_seen = min(self.bound_seen, shared)
+        return super()._alpha_beta(node, alpha, beta)
+
+def _search_child(subtree, root_is_max: bool, slot: int, alpha: float, beta: float) -> Tuple[float, float]:
+    """Worker entry point: search one root subtree, sharing bounds through `slot`."""
+    global _shared_bound_slot
+    _shared_bound_slot = slot
+    try:
+        return _search_subtree(subtree, root_is_max, alpha, beta)
+    finally:
+        _shared_bound_slot = None
+
+def _search_subtree(subtree: Union[Node, CompactNode], root_is_max: bool,
+                    alpha: float, beta: float) -> Tuple[float, float]:
+    """
+    Returns (value, bound_seen): the value is exact only if it lies strictly beyond
+    every bound the search was run with.
+    """
+    solver = _SharedBoundSolver(root_is_max)
+    solver.bound_seen = alpha if root_is_max else beta
+    value = solver._alpha_beta(subtree, alpha, beta)
+
+    # publish an improved root bound for the other workers
+    if _shared_bounds is not None and _shared_bound_slot is not None:
+        with _shared_bounds.get_lock():
+            shared = _shared_bounds[_shared_bound_slot]
+            if _is_improvement(value, shared, root_is_max):
+                _shared_bounds[_shared_bound_slot] = value
+    return value, solver.bound_seen
+
+def _is_improvement(value: float, best: float, root_is_max: bool) -> bool:
+    return value > best if root_is_max else value < best
+
+def canonical_leaf_count(tree: Union[Dict, str, Node, CompactNode]) -> int:
+    """Leaf count of the sequential fail-hard solver, the number students are graded on."""
+    root = minmax_service.to_node(tree)
+    solver = AlphaBetaSolver(record_steps=False)
+    solver.solve(root)
+    return solver.visited_leaves_count
+
+def solve_root_split(tree: Union[Dict, str], workers: Optional[int] = None,
+                     with_leaf_count: bool = False) -> Dict[str, Any]:
+    """
+    Young-brothers-wait root splitting: the first root child is searched serially to
+    establish a bound, the remaining children are searched in a process pool with
+    that bound as their window. Workers share the best root value found so far and
+    tighten their windows with it while searching.
+
+    The fast answer (value + best move) does not give the canonical leaf count, since
+    the parallel search visits a different set of leaves. When `with_leaf_count` is
+    set, the count is computed separately with the sequential solver (a full
+    sequential solve, so it is off by default).
+
+    At most min(workers, CPU count) subtrees are in flight at a time, in the
+    shared process pool; when all bound slots are taken the siblings are searched
+    in this thread.
+    """
+    root = minmax_service.to_node(tree)
+    if isinstance(root, ProceduralNode) and root.max_leaves > MAX_EXACT_LEAVES:
+        raise ValueError(f"Procedural tree is too large for exact search (up to {MAX_EXACT_LEAVES} leaves); use mode=mcts")
+    children = root.children
+    workers = max(1, min(workers or max_workers(), max_workers()))
+
+    result: Dict[str, Any] = {"mode": "parallel", "workers": workers}
+    if not children:
+        result.update(root_value=root.value or 0, best_move=None)
+        if with_leaf_count:
+            result["visited_leaves"] = 1
+        return result
+
+    root_is_max = root.is_max
+    first = _SharedBoundSolver(root_is_max)
+    best_value = first._alpha_beta(children[0], -math.inf, math.inf)
+    best_idx = 0
+    window = (best_value, math.inf) if root_is_max else (-math.inf, best_value)
+
+    siblings = children[1:]
+    slot = _acquire_slot() if workers > 1 and siblings else None
+    if slot is None:
+        result["workers"] = 1
+        outcomes: List[Tuple[int, Tuple[float, float]]] = []
+        for idx, child in enumerate(siblings, start=1):
+            alpha, beta = (best_value, math.inf) if root_is_max else (-math.inf, best_value)
+            outcomes.append((idx, _search_subtree(child, root_is_max, alpha, beta)))
+            if _is_improvement(outcomes[-1][1][0], best_value, root_is_max):
+                best_value, best_idx = outcomes[-1][1][0], idx
+    else:
+        outcomes = []
+        try:
+            pool = _get_pool()
+            _pool_bounds[slot] = best_value
+            pending = {}
+            queue = list(enumerate(siblings, start=1))
+            while queue or pending:
+                while queue and len(pending) < workers:
+                    idx, child = queue.pop(0)
+                    pending[pool.submit(_search_child, child, root_is_max, slot, window[0], window[1])] = idx
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    outcomes.append((pending.pop(fut), fut.result()))
+        except BaseException:
+            # running tasks still write to the slot: let them finish before reusing it
+            for fut in pending:
+                fut.cancel()
+            wait(pending)
+            raise
+        finally:
+            _release_slot(slot)
+
+        # A result is exact only if it beats every bound its search used; fail-low
+        # results are bounds, never better than a real sibling value.
+        for idx, (value, bound_seen) in sorted(outcomes):
+            if _is_improvement(value, bound_seen, root_is_max) and _is_improvement(value, best_value, root_is_max):
+                best_value, best_idx = value, idx
+
+    result.update(root_value=best_value, best_move=children[best_idx].id)
+    if with_leaf_count:
+        result["visited_leaves"] = canonical_leaf_count(root)
+    return result
@@ -1,8 +1,20 @@
 import random
 import math
-from typing import List, Optional, Dict, Tuple
+import re
+from typing import List, Optional, Dict, Tuple, Union, Iterable
+
+# Compact wire format: a parenthesized tree where every "(...)" is an internal
+# node and every integer is a leaf, e.g. "((3 5) (2 9 1))". The root is MAX and
+# levels alternate, node ids follow the generator convention (root, root-0, ...).
+_COMPACT_TOKEN_RE = re.compile(r"[()]|-?\d+|-")
+_COMPACT_TAIL_RE = re.compile(r"-?\d*$")
+_COMPACT_ALLOWED_RE = re.compile(r"[\s,()\d-]*")
+# the solver and to_dict recurse once per level, so deeper trees are rejected up front
+MAX_TREE_DEPTH = 200
 
 class Node:
+    __slots__ = ("id", "value", "children", "is_max")
+
     def __init__(self, id: str, value: Optional[int] = None, children: List['Node'] = None, is_max: bool = True):
         self.id = id
         self.value = value
@@ -17,6 +29,119 @@ class Node:
             "is_max": self.is_max
         }
 
+    def to_compact(self) -> str:
+        """Encode this subtree in the compact parenthesized format (iterative)."""
+        parts = []
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if item is None:
+                parts.append(")")
+                continue
+            if not item.children:
+                parts.append(str(item.value if item.value is not None else 0))
+                continue
+            parts.append("(")
+            stack.append(None)
+            stack.extend(reversed(item.children))
+        return " ".join(parts).replace("( ", "(").replace(" )", ")")
+
+def _tokenize_compact(chunks: Iterable[str]) -> List[str]:
+    """Tokenize a stream of text chunks, carrying numbers split across chunk boundaries."""
+    tokens: List[str] = []
+    carry = ""
+    for chunk in chunks:
+        if not _COMPACT_ALLOWED_RE.fullmatch(chunk):
+            raise ValueError("Compact tree may only contain integers, parentheses, commas and whitespace")
+        text = carry + chunk
+        # hold back a trailing (possibly partial) number for the next chunk
+        tail = _COMPACT_TAIL_RE.search(text)
+        carry = tail.group()
+        tokens.extend(_COMPACT_TOKEN_RE.findall(text, 0, tail.start()))
+    if carry:
+        tokens.append(carry)
+    return tokens
+
+class CompactNode:
+    """
+    Read-only view over one node of a parsed compact tree. Quacks like Node, but
+    children (and their ids) are only materialized when the solver visits them,
+    so pruned subtrees cost nothing beyond tokenization.
+    """
+    __slots__ = ("_tokens", "_close", "_pos", "id", "is_max")
+
+    def __init__(self, tokens: List[str], close: List[int], pos: int, id: str, is_max: bool):
+        self._tokens = tokens
+        self._close = close
+        self._pos = pos
+        self.id = id
+        self.is_max = is_max
+
+    @property
+    def value(self) -> Optional[int]:
+        tok = self._tokens[self._pos]
+        return None if tok == "(" else int(tok)
+
+    @property
+    def children(self) -> List['CompactNode']:
+        tokens, close = self._tokens, self._close
+        if tokens[self._pos] != "(":
+            return []
+        out = []
+        q = self._pos + 1
+        while tokens[q] != ")":
+            out.append(CompactNode(tokens, close, q, f"{self.id}-{len(out)}", not self.is_max))
+            q = close[q] + 1 if tokens[q] == "(" else q + 1
+        return out
+
+    def to_dict(self):
+        return Node.to_dict(self)
+
+    def to_compact(self) -> str:
+        end = self._close[self._pos] if self._tokens[self._pos] == "(" else self._pos
+        return " ".join(self._tokens[self._pos:end + 1]).replace("( ", "(").replace(" )", ")")
+
+def parse_compact_tree(source: Union[str, Iterable[str]]) -> CompactNode:
+    """
+    Parse the compact tree format in one iterative pass over its tokens.
+    Accepts a whole string or any iterable of text chunks. Only a
+    matching-parenthesis table is built; the returned root is a CompactNode that
+    the solver walks directly, without building the full Node tree.
+    Raises ValueError for malformed trees and trees deeper than MAX_TREE_DEPTH.
+    """
+    chunks = [source] if isinstance(source, str) else source
+    tokens = _tokenize_compact(chunks)
+    close = [0] * len(tokens)
+    stack: List[int] = []
+    roots = 0
+
+    for i, tok in enumerate(tokens):
+        if tok == "(":
+            if not stack:
+                roots += 1
+            stack.append(i)
+            if len(stack) > MAX_TREE_DEPTH:
+                raise ValueError(f"Compact tree is deeper than {MAX_TREE_DEPTH} levels")
+        elif tok == ")":
+            if not stack:
+                raise ValueError("Unbalanced ')' in compact tree")
+            j = stack.pop()
+            if j == i - 1:
+                raise ValueError("Empty '()' node in compact tree")
+            close[j] = i
+        elif tok == "-":
+            raise ValueError("Dangling '-' in compact tree")
+        elif not stack:
+            roots += 1
+
+    if stack:
+        raise ValueError("Unbalanced '(' in compact tree")
+    if roots == 0:
+        raise ValueError("Compact tree is empty")
+    if roots > 1:
+        raise ValueError("Compact tree must have a single root")
+    return CompactNode(tokens, close, 0, "root", True)
+
 class MinMaxService:
     def generate_tree(self, difficulty: str) -> Dict:
         """
@@ -58,18 +183,35 @@ class MinMaxService:
             
         return node
 
-    def solve_alpha_beta(self, tree_dict: Dict) -> Tuple[int, int, str]:
+    def solve_alpha_beta(self, tree: Union[Dict, str], explain: bool = True) -> Tuple[int, int, Optional[str]]:
         """
         Solves the tree using MinMax with Alpha-Beta pruning.
+        `tree` is either the nested dict form or the compact text form.
         Returns: (root_value, visited_leaves_count, explanation)
+        With explain=False no step log is recorded and the explanation is None.
         """
-        solver = AlphaBetaSolver()
-        root_node = self._dict_to_node(tree_dict)
+        solver = AlphaBetaSolver(record_steps=explain)
+        root_node = self.to_node(tree)
         root_value = solver.solve(root_node)
-        return root_value, solver.visited_leaves_count, solver.get_explanation()
+        return root_value, solver.visited_leaves_count, solver.get_explanation() if explain else None
+
+    def to_node(self, tree: Union[Dict, str, Node, CompactNode]) -> Union[Node, CompactNode]:
+        if isinstance(tree, str):
+            return parse_compact_tree(tree)
+        if isinstance(tree, dict):
+            try:
+                return self._dict_to_node(tree)
+            except (KeyError, TypeError, AttributeError) as e:
+                raise ValueError(f"Invalid tree: {e!r}")
+        # already node-like (Node, CompactNode, procedural nodes)
+        return tree
 
-    def _dict_to_node(self, data: Dict) -> Node:
-        children = [self._dict_to_node(c) for c in data.get("children", [])]
+    def _dict_to_node(self, data: Dict, depth: int = 0) -> Node:
+        if depth > MAX_TREE_DEPTH:
+            raise ValueError(f"Tree is deeper than {MAX_TREE_DEPTH} levels")
+        children = [self._dict_to_node(c, depth + 1) for c in data.get("children", [])]
+        if not children and not isinstance(data.get("value"), (int, float)):
+            raise TypeError(f"leaf {data['id']} needs a numeric value")
         return Node(
             id=data["id"],
             value=data.get("value"),
@@ -78,30 +220,35 @@ class MinMaxService:
         )
 
 class AlphaBetaSolver:
-    def __init__(self):
+    def __init__(self, record_steps: bool = True):
         self.visited_leaves_count = 0
         self.log_steps = []
+        # disable for bulk/worker solves where nobody reads the explanation
+        self.record_steps = record_steps
 
     def solve(self, node: Node) -> int:
         return self._alpha_beta(node, -math.inf, math.inf)
 
     def _alpha_beta(self, node: Node, alpha: float, beta: float) -> int:
-        if not node.children:
+        children = node.children
+        if not children:
             self.visited_leaves_count += 1
             if node.value is None:
                 return 0
-            self.log_steps.append(f"Visit leaf {node.id}, value={node.value}")
+            if self.record_steps:
+                self.log_steps.append(f"Visit leaf {node.id}, value={node.value}")
             return node.value
 
         if node.is_max:
             value = -math.inf
-            for child in node.children:
+            for child in children:
                 score = self._alpha_beta(child, alpha, beta)
                 value = max(value, score)
                 
                 # Fail-Hard Pruning (Rule from user's course)
                 if value >= beta:
-                    self.log_steps.append(f"Pruning at MAX node {node.id}: score ({value}) >= beta ({beta}). Returning beta.")
+                    if self.record_steps:
+                        self.log_steps.append(f"Pruning at MAX node {node.id}: score ({value}) >= beta ({beta}). Returning beta.")
                     return beta
                 
                 if value > alpha:
@@ -109,13 +256,14 @@ class AlphaBetaSolver:
             return value
         else:
             value = math.inf
-            for child in node.children:
+            for child in children:
                 score = self._alpha_beta(child, alpha, beta)
                 value = min(value, score)
                 
                 # Fail-Hard Pruning (Rule from user's course)
                 if value <= alpha:
-                    self.log_steps.append(f"Pruning at MIN node {node.id}: score ({value}) <= alpha ({alpha}). Returning alpha.")
+                    if self.record_steps:
+                        self.log_steps.append(f"Pruning at MIN node {node.id}: score ({value}) <= alpha ({alpha}). Returning alpha.")
                     return alpha
                 
                 if value < beta:
@@ -0,0 +1,117 @@
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+METHODS = ("regret_matching", "fictitious_play")
+# exploitability is measured (two matrix-vector products) every this many iterations
+_CHECK_EVERY = 25
+
+def exploitability(A: np.ndarray, B: np.ndarray, x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """
+    Best-response gains of the two players against (x, y). The profile is an
+    epsilon-equilibrium for epsilon = max of the gains (NashConv is their sum).
+    """
+    Ay = A @ y
+    xB = x @ B
+    return float(Ay.max() - x @ Ay), float(xB.max() - xB @ y)
+
+def _regret_matching(A: np.ndarray, B: np.ndarray):
+    """
+    Regret matching+ with linearly weighted averages: each step is one product
+    A @ y and one x @ B; cumulative regrets are clipped at zero. Yields the
+    average profile and the current one (often already exact, e.g. when a
+    strategy is dominant).
+    """
+    m, n = A.shape
+    regret_x, regret_y = np.zeros(m), np.zeros(n)
+    avg_x, avg_y = np.zeros(m), np.zeros(n)
+    x, y = np.full(m, 1.0 / m), np.full(n, 1.0 / n)
+    t = 0
+    while True:
+        t += 1
+        ux = A @ y
+        uy = x @ B
+        regret_x = np.maximum(regret_x + ux - x @ ux, 0.0)
+        regret_y = np.maximum(regret_y + uy - uy @ y, 0.0)
+        avg_x += t * x
+        avg_y += t * y
+        sx, sy = regret_x.sum(), regret_y.sum()
+        x = regret_x / sx if sx > 0 else np.full(m, 1.0 / m)
+        y = regret_y / sy if sy > 0 else np.full(n, 1.0 / n)
+        yield (avg_x / avg_x.sum(), avg_y / avg_y.sum()), (x, y)
+
+def _fictitious_play(A: np.ndarray, B: np.ndarray):
+    """
+    Simultaneous fictitious play. Each player best-responds to the opponent's
+    empirical mixture; the payoff vectors against those mixtures are kept as
+    running sums, so a step adds one column of A and one row of B (O(m + n)).
+    """
+    m, n = A.shape
+    counts_x, counts_y = np.zeros(m), np.zeros(n)
+    payoff_x = A[:, 0].copy()  # sum of A[:, j] over the column player's past plays
+    payoff_y = B[0, :].copy()  # sum of B[i, :] over the row player's past plays
+    counts_x[0] += 1
+    counts_y[0] += 1
+    t = 1
+    while True:
+        yield ((counts_x / t, counts_y / t),)
+        i = int(payoff_x.argmax())
+        j = int(payoff_y.argmax())
+        counts_x[i] += 1
+        counts_y[j] += 1
+        payoff_x += A[:, j]
+        payoff_y += B[i, :]
+        t += 1
+
+def approximate_equilibrium(payoff, method: str = "regret_matching", max_iterations: int = 10000,
+                            time_budget_ms: Optional[int] = 1000, target_epsilon: float = 1e-3) -> Dict[str, Any]:
+    """
+    Approximate mixed Nash equilibrium of a bimatrix game payoff[i][j] = [u_row, u_col]
+    for games too large for support enumeration / Lemke-Howson. Iterates until the
+    measured epsilon reaches target_epsilon (relative to the payoff range), or the
+    iteration or time budget runs out, and returns the best profile seen with its
+    exploitability.
+
+    Both methods converge in two-player zero-sum games; in general-sum games they
+    may not, so the reported epsilon is the guarantee and "converged" says whether
+    the target was reached.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method} (expected one of {', '.join(METHODS)})")
+    if max_iterations < 1:
+        raise ValueError("max_iterations must be positive")
+    arr = np.asarray(payoff, dtype=float)
+    A, B = arr[..., 0], arr[..., 1]
+    # relative target: payoffs of any scale converge in the same number of steps
+    scale = max(float(np.ptp(A)), float(np.ptp(B)), 1e-12)
+
+    steps = _regret_matching(A, B) if method == "regret_matching" else _fictitious_play(A, B)
+    start = time.perf_counter()
+    deadline = start + time_budget_ms / 1000.0 if time_budget_ms else None
+    best: Optional[Tuple[float, Tuple[float, float], np.ndarray, np.ndarray, int]] = None
+    iterations = 0
+    for iterations, candidates in enumerate(steps, start=1):
+        last = iterations >= max_iterations
+        if iterations % _CHECK_EVERY == 0 or last or iterations == 1:
+            for x, y in candidates:
+                gains = exploitability(A, B, x, y)
+                if best is None or max(gains) < best[0]:
+                    best = (max(gains), gains, x.copy(), y.copy(), iterations)
+            if best[0] <= target_epsilon * scale or last or (deadline and time.perf_counter() >= deadline):
+                break
+
+    eps, (gain_row, gain_col), x, y, at_iteration = best
+    return {
+        "method": method,
+        "row_strategy": [round(float(p), 6) for p in x],
+        "col_strategy": [round(float(q), 6) for q in y],
+        "row_payoff": round(float(x @ A @ y), 6),
+        "col_payoff": round(float(x @ B @ y), 6),
+        "epsilon": round(eps, 9),
+        "nash_conv": round(gain_row + gain_col, 9),
+        "converged": eps <= target_epsilon * scale,
+        "iterations": iterations,
+        "best_iteration": at_iteration,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000.0, 1),
+    }
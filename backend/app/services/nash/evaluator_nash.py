@@ -1,35 +1,89 @@
 import re
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional, Sequence
 
-def parse_nfg_answer(text: str) -> Dict[str, Any]:
+from app.services.nash.generator_nash import best_response_table
+
+# One alternation scanned once, left to right. Order matters: a comma pair wins
+# over a space pair, and a space pair is not taken when its second number starts a
+# comma pair ("1 2,3" -> (2,3)), which keeps the old "comma pairs first, space pairs
+# only if there are none" behaviour without a second pass over the text.
+_ANSWER_TOKEN_RE = re.compile(
+    r"(?P<ca>\d+)\s*[,;]\s*(?P<cb>\d+)"
+    r"|(?P<sa>\d+)\s+(?P<sb>\d+)(?!\d)(?!\s*[,;]\s*\d)"
+    r"|(?P<word>[^\W\d_]+)"
+    r"|\d+"
+)
+_NO_WORDS = frozenset(("n", "no", "nu"))
+_YES_WORDS = frozenset(("da", "yes", "y", "true"))
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+def parse_nfg_answer(text: str, bounds: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
     """
     Parse answer text. Accept examples:
       "Nu" or "No"
       "Da (1,2)" or "Yes (1,2) (2,1)"
       "Yes; (1,2)"
       "Da: (1,2),(3,3)"
-    Returns dict: {"has_equilibrium": bool, "equilibria": [(r,c), ...]}
+    Returns dict: {"has_equilibrium": bool, "equilibria": [(r,c), ...]} with each
+    profile listed once, in order of appearance.
+    Single linear scan; with bounds=(m, n) scanning stops once every in-range
+    profile of the m x n game was read (only distinct in-range profiles count, so
+    repeated pairs or payoffs quoted from the matrix never hide a later answer).
     """
-    t = (text or "").strip()
-    if not t:
+    t = text or ""
+    first = len(t) - len(t.lstrip())
+    if first == len(t):
         return {"has_equilibrium": False, "equilibria": []}
-    lower = t.lower()
-    # explicit "no" variants
-    if re.match(r'^\s*(n|no|nu)\b', lower):
-        return {"has_equilibrium": False, "equilibria": []}
-    # detect yes-like words
-    has_yes = bool(re.search(r'\b(da|yes|y|true)\b', lower))
-    # extract pairs like (1,2) or 1,2 or 1;2
-    pairs = re.findall(r'\(?\s*(\d+)\s*[,;]\s*(\d+)\s*\)?', t)
+
+    def in_range(pair: Tuple[int, int]) -> bool:
+        return 1 <= pair[0] <= bounds[0] and 1 <= pair[1] <= bounds[1]
+
+    limit = bounds[0] * bounds[1] if bounds else None
+    has_yes = False
+    # dicts as ordered sets; the counters track distinct in-range profiles
+    comma_pairs: Dict[Tuple[int, int], None] = {}
+    space_pairs: Dict[Tuple[int, int], None] = {}
+    comma_in_range = space_in_range = 0
+    for tok in _ANSWER_TOKEN_RE.finditer(t):
+        kind = tok.lastgroup
+        if kind == "cb":
+            pair = (int(tok.group("ca")), int(tok.group("cb")))
+            if pair not in comma_pairs:
+                comma_pairs[pair] = None
+                if limit is not None and in_range(pair):
+                    comma_in_range += 1
+                    if comma_in_range >= limit:
+                        break
+        elif kind == "sb":
+            pair = (int(tok.group("sa")), int(tok.group("sb")))
+            if pair not in space_pairs and (limit is None or space_in_range < limit):
+                space_pairs[pair] = None
+                if limit is not None and in_range(pair):
+                    space_in_range += 1
+        elif kind == "word":
+            start, end = tok.span()
+            if (start > 0 and _is_word_char(t[start - 1])) or (end < len(t) and _is_word_char(t[end])):
+                continue  # letters glued to digits or underscores are not verdict words
+            lower = tok.group("word").lower()
+            # explicit "no" variants, only as the very first word
+            if start == first and lower in _NO_WORDS:
+                return {"has_equilibrium": False, "equilibria": []}
+            if lower in _YES_WORDS:
+                has_yes = True
+
     # some formats may have space instead of comma: "1 2" or "(1 2)"
-    if not pairs:
-        pairs = re.findall(r'\(?\s*(\d+)\s+\s*(\d+)\s*\)?', t)
-    equilibria = [(int(a), int(b)) for a,b in pairs]
+    equilibria = list(comma_pairs or space_pairs)
     if has_yes or equilibria:
         return {"has_equilibrium": True, "equilibria": equilibria}
     return {"has_equilibrium": False, "equilibria": []}
 
-def evaluate_normal_form(question: Dict[str, Any], answer_text: str) -> Dict[str, Any]:
+def parse_nfg_answers(texts: Sequence[str], bounds: Optional[Tuple[int, int]] = None) -> List[Dict[str, Any]]:
+    """Batch form of parse_nfg_answer (shared compiled tokenizer, e.g. for re-grading)."""
+    return [parse_nfg_answer(t, bounds) for t in texts]
+
+def evaluate_normal_form(question: Dict[str, Any], answer_text: str, explain: bool = True) -> Dict[str, Any]:
     """
     Evaluate submission. Returns detailed result with partial scoring:
     - If no true equilibria exist:
@@ -43,8 +97,13 @@ def evaluate_normal_form(question: Dict[str, Any], answer_text: str) -> Dict[str
             - user claims "Nu" while there are true equilibria -> 0
             - user claims "Da" but gives no profiles -> 0
             - if user provides no profiles but has_equilibrium True (detected by word) -> treated as no profiles
+    With explain=False the "explanation" text is skipped (bulk grading); it can be
+    rendered later from matched/extra with explain_normal_form.
     """
-    parsed = parse_nfg_answer(answer_text)
+    payoff = question.get("payoff_matrix") or []
+    # a student cannot list more distinct (in-range) profiles than there are cells
+    bounds = (len(payoff), len(payoff[0])) if payoff else None
+    parsed = parse_nfg_answer(answer_text, bounds)
     provided_has = parsed["has_equilibrium"]
     provided_equils = [tuple(p) for p in parsed["equilibria"]]
 
@@ -129,10 +188,7 @@ def evaluate_normal_form(question: Dict[str, Any], answer_text: str) -> Dict[str
         else:
             note = "Partial: ai identificat toate echilibria dar ai adăugat profile greșite (penalizare)."
 
-    # Generate detailed explanation
-    explanation = _generate_explanation(question.get("payoff_matrix"), matched, extra)
-
-    return {
+    result = {
         "is_there": True,
         "provided_has": provided_has,
         "provided_equilibria": provided_equils,
@@ -141,16 +197,40 @@ def evaluate_normal_form(question: Dict[str, Any], answer_text: str) -> Dict[str
         "extra_equilibria": extra,
         "score_percent": score,
         "note": note,
-        "correct_equilibria": sorted(true_equils),
-        "explanation": explanation
+        "correct_equilibria": sorted(true_equils)
     }
+    if explain:
+        # Generate detailed explanation
+        result["explanation"] = explain_normal_form(question, matched, extra)
+    return result
+
+def explain_normal_form(question: Dict[str, Any], matched: Sequence[Sequence[int]], extra: Sequence[Sequence[int]]) -> str:
+    """Explanation for a graded answer, from its matched and extra profiles only."""
+    return _generate_explanation(
+        question.get("payoff_matrix"),
+        [tuple(p) for p in matched],
+        [tuple(p) for p in extra],
+        question.get("best_responses"),
+    )
 
-def _generate_explanation(payoff_matrix: List[List[List[int]]], matched: List[Tuple[int, int]], extra: List[Tuple[int, int]]) -> str:
+def _generate_explanation(payoff_matrix: List[List[List[int]]], matched: List[Tuple[int, int]], extra: List[Tuple[int, int]],
+                          best_responses: Optional[Dict[str, List[int]]] = None) -> str:
+    """
+    Explain matched and extra profiles. Every check is a lookup in the question's
+    best-response table (stored at generation; built here in O(m*n) for older
+    questions that lack it), so the cost is O(1) per profile.
+    """
     if not payoff_matrix:
         return ""
-    
+
     m = len(payoff_matrix)
     n = len(payoff_matrix[0])
+    if best_responses is None:
+        best_responses = best_response_table(payoff_matrix)
+    row_max = best_responses["row_max"]
+    row_argmax = best_responses["row_argmax"]
+    col_max = best_responses["col_max"]
+    col_argmax = best_responses["col_argmax"]
     lines = []
 
     # Explain matched (correct) equilibria
@@ -158,24 +238,11 @@ def _generate_explanation(payoff_matrix: List[List[List[int]]], matched: List[Tu
         lines.append("De ce sunt corecte soluțiile identificate:")
         for (r, c) in matched:
             # r, c are 1-based
-            row_idx = r - 1
-            col_idx = c - 1
-            u_row, u_col = payoff_matrix[row_idx][col_idx]
-            
+            u_row, u_col = payoff_matrix[r - 1][c - 1]
+
             lines.append(f"- (R{r}, C{c}): Jucătorul Linie câștigă {u_row}, Jucătorul Coloană câștigă {u_col}.")
-            # Prove row optimaility
-            row_opt = True
-            for k in range(m):
-                if payoff_matrix[k][col_idx][0] > u_row:
-                    row_opt = False # Should not happen for correct NE
-            
-            # Prove col optimality
-            col_opt = True
-            for l in range(n):
-                if payoff_matrix[row_idx][l][1] > u_col:
-                    col_opt = False # Should not happen
-            
-            if row_opt and col_opt:
+            # row payoff is a column maximum and column payoff a row maximum
+            if u_row >= row_max[c - 1] and u_col >= col_max[r - 1]:
                 lines.append(f"  Acesta este un Echilibru Nash deoarece niciun jucător nu poate obține un câștig mai mare schimbând unilateral strategia.")
 
     # Explain extra (wrong) equilibria
@@ -184,7 +251,7 @@ def _generate_explanation(payoff_matrix: List[List[List[int]]], matched: List[Tu
         for (r, c) in extra:
             row_idx = r - 1
             col_idx = c - 1
-            
+
             # Bounds check
             if row_idx < 0 or row_idx >= m or col_idx < 0 or col_idx >= n:
                 lines.append(f"- (R{r}, C{c}): Profil inexistent în matrice.")
@@ -192,31 +259,15 @@ def _generate_explanation(payoff_matrix: List[List[List[int]]], matched: List[Tu
 
             u_row, u_col = payoff_matrix[row_idx][col_idx]
             reasons = []
-            
+
             # Check Row deviation
-            best_row_val = -float('inf')
-            best_row_idx = -1
-            for k in range(m):
-                val = payoff_matrix[k][col_idx][0]
-                if val > best_row_val:
-                    best_row_val = val
-                    best_row_idx = k
-            
-            if best_row_val > u_row:
-                reasons.append(f"Jucătorul Linie ar prefera R{best_row_idx + 1} (câștig {best_row_val} > {u_row})")
+            if row_max[col_idx] > u_row:
+                reasons.append(f"Jucătorul Linie ar prefera R{row_argmax[col_idx]} (câștig {row_max[col_idx]} > {u_row})")
 
             # Check Col deviation
-            best_col_val = -float('inf')
-            best_col_idx = -1
-            for l in range(n):
-                val = payoff_matrix[row_idx][l][1]
-                if val > best_col_val:
-                    best_col_val = val
-                    best_col_idx = l
-            
-            if best_col_val > u_col:
-                reasons.append(f"Jucătorul Coloană ar prefera C{best_col_idx + 1} (câștig {best_col_val} > {u_col})")
-            
+            if col_max[row_idx] > u_col:
+                reasons.append(f"Jucătorul Coloană ar prefera C{col_argmax[row_idx]} (câștig {col_max[row_idx]} > {u_col})")
+
             if reasons:
                 lines.append(f"- (R{r}, C{c}): Nu este echilibru. {'; '.join(reasons)}.")
             else:
@@ -224,12 +275,4 @@ def _generate_explanation(payoff_matrix: List[List[List[int]]], matched: List[Tu
                  # Unless true_set calculation failed or it's actually NE but missed by generator?
                  lines.append(f"- (R{r}, C{c}): Eroare de validare.")
 
-    if not matched and not extra:
-        # If user picked nothing or claimed "No" correctly/incorrectly
-        # We can explain why correct ones are correct (if any exist)
-        pass # The function signature assumes we explain the USER'S selection. 
-             # But maybe we should explain the CORRECT ones even if user missed them?
-             # For now, following the requested pattern "why are correct ones correct, why wrong ones wrong".
-             # If user missed correct ones, they are in 'missing'. I should pass 'missing' too to explain them?
-    
-    return "\n".join(lines)
\ No newline at end of file
+    return "\n".join(lines)
@@ -1,6 +1,10 @@
 import random
 import uuid
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Union
+import numpy as np
+
+# Below this many cells the pure-Python scan is cheaper than converting to an array
+_NUMPY_MIN_CELLS = 16
 
 def _random_payoffs(m: int, n: int, low: int = -5, high: int = 10):
     """Return an m x n matrix of [row_payoff, col_payoff] pairs."""
@@ -12,50 +16,184 @@ def _random_payoffs(m: int, n: int, low: int = -5, high: int = 10):
         mat.append(row)
     return mat
 
-def _find_pure_nash(payoff: List[List[List[int]]]) -> List[Tuple[int,int]]:
+def _best_response_maps(m: int, n: int, num_equilibria: int) -> Tuple[List[int], List[int]]:
+    """
+    Pick sigma (column -> row best response) and tau (row -> column best response)
+    with exactly `num_equilibria` mutual pairs; (r, c) is an equilibrium iff
+    sigma(c) = r and tau(r) = c. Every non-planted column points at a row whose best
+    response is elsewhere, which closes best-response cycles instead of equilibria.
+    """
+    if not 0 <= num_equilibria <= min(m, n):
+        raise ValueError(f"a {m}x{n} game can have between 0 and {min(m, n)} planted equilibria")
+    if num_equilibria == 0 and min(m, n) < 2:
+        raise ValueError("games with a single row or column always have a pure equilibrium")
+
+    planted_rows = random.sample(range(m), num_equilibria)
+    planted_cols = random.sample(range(n), num_equilibria)
+
+    tau = [random.randrange(n) for _ in range(m)]
+    for r, c in zip(planted_rows, planted_cols):
+        tau[r] = c
+    if num_equilibria == 0 and len(set(tau)) == 1:
+        # a constant tau would leave its column without a non-equilibrium best response
+        i = random.randrange(m)
+        tau[i] = random.choice([c for c in range(n) if c != tau[i]])
+
+    sigma = [0] * n
+    for r, c in zip(planted_rows, planted_cols):
+        sigma[c] = r
+    for c in set(range(n)) - set(planted_cols):
+        sigma[c] = random.choice([r for r in range(m) if tau[r] != c])
+    return sigma, tau
+
+def _enforce_strict_best(values: np.ndarray, best: np.ndarray, low: int, high: int, rng: np.random.Generator) -> None:
+    """
+    In place, for a stack `values` of shape (g, a, b): make values[t, best[t, j], j]
+    the unique maximum of values[t, :, j], keeping every entry in [low, high].
+    """
+    g, a, b = values.shape
+    t_idx = np.arange(g)[:, None]
+    j_idx = np.arange(b)[None, :]
+    is_best = np.zeros(values.shape, dtype=bool)
+    is_best[t_idx, best, j_idx] = True
+
+    top = np.where(is_best, low - 1, values).max(axis=1)  # best competing value per column
+    saturated = top >= high
+    # competitors already at `high` are pushed below it so `high` becomes a strict maximum
+    clamp = (values == high) & ~is_best & saturated[:, None, :]
+    values[clamp] = rng.integers(low, high, size=int(clamp.sum()))
+    raised = rng.integers(np.minimum(top + 1, high), high + 1)
+    values[t_idx, best, j_idx] = np.where(saturated, high, raised)
+
+def _feasible_count(m: int, n: int, k: int) -> int:
+    k = max(0, min(k, m, n))
+    return 1 if k == 0 and min(m, n) < 2 else k
+
+def _payoff_stack(m: int, n: int, counts: List[Optional[int]], low: int, high: int,
+                  rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Draw len(counts) m x n games in one call, shape (g, m, n, 2). Games whose count is
+    not None get that many planted pure equilibria; the others stay random.
+    Like the old rejection sampler this is best effort rather than strict: a range
+    with high <= low is widened to [low, low + 1] (strict best responses need two
+    values) and counts are clamped to what the shape allows (a single row or
+    column always has an equilibrium, so "none" becomes one there).
+    """
+    high = max(high, low + 1)
+    counts = [None if k is None else _feasible_count(m, n, k) for k in counts]
+    rng = rng or np.random.default_rng()
+    payoffs = rng.integers(low, high + 1, size=(len(counts), m, n, 2))
+
+    planted = [t for t, k in enumerate(counts) if k is not None]
+    if planted:
+        maps = [_best_response_maps(m, n, counts[t]) for t in planted]
+        sigma = np.array([sg for sg, _ in maps], dtype=np.intp)
+        tau = np.array([ta for _, ta in maps], dtype=np.intp)
+        sub = payoffs[planted]
+        row_u = np.ascontiguousarray(sub[..., 0])
+        col_u = np.ascontiguousarray(sub[..., 1].swapaxes(1, 2))
+        _enforce_strict_best(row_u, sigma, low, high, rng)
+        _enforce_strict_best(col_u, tau, low, high, rng)
+        sub[..., 0] = row_u
+        sub[..., 1] = col_u.swapaxes(1, 2)
+        payoffs[planted] = sub
+    return payoffs
+
+def _planted_payoffs(m: int, n: int, num_equilibria: int, low: int = -5, high: int = 10) -> List[List[List[int]]]:
+    """Construct an m x n game with exactly `num_equilibria` pure NE, payoffs in [low, high]."""
+    return _payoff_stack(m, n, [num_equilibria], low, high)[0].tolist()
+
+def _random_equilibrium_count(m: int, n: int) -> int:
+    """Pick how many equilibria to plant: 1..min(m, n), smaller counts more likely."""
+    counts = list(range(1, min(m, n) + 1))
+    return random.choices(counts, weights=[1.0 / k for k in counts])[0]
+
+def _pure_nash_mask(payoff: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask of pure NE for payoff arrays of shape (..., m, n, 2).
+    Column maxima of row payoffs and row maxima of column payoffs are computed once,
+    so a cell is an equilibrium iff it attains both. Leading axes are treated as a batch.
+    """
+    u_row = payoff[..., 0]
+    u_col = payoff[..., 1]
+    best_for_row = u_row == u_row.max(axis=-2, keepdims=True)
+    best_for_col = u_col == u_col.max(axis=-1, keepdims=True)
+    return best_for_row & best_for_col
+
+def _find_pure_nash(payoff: Union[List[List[List[int]]], np.ndarray]) -> List[Tuple[int,int]]:
     """Given payoff matrix payoff[i][j] = [u_row, u_col], return list of pure NE as 1-based indices."""
-    m = len(payoff)
-    n = len(payoff[0]) if m > 0 else 0
-    ne = []
-    for i in range(m):
-        for j in range(n):
-            u_row = payoff[i][j][0]
-            u_col = payoff[i][j][1]
-            best_for_row = all(payoff[k][j][0] <= u_row for k in range(m))
-            best_for_col = all(payoff[i][l][1] <= u_col for l in range(n))
-            if best_for_row and best_for_col:
-                ne.append((i + 1, j + 1))
-    return ne
+    if not isinstance(payoff, np.ndarray):
+        m = len(payoff)
+        n = len(payoff[0]) if m > 0 else 0
+        if m * n == 0:
+            return []
+        if m * n < _NUMPY_MIN_CELLS:
+            # tiny matrices: O(m*n) scan with the maxima precomputed once
+            col_best = [max(payoff[k][j][0] for k in range(m)) for j in range(n)]
+            row_best = [max(cell[1] for cell in payoff[i]) for i in range(m)]
+            return [
+                (i + 1, j + 1)
+                for i in range(m)
+                for j in range(n)
+                if payoff[i][j][0] == col_best[j] and payoff[i][j][1] == row_best[i]
+            ]
+        payoff = np.asarray(payoff)
+    if payoff.size == 0:
+        return []
+    rows, cols = np.nonzero(_pure_nash_mask(payoff))
+    return [(int(r) + 1, int(c) + 1) for r, c in zip(rows, cols)]
+
+def _best_response_arrays(payoff: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Best responses for payoff arrays of shape (..., m, n, 2): the row player's best
+    payoff against each column and a (first, 1-based) row attaining it, and the
+    column player's best payoff against each row and a column attaining it.
+    """
+    u_row = payoff[..., 0]
+    u_col = payoff[..., 1]
+    return u_row.max(axis=-2), u_row.argmax(axis=-2) + 1, u_col.max(axis=-1), u_col.argmax(axis=-1) + 1
+
+def best_response_table(payoff: Union[List[List[List[int]]], np.ndarray]) -> Dict[str, List[int]]:
+    """Best-response table stored with a question and shared by grading and explanations."""
+    row_max, row_arg, col_max, col_arg = _best_response_arrays(np.asarray(payoff))
+    return {
+        "row_max": row_max.tolist(),
+        "row_argmax": row_arg.tolist(),
+        "col_max": col_max.tolist(),
+        "col_argmax": col_arg.tolist(),
+    }
 
 def generate_normal_form_question(m: Optional[int] = None,
                                    n: Optional[int] = None,
                                    low: int = -5,
                                    high: int = 10,
                                    ensure: str = "any",
-                                   max_attempts: int = 500) -> Dict[str, Any]:
+                                   num_equilibria: Optional[int] = None) -> Dict[str, Any]:
     """
     Generate a single normal-form game:
       - m x n : if None, picks from default sizes
       - ensure: "any" | "at_least_one" | "none"
+      - num_equilibria: plant exactly this many pure NE (overrides ensure)
+    Games for "at_least_one"/"none" are constructed directly, never rejection-sampled.
     """
     sizes = [(2,2), (2,3), (3,3), (4,4)]
     if m is None or n is None:
         m, n = random.choice(sizes)
 
-    attempts = 0
-    while True:
-        attempts += 1
+    if num_equilibria is None:
+        if ensure == "at_least_one":
+            num_equilibria = _random_equilibrium_count(m, n)
+        elif ensure == "none":
+            num_equilibria = 0
+
+    if num_equilibria is None:
         payoff = _random_payoffs(m, n, low=low, high=high)
-        ne = _find_pure_nash(payoff)
-        if ensure == "any":
-            break
-        if ensure == "at_least_one" and ne:
-            break
-        if ensure == "none" and not ne:
-            break
-        if attempts >= max_attempts:
-            break
+    else:
+        payoff = _planted_payoffs(m, n, num_equilibria, low=low, high=high)
+    return _question_dict(m, n, payoff, _find_pure_nash(payoff))
 
+def _question_dict(m: int, n: int, payoff: List[List[List[int]]], ne: List[Tuple[int, int]],
+                   best_responses: Optional[Dict[str, List[int]]] = None) -> Dict[str, Any]:
     qid = str(uuid.uuid4())
     prompt = f"Pentru jocul în formă normală dat în matrice ({m}x{n}), există echilibru Nash pur? Indicați Da/Nu și, dacă Da, precizați unul sau mai multe profile (r,c) 1-based."
     matrix_lines = [ " | ".join(f"({u[0]},{u[1]})" for u in row) for row in payoff]
@@ -68,7 +206,8 @@ def generate_normal_form_question(m: Optional[int] = None,
         "row_labels": [f"R{i+1}" for i in range(m)],
         "col_labels": [f"C{j+1}" for j in range(n)],
         "matrix_lines": matrix_lines,
-        "equilibria": ne
+        "equilibria": ne,
+        "best_responses": best_responses if best_responses is not None else best_response_table(payoff)
     }
 
 def generate_batch(count: int = 1,
@@ -81,8 +220,9 @@ def generate_batch(count: int = 1,
     """
     Generate a batch of questions.
     difficulty: "easy" | "medium" | "hard"
+    All games of the same size are drawn as one NumPy tensor and checked for
+    equilibria with a single mask, so cost is dominated by building the dicts.
     """
-    results: List[Dict[str, Any]] = []
 
     # Difficulty Configuration
     # Easy: Small matrices, mixed probability (50% with NE, 50% without)
@@ -122,8 +262,9 @@ def generate_batch(count: int = 1,
              # keeping it simple: just use difficulty path if dist is None
              pass 
 
-    # Main Difficulty Loop
-    for _ in range(count):
+    # Main Difficulty Loop: only decide size and equilibrium count per item here
+    plan: Dict[Tuple[int, int], List[Tuple[int, Optional[int]]]] = {}
+    for idx in range(count):
         # Handle the custom 50/50 mode for Easy/Medium
         current_ensure = ensure_mode
         if ensure_mode == "mixed_50_50":
@@ -133,7 +274,31 @@ def generate_batch(count: int = 1,
                 current_ensure = "none"
 
         m, n = random.choice(possible_sizes)
-        q = generate_normal_form_question(m=m, n=n, low=low, high=high, ensure=current_ensure)
-        results.append(q)
+        if current_ensure == "at_least_one":
+            num_equilibria = _random_equilibrium_count(m, n)
+        elif current_ensure == "none":
+            num_equilibria = 0
+        else:
+            num_equilibria = None
+        plan.setdefault((m, n), []).append((idx, num_equilibria))
+
+    # Whole-batch generation: one payoff tensor and one equilibrium mask per size
+    results: List[Optional[Dict[str, Any]]] = [None] * count
+    rng = np.random.default_rng()
+    for (m, n), items in plan.items():
+        stack = _payoff_stack(m, n, [k for _, k in items], low, high, rng)
+        ne_cells = np.argwhere(_pure_nash_mask(stack))
+        per_game: List[List[Tuple[int, int]]] = [[] for _ in items]
+        for t, r, c in ne_cells.tolist():
+            per_game[t].append((r + 1, c + 1))
+        tables = [arr.tolist() for arr in _best_response_arrays(stack)]
+        for t, ((idx, _), payoff, ne) in enumerate(zip(items, stack.tolist(), per_game)):
+            best_responses = {
+                "row_max": tables[0][t],
+                "row_argmax": tables[1][t],
+                "col_max": tables[2][t],
+                "col_argmax": tables[3][t],
+            }
+            results[idx] = _question_dict(m, n, payoff, ne, best_responses)
 
     return results
\ No newline at end of file
@@ -0,0 +1,189 @@
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.gametheory.dominance_gametheory import eliminate_dominated
+
+# Numerical tolerance for probabilities and best-response checks
+_TOL = 1e-9
+# Reduced games with at most this many strategies per player use support enumeration
+SUPPORT_ENUM_MAX = 6
+
+def _split_payoffs(payoff) -> Tuple[np.ndarray, np.ndarray]:
+    arr = np.asarray(payoff, dtype=float)
+    return arr[..., 0], arr[..., 1]
+
+def is_equilibrium(A: np.ndarray, B: np.ndarray, x: np.ndarray, y: np.ndarray, tol: float = 1e-7) -> bool:
+    """No pure deviation improves either player's expected payoff."""
+    u = x @ A @ y
+    v = x @ B @ y
+    return bool((A @ y <= u + tol).all() and (x @ B <= v + tol).all())
+
+def _indifferent_strategy(M: np.ndarray) -> Optional[np.ndarray]:
+    """Solve M z = w*1, sum z = 1 for a square M; None if singular or not a distribution."""
+    k = M.shape[0]
+    system = np.zeros((k + 1, k + 1))
+    system[:k, :k] = M
+    system[:k, k] = -1.0
+    system[k, :k] = 1.0
+    rhs = np.zeros(k + 1)
+    rhs[k] = 1.0
+    try:
+        sol = np.linalg.solve(system, rhs)
+    except np.linalg.LinAlgError:
+        return None
+    z = sol[:k]
+    if (z < -_TOL).any():
+        return None
+    return np.clip(z, 0.0, None)
+
+def support_enumeration(A: np.ndarray, B: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """All equilibria with equal-size supports (all equilibria of a nondegenerate game)."""
+    m, n = A.shape
+    found = []
+    for k in range(1, min(m, n) + 1):
+        for I in itertools.combinations(range(m), k):
+            for J in itertools.combinations(range(n), k):
+                y_J = _indifferent_strategy(A[np.ix_(I, J)])
+                if y_J is None:
+                    continue
+                x_I = _indifferent_strategy(B[np.ix_(I, J)].T)
+                if x_I is None:
+                    continue
+                x = np.zeros(m)
+                y = np.zeros(n)
+                x[list(I)] = x_I
+                y[list(J)] = y_J
+                if is_equilibrium(A, B, x, y):
+                    found.append((x, y))
+    return found
+
+def _pivot(tableau: np.ndarray, basis: List[int], entering: int, slack_cols: List[int]) -> int:
+    """Lexicographic min-ratio pivot; returns the label that leaves the basis."""
+    col = tableau[:, entering]
+    candidates = np.nonzero(col > _TOL)[0]
+    if candidates.size == 0:
+        raise ValueError("unbounded pivot")
+    ratios = tableau[np.ix_(candidates, [tableau.shape[1] - 1] + slack_cols)] / col[candidates, None]
+    ratios = np.round(ratios, 12)
+    # lexicographic argmin over rows of `ratios`
+    order = np.lexsort(ratios.T[::-1])
+    row = int(candidates[order[0]])
+
+    tableau[row] /= tableau[row, entering]
+    for r in range(tableau.shape[0]):
+        if r != row and tableau[r, entering] != 0:
+            tableau[r] -= tableau[r, entering] * tableau[row]
+    leaving = basis[row]
+    basis[row] = entering
+    return leaving
+
+def lemke_howson(A: np.ndarray, B: np.ndarray, dropped_label: int = 0,
+                 max_pivots: Optional[int] = None) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    One equilibrium by complementary pivoting, starting by dropping `dropped_label`
+    (labels 0..m-1 are row strategies, m..m+n-1 column strategies).
+    Returns None if the path does not close within `max_pivots` pivots.
+    """
+    m, n = A.shape
+    # both polytopes need strictly positive payoffs
+    A = A - A.min() + 1.0
+    B = B - B.min() + 1.0
+
+    # P = {x : B^T x <= 1, x >= 0}: columns are labels 0..m+n-1 (x, then slacks) + rhs
+    row_tab = np.hstack([B.T, np.eye(n), np.ones((n, 1))])
+    row_basis = list(range(m, m + n))
+    # Q = {y : A y <= 1, y >= 0}: columns are labels 0..m+n-1 (slacks, then y) + rhs
+    col_tab = np.hstack([np.eye(m), A, np.ones((m, 1))])
+    col_basis = list(range(m))
+    row_slacks = list(range(m, m + n))
+    col_slacks = list(range(m))
+
+    max_pivots = max_pivots or 10 * (m + n) ** 2
+    # the dropped label enters the tableau where it is currently non-basic
+    in_row = dropped_label < m
+    entering = dropped_label
+    for _ in range(max_pivots):
+        if in_row:
+            leaving = _pivot(row_tab, row_basis, entering, row_slacks)
+        else:
+            leaving = _pivot(col_tab, col_basis, entering, col_slacks)
+        if leaving == dropped_label:
+            break
+        entering = leaving
+        in_row = not in_row
+    else:
+        return None
+
+    x = np.zeros(m)
+    for r, label in enumerate(row_basis):
+        if label < m:
+            x[label] = row_tab[r, -1]
+    y = np.zeros(n)
+    for r, label in enumerate(col_basis):
+        if label >= m:
+            y[label - m] = col_tab[r, -1]
+    if x.sum() <= 0 or y.sum() <= 0:
+        return None
+    return x / x.sum(), y / y.sum()
+
+def find_mixed_equilibria(payoff, support_enum_max: int = SUPPORT_ENUM_MAX) -> Dict[str, Any]:
+    """
+    Mixed Nash equilibria of a bimatrix game payoff[i][j] = [u_row, u_col].
+    Strictly dominated strategies are eliminated iteratively first (this never
+    removes an equilibrium).
+    Small reduced games are solved by support enumeration (all equilibria of a
+    nondegenerate game); larger ones by Lemke-Howson from every starting label,
+    which finds at least one equilibrium and usually several.
+    """
+    A_full, B_full = _split_payoffs(payoff)
+    m, n = A_full.shape
+    reduction = eliminate_dominated(np.stack([A_full, B_full], axis=-1))
+    rows = [r - 1 for r in reduction["rows"]]
+    cols = [c - 1 for c in reduction["cols"]]
+    A = A_full[np.ix_(rows, cols)]
+    B = B_full[np.ix_(rows, cols)]
+
+    if max(A.shape) <= support_enum_max:
+        method = "support_enumeration"
+        candidates = support_enumeration(A, B)
+    else:
+        method = "lemke_howson"
+        candidates = []
+        for label in range(sum(A.shape)):
+            res = lemke_howson(A, B, label)
+            if res is not None:
+                candidates.append(res)
+
+    equilibria = []
+    seen = set()
+    for x_red, y_red in candidates:
+        x = np.zeros(m)
+        y = np.zeros(n)
+        x[rows] = x_red
+        y[cols] = y_red
+        if not is_equilibrium(A_full, B_full, x, y):
+            continue
+        key = tuple(np.round(np.concatenate([x, y]), 6))
+        if key in seen:
+            continue
+        seen.add(key)
+        equilibria.append({
+            "row_strategy": [round(float(p), 6) for p in x],
+            "col_strategy": [round(float(q), 6) for q in y],
+            "row_payoff": round(float(x @ A_full @ y), 6),
+            "col_payoff": round(float(x @ B_full @ y), 6),
+            # 1-based, like pure equilibria elsewhere
+            "support_rows": [int(i) + 1 for i in np.nonzero(x > _TOL)[0]],
+            "support_cols": [int(j) + 1 for j in np.nonzero(y > _TOL)[0]],
+            "is_pure": int((x > _TOL).sum()) == 1 and int((y > _TOL).sum()) == 1,
+        })
+
+    return {
+        "method": method,
+        "equilibria": equilibria,
+        "reduced_rows": reduction["rows"],
+        "reduced_cols": reduction["cols"],
+        "elimination_order": reduction["order"],
+    }
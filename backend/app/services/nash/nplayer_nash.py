@@ -0,0 +1,201 @@
+import re
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# An N-player game is a tensor U of shape (s_1, ..., s_N, N): U[a_1, ..., a_N, p] is
+# the payoff of player p in the profile (a_1, ..., a_N). It is stored in questions
+# as "payoff_flat" (row-major) + "shape" instead of N levels of nested lists.
+
+QUESTION_TYPE = "normal_form_game_nplayer"
+
+_NO_RE = re.compile(r'^\s*(n|no|nu)\b')
+_YES_RE = re.compile(r'\b(da|yes|y|true)\b')
+_GROUP_RE = re.compile(r'\(([^()]*)\)')
+_NUMBER_RE = re.compile(r'\d+')
+
+def _player_axes(U: np.ndarray) -> Tuple[int, int]:
+    """(number of players, axis of player 0); leading axes before it are a batch."""
+    players = U.shape[-1]
+    return players, U.ndim - 1 - players
+
+def pure_nash_mask(U: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask over profiles: a profile is a pure NE iff every player's payoff
+    attains the maximum along that player's own axis (one max reduction per player).
+    """
+    players, first = _player_axes(U)
+    mask = np.ones(U.shape[:-1], dtype=bool)
+    for p in range(players):
+        u = U[..., p]
+        mask &= u == u.max(axis=first + p, keepdims=True)
+    return mask
+
+def find_pure_nash(U: np.ndarray) -> List[Tuple[int, ...]]:
+    """Pure NE of a single game as 1-based strategy profiles."""
+    return [tuple(int(a) + 1 for a in profile) for profile in np.argwhere(pure_nash_mask(U))]
+
+def payoff_tensor(data: Dict[str, Any]) -> np.ndarray:
+    """Rebuild the payoff tensor stored in question data."""
+    shape = tuple(int(s) for s in data.get("shape") or ())
+    flat = data.get("payoff_flat")
+    if not shape or flat is None:
+        raise ValueError("question has no payoff tensor")
+    U = np.asarray(flat)
+    if U.size != int(np.prod(shape)) or shape[-1] != len(shape) - 1:
+        raise ValueError("payoff_flat does not match shape")
+    return U.reshape(shape)
+
+def _question_dict(U: np.ndarray) -> Dict[str, Any]:
+    strategies = list(U.shape[:-1])
+    players = len(strategies)
+    equilibria = [list(p) for p in find_pure_nash(U)]
+    size = "x".join(str(s) for s in strategies)
+    return {
+        "id": str(uuid.uuid4()),
+        "type": QUESTION_TYPE,
+        "prompt": (
+            f"Pentru jocul cu {players} jucători ({size} strategii), există echilibru Nash pur? "
+            f"Indicați Da/Nu și, dacă Da, profilurile (a1,...,a{players}) 1-based."
+        ),
+        "players": players,
+        "strategies": strategies,
+        "shape": list(U.shape),
+        "payoff_flat": U.ravel().tolist(),
+        "equilibria": equilibria,
+    }
+
+def generate_nplayer_batch(count: int = 1, difficulty: Optional[str] = "medium",
+                           low: int = -5, high: int = 10) -> List[Dict[str, Any]]:
+    """All games of one size are drawn as a single tensor and masked at once."""
+    if difficulty == "easy":
+        possible_shapes = [(2, 2, 2)]
+    elif difficulty == "hard":
+        possible_shapes = [(3, 3, 3, 3), (2, 3, 2, 3), (4, 4, 4)]
+    else:
+        possible_shapes = [(3, 3, 3), (2, 3, 4), (2, 2, 2, 2)]
+
+    rng = np.random.default_rng()
+    picks = rng.integers(0, len(possible_shapes), count)
+    results: List[Optional[Dict[str, Any]]] = [None] * count
+    for shape_idx in np.unique(picks):
+        positions = np.nonzero(picks == shape_idx)[0]
+        strategies = possible_shapes[shape_idx]
+        stack = rng.integers(low, high + 1, size=(len(positions), *strategies, len(strategies)))
+        for pos, U in zip(positions, stack):
+            results[pos] = _question_dict(U)
+    return results
+
+def strategy_counts(data: Dict[str, Any]) -> Optional[Tuple[int, ...]]:
+    """(s_1, ..., s_N) of a stored question, or None if the shape is missing or malformed."""
+    shape = data.get("shape") or ()
+    try:
+        return tuple(int(s) for s in shape[:-1]) if shape else None
+    except (TypeError, ValueError):
+        return None
+
+def profile_limit(data: Dict[str, Any]) -> Optional[int]:
+    """Number of pure profiles of a stored question (s_1 * ... * s_N), the most an answer can list."""
+    counts = strategy_counts(data)
+    return int(np.prod(counts)) if counts else None
+
+def parse_profiles(text: str, players: int, strategies: Optional[Sequence[int]] = None) -> Dict[str, Any]:
+    """
+    Parse "Nu" / "Da (1,2,1) (2,2,1)"; only tuples with exactly `players` entries
+    count, each listed once. With strategies=(s_1, ..., s_N) (see strategy_counts)
+    scanning stops once every profile with coordinates in 1..s_i was read; repeated
+    or out-of-range tuples (e.g. quoted payoffs) do not count toward that.
+    """
+    t = (text or "").strip()
+    lower = t.lower()
+    if not t or _NO_RE.match(lower):
+        return {"has_equilibrium": False, "equilibria": []}
+    limit = int(np.prod(strategies)) if strategies and len(strategies) == players else None
+    profiles: Dict[Tuple[int, ...], None] = {}
+    in_range = 0
+    for group in _GROUP_RE.finditer(t):
+        numbers = _NUMBER_RE.findall(group.group(1))
+        if len(numbers) != players:
+            continue
+        profile = tuple(int(x) for x in numbers)
+        if profile in profiles:
+            continue
+        profiles[profile] = None
+        if limit is not None and all(1 <= a <= s for a, s in zip(profile, strategies)):
+            in_range += 1
+            if in_range >= limit:
+                break
+    has_yes = bool(_YES_RE.search(lower))
+    return {"has_equilibrium": has_yes or bool(profiles), "equilibria": list(profiles)}
+
+def _deviation_reason(U: np.ndarray, profile: Sequence[int]) -> Optional[str]:
+    """Why a (0-based) profile is not an equilibrium, or None if it is one."""
+    players = U.shape[-1]
+    for p in range(players):
+        index = list(profile)
+        index[p] = slice(None)
+        along = U[tuple(index) + (p,)]
+        best = int(along.argmax())
+        if along[best] > U[tuple(profile) + (p,)]:
+            return (
+                f"Jucătorul {p + 1} ar prefera strategia {best + 1} "
+                f"(câștig {along[best]} > {U[tuple(profile) + (p,)]})"
+            )
+    return None
+
+def evaluate_nplayer(question: Dict[str, Any], provided_has: bool,
+                     provided: Sequence[Sequence[int]]) -> Dict[str, Any]:
+    """
+    Same scoring as evaluate_normal_form: fraction of true equilibria found minus
+    0.25 per wrong profile; "Nu" is only correct when no pure equilibrium exists.
+    """
+    U = payoff_tensor(question)
+    strategies = U.shape[:-1]
+    true_set = set(find_pure_nash(U))
+    prov_set = set(tuple(int(a) for a in p) for p in provided)
+
+    matched = sorted(true_set & prov_set)
+    missing = sorted(true_set - prov_set)
+    extra = sorted(prov_set - true_set)
+    result = {
+        "is_there": bool(true_set),
+        "provided_has": provided_has,
+        "provided_equilibria": sorted(prov_set),
+        "matched_equilibria": matched,
+        "missing_equilibria": missing,
+        "extra_equilibria": extra,
+        "correct_equilibria": sorted(true_set),
+    }
+
+    if not true_set:
+        correct = not provided_has
+        result["score_percent"] = 100.0 if correct else 0.0
+        result["note"] = "Corect: nu există echilibru pur." if correct else "Greșit: nu există echilibru pur, ai spus că există."
+        return result
+    if not prov_set:
+        result["score_percent"] = 0.0
+        result["note"] = "Greșit: există echilibru pur, ai spus Nu." if not provided_has else "Ai spus că există dar nu ai furnizat niciun profil."
+        return result
+
+    score_fraction = max(0.0, min(1.0, len(matched) / len(true_set) - 0.25 * len(extra)))
+    result["score_percent"] = round(score_fraction * 100.0, 2)
+    if not matched:
+        result["note"] = "Greșit: nu ai identificat niciun echilibru corect."
+    elif missing:
+        result["note"] = "Partial: ai identificat unele echilibria corecte."
+    elif extra:
+        result["note"] = "Partial: ai identificat toate echilibria dar ai adăugat profile greșite (penalizare)."
+    else:
+        result["note"] = "Corect: ai identificat toate echilibria pure."
+
+    lines = []
+    for profile in extra:
+        label = "(" + ",".join(str(a) for a in profile) + ")"
+        if len(profile) != len(strategies) or any(not 1 <= a <= s for a, s in zip(profile, strategies)):
+            lines.append(f"- {label}: Profil inexistent în joc.")
+        else:
+            lines.append(f"- {label}: Nu este echilibru. {_deviation_reason(U, [a - 1 for a in profile])}.")
+    if lines:
+        result["explanation"] = "De ce sunt greșite celelalte profiluri:\n" + "\n".join(lines)
+    return result
@@ -0,0 +1,122 @@
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from fastapi import UploadFile
+
+from app.config import settings
+
+_CHUNK_SIZE = 64 * 1024
+_CACHE_SIZE = 128
+
+# Extracted text by SHA-256 of the uploaded bytes
+_text_cache: "OrderedDict[str, str]" = OrderedDict()
+# Created on first use with the spawn start method (forking would copy the
+# server's threads, e.g. the question pool); replaced when a worker dies.
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+class PdfLimitError(ValueError):
+    """The upload exceeds the configured byte or page limit."""
+
+class PdfExtractError(RuntimeError):
+    """Extraction did not finish: a worker crashed or PDF_TIMEOUT passed."""
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=settings.PDF_WORKERS,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+def _discard_pool(pool: ProcessPoolExecutor, kill: bool = False) -> None:
+    """Drop a broken or stuck pool so the next extraction starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    if kill:
+        # a worker stuck on a hostile PDF would otherwise keep its slot forever
+        for proc in list((getattr(pool, "_processes", None) or {}).values()):
+            proc.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def shutdown_pool() -> None:
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        _discard_pool(pool)
+
+async def _run_extraction(path: str) -> str:
+    """
+    _extract_pages in the pool within PDF_TIMEOUT. A pool broken by a crashed
+    worker is replaced and the extraction retried once; a timeout kills the pool.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = _get_pool()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(pool, _extract_pages, path, settings.PDF_MAX_PAGES),
+                timeout=settings.PDF_TIMEOUT,
+            )
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            if attempt:
+                raise PdfExtractError("PDF extraction worker crashed")
+        except asyncio.TimeoutError:
+            _discard_pool(pool, kill=True)
+            raise PdfExtractError(f"PDF extraction took longer than {settings.PDF_TIMEOUT} seconds")
+
+def _extract_pages(path: str, max_pages: int) -> str:
+    """Worker entry point: parsing runs in another process, off the event loop."""
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(path)
+    if len(reader.pages) > max_pages:
+        raise PdfLimitError(f"PDF has {len(reader.pages)} pages, the limit is {max_pages}")
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+async def extract_pdf_text(upload: UploadFile) -> str:
+    """
+    Stream the upload to a temporary file while hashing it, then extract the text
+    in the process pool. Re-uploads of the same bytes are answered from the cache.
+    Raises PdfLimitError when PDF_MAX_BYTES or PDF_MAX_PAGES is exceeded and
+    PdfExtractError when the worker crashes twice or PDF_TIMEOUT passes.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            while True:
+                chunk = await upload.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > settings.PDF_MAX_BYTES:
+                    raise PdfLimitError(f"PDF is larger than {settings.PDF_MAX_BYTES} bytes")
+                digest.update(chunk)
+                tmp.write(chunk)
+
+        key = digest.hexdigest()
+        cached = _text_cache.get(key)
+        if cached is not None:
+            _text_cache.move_to_end(key)
+            return cached
+
+        text = await _run_extraction(path)
+        _text_cache[key] = text
+        while len(_text_cache) > _CACHE_SIZE:
+            _text_cache.popitem(last=False)
+        return text
+    finally:
+        os.unlink(path)
@@ -64,25 +64,21 @@ def evaluate_custom_submission(
         * if student provided claimed equilibria: check match -> 100/0
         * if student did not provide claimed equilibria: give 75% (partial)
     """
-    # Basic validation (shape)
-    if not isinstance(submission_matrix, list) or not submission_matrix:
-        raise ValueError("submission_matrix must be a non-empty list of rows")
-    m = len(submission_matrix)
-    n = len(submission_matrix[0])
-    for row in submission_matrix:
-        if not isinstance(row, list) or len(row) != n:
-            raise ValueError("All rows must be lists of the same length")
-        for cell in row:
-            if not (isinstance(cell, (list, tuple)) and len(cell) == 2):
-                raise ValueError("Each cell must be a pair [row_payoff, col_payoff]")
+    # Single validation + conversion; the array is what analysis works on
+    try:
+        payoff = generator_custom_nash.payoff_array(submission_matrix)
+    except ValueError as e:
+        raise ValueError(f"submission_matrix: {e}")
+    m, n = payoff.shape[:2]
 
-    # Compute analysis using common generator analyze_matrix helper
-    analysis = generator_custom_nash.analyze_matrix(submission_matrix)
-    computed_eq = analysis.get("equilibria") or []
-    computed_set = _normalize_equilibria(computed_eq)
+    analysis = generator_custom_nash.analyze_matrix(payoff)
+    # analysis equilibria are already (int, int) tuples: only the claims need normalizing
+    computed_set = set(analysis.get("equilibria") or [])
     claimed_set = _normalize_equilibria(claimed_equilibria)
 
-    matched, missing, extra = _eq_sets(computed_eq, claimed_equilibria)
+    matched = sorted(computed_set & claimed_set)
+    missing = sorted(computed_set - claimed_set)
+    extra = sorted(claimed_set - computed_set)
 
     # get target requirement from question data
     if isinstance(question, dict):
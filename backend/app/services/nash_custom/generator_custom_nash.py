@@ -1,7 +1,12 @@
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Union
 import random
 import uuid
-from app.services.nash.generator_nash import _find_pure_nash  # folosit pentru validare internă
+import numpy as np
+from app.services.nash.generator_nash import _find_pure_nash, _planted_payoffs, _random_equilibrium_count  # folosit pentru validare internă
+from app.services.nash.mixed_nash import find_mixed_equilibria
+from app.services.nash.approx_nash import approximate_equilibrium
+from app.services.gametheory.dominance_gametheory import _eliminate
+from app.services.analysis_cache import cached_analysis
 
 def _random_matrix(m: int, n: int, low: int = -2, high: int = 5) -> List[List[List[int]]]:
     mat = []
@@ -14,15 +19,14 @@ def _random_matrix(m: int, n: int, low: int = -2, high: int = 5) -> List[List[Li
         mat.append(row)
     return mat
 
-def _generate_matrix_with_condition(m: int, n: int, want_has_pure: Optional[bool], max_tries: int = 200):
-    for _ in range(max_tries):
-        mat = _random_matrix(m, n)
-        equilibria = _find_pure_nash(mat) or []
-        has = bool(equilibria)
-        if want_has_pure is None or want_has_pure == has:
-            return mat, equilibria
-    # fallback: return last generated
-    mat = _random_matrix(m, n)
+def _generate_matrix_with_condition(m: int, n: int, want_has_pure: Optional[bool], low: int = -2, high: int = 5):
+    # construit direct (fără încercări repetate), deci condiția este mereu respectată
+    if want_has_pure is None:
+        mat = _random_matrix(m, n, low=low, high=high)
+    elif want_has_pure:
+        mat = _planted_payoffs(m, n, _random_equilibrium_count(m, n), low=low, high=high)
+    else:
+        mat = _planted_payoffs(m, n, 0, low=low, high=high)
     equilibria = _find_pure_nash(mat) or []
     return mat, equilibria
 
@@ -111,50 +115,138 @@ def generate_batch(
 
     return qdatas
 
-def analyze_matrix(payoff: List[List[List[int]]]) -> Dict[str, Any]:
-    # Basic shape validation
+def _describe_shape_error(payoff: Any) -> str:
+    """Failure path only: say precisely what is wrong with a submitted matrix."""
     if not isinstance(payoff, list) or not payoff:
-        raise ValueError("payoff must be a non-empty list of rows")
-    m = len(payoff)
-    n = len(payoff[0])
-    for row in payoff:
-        if not isinstance(row, list) or len(row) != n:
-            raise ValueError("all rows must be lists of same length")
-        for cell in row:
+        return "payoff must be a non-empty list of rows"
+    n = len(payoff[0]) if isinstance(payoff[0], list) else -1
+    for i, row in enumerate(payoff, start=1):
+        if not isinstance(row, list) or len(row) != n or n == 0:
+            return f"all rows must be non-empty lists of same length (row {i})"
+        for j, cell in enumerate(row, start=1):
             if not (isinstance(cell, (list, tuple)) and len(cell) == 2):
-                raise ValueError("each cell must be a pair [row_payoff, col_payoff]")
+                return f"each cell must be a pair [row_payoff, col_payoff] (cell {i},{j})"
+            if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in cell):
+                return f"payoffs must be numbers (cell {i},{j})"
+    return "invalid payoff matrix"
+
+def payoff_array(payoff: Any) -> np.ndarray:
+    """
+    Validate a submitted matrix payoff[i][j] = [u_row, u_col] and convert it to an
+    (m, n, 2) array in one step. The conversion itself checks the shape; the
+    cell-by-cell walk only runs to build the error message.
+    """
+    if isinstance(payoff, np.ndarray):
+        arr = payoff
+    else:
+        try:
+            arr = np.asarray(payoff)
+        except ValueError:
+            # ragged nesting
+            raise ValueError(_describe_shape_error(payoff))
+    if arr.ndim != 3 or arr.shape[0] == 0 or arr.shape[1] == 0 or arr.shape[2] != 2 \
+            or arr.dtype.kind not in "iuf":
+        raise ValueError(_describe_shape_error(payoff))
+    return arr
 
-    # _find_pure_nash should return list of tuples indicating equilibria (1-based if your other code expects it);
-    equilibria = _find_pure_nash(payoff) or []
+# peste acest număr de celule nu mai listăm ordinea eliminării (O(runde * m^2 * n))
+_ELIMINATION_MAX_CELLS = 400
+
+def _pure_nash_core(arr: np.ndarray) -> Dict[str, Any]:
+    # echilibrele pure se citesc direct din matrice, O(m*n); eliminarea iterată a
+    # strategiilor strict dominate nu schimbă mulțimea lor, așa că o rulăm doar
+    # pentru justificare, la jocuri mici
+    equilibria = sorted(_find_pure_nash(arr) or [])
+    m, n = arr.shape[:2]
+    order = _eliminate(arr, weak=False)[2] if m * n <= _ELIMINATION_MAX_CELLS else []
+    return {"equilibria": equilibria, "elimination_order": order}
+
+def analyze_matrix(payoff: Union[List[List[List[int]]], np.ndarray]) -> Dict[str, Any]:
+    """Pure-strategy analysis; takes the nested-list payload or an array from payoff_array."""
+    arr = payoff_array(payoff)
+    m, n = arr.shape[:2]
+
+    core = cached_analysis("pure_nash", arr, _pure_nash_core)
+    equilibria, order = core["equilibria"], core["elimination_order"]
     has_pure = bool(equilibria)
 
     justification_lines = []
+    if order:
+        justification_lines.append(
+            "Strategii strict dominate eliminate: " + ", ".join(
+                f"{'R' if step['player'] == 'row' else 'C'}{step['strategy']} "
+                f"(de {'R' if step['player'] == 'row' else 'C'}{step['dominated_by']})"
+                for step in order
+            ) + "."
+        )
+    elif m * n > _ELIMINATION_MAX_CELLS:
+        justification_lines.append("Eliminarea strategiilor dominate nu este listată pentru jocuri mari; echilibrele sunt căutate direct.")
     if not has_pure:
         justification_lines.append("Nu există echilibru Nash pur: pentru fiecare celulă, cel puțin un jucător poate îmbunătăți unilateral.")
     else:
-        # defensive: ensure equilibria are tuples of ints
-        try:
-            eqs = [(int(r), int(c)) for (r, c) in equilibria]
-        except Exception:
-            eqs = equilibria
-        justification_lines.append(f"Au fost găsite {len(eqs)} echilibr(ia): " + ", ".join(f"({r},{c})" for r,c in eqs))
+        justification_lines.append(f"Au fost găsite {len(equilibria)} echilibr(ia): " + ", ".join(f"({r},{c})" for r, c in equilibria))
         # build brief rationale per equilibrium
-        for (r, c) in eqs:
-            i = r - 1
-            j = c - 1
-            if 0 <= i < m and 0 <= j < n:
-                u_row = payoff[i][j][0]
-                u_col = payoff[i][j][1]
-                col_row_vals = [payoff[k][j][0] for k in range(m)]
-                row_col_vals = [payoff[i][l][1] for l in range(n)]
-                justification_lines.append(
-                    f"Pentru profil ({r},{c}): row payoff={u_row} vs col-values {col_row_vals}; col payoff={u_col} vs row-values {row_col_vals}."
-                )
+        for (r, c) in equilibria:
+            u_row, u_col = arr[r - 1, c - 1].tolist()
+            col_row_vals = arr[:, c - 1, 0].tolist()
+            row_col_vals = arr[r - 1, :, 1].tolist()
+            justification_lines.append(
+                f"Pentru profil ({r},{c}): row payoff={u_row} vs col-values {col_row_vals}; col payoff={u_col} vs row-values {row_col_vals}."
+            )
 
     return {
         "has_pure_nash": has_pure,
         "equilibria": equilibria,
         "justification": "\n".join(justification_lines),
+        "elimination_order": order,
         "rows": m,
         "cols": n,
-    }
\ No newline at end of file
+    }
+
+def analyze_matrix_mixed(payoff: Union[List[List[List[int]]], np.ndarray]) -> Dict[str, Any]:
+    """Analiză în strategii mixte: echilibrele Nash mixte (inclusiv cele pure) ale jocului."""
+    arr = payoff_array(payoff)
+    m, n = arr.shape[:2]
+    result = find_mixed_equilibria(arr)
+    equilibria = result["equilibria"]
+
+    justification_lines = []
+    if len(result["reduced_rows"]) < m or len(result["reduced_cols"]) < n:
+        justification_lines.append(
+            f"După eliminarea strategiilor strict dominate rămân liniile {result['reduced_rows']} "
+            f"și coloanele {result['reduced_cols']}."
+        )
+    justification_lines.append(f"Au fost găsite {len(equilibria)} echilibr(ia) în strategii mixte ({result['method']}).")
+    for eq in equilibria:
+        justification_lines.append(
+            f"x={eq['row_strategy']}, y={eq['col_strategy']}: payoff așteptat ({eq['row_payoff']}, {eq['col_payoff']}); "
+            f"fiecare jucător este indiferent între strategiile din suport și nu câștigă deviind."
+        )
+
+    return {
+        "has_pure_nash": any(eq["is_pure"] for eq in equilibria),
+        "mixed_equilibria": equilibria,
+        "method": result["method"],
+        "reduced_rows": result["reduced_rows"],
+        "reduced_cols": result["reduced_cols"],
+        "elimination_order": result["elimination_order"],
+        "justification": "\n".join(justification_lines),
+        "rows": m,
+        "cols": n,
+    }
+
+def analyze_matrix_approx(payoff: Union[List[List[List[int]]], np.ndarray], method: str = "regret_matching",
+                          max_iterations: int = 10000, time_budget_ms: Optional[int] = 1000,
+                          target_epsilon: float = 1e-3) -> Dict[str, Any]:
+    """Echilibru aproximativ (epsilon-echilibru) pentru jocuri prea mari pentru metodele exacte."""
+    arr = payoff_array(payoff)
+    m, n = arr.shape[:2]
+    result = approximate_equilibrium(arr, method, max_iterations, time_budget_ms, target_epsilon)
+
+    justification = (
+        f"{result['method']}: {result['iterations']} iterații în {result['elapsed_ms']} ms. "
+        f"Niciun jucător nu câștigă mai mult de {result['epsilon']} deviind unilateral "
+        f"(epsilon-echilibru{'' if result['converged'] else ', ținta nu a fost atinsă în bugetul dat'})."
+    )
+    return {**result, "justification": justification, "rows": m, "cols": n}
+
@@ -0,0 +1,91 @@
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Open editor sessions (least recently used first)
+_MAX_SESSIONS = 256
+# largest editable matrix (rows and cols); sessions are kept in memory
+MAX_EDITOR_SIZE = 50
+_sessions: "OrderedDict[str, IncrementalNashAnalyzer]" = OrderedDict()
+# sync endpoints run in a thread pool: creation, lookup and eviction share this lock
+_sessions_lock = threading.Lock()
+
+class IncrementalNashAnalyzer:
+    """
+    Pure-equilibrium set of a matrix under single-cell edits. Keeps the row
+    player's best payoff per column and the column player's best payoff per row;
+    a cell edit can only change those two maxima, so only the cells of that column
+    and that row are re-checked: O(m + n) per edit instead of O(m * n).
+    """
+
+    def __init__(self, payoff: np.ndarray, target_has_pure: Optional[bool] = None):
+        self.payoff = np.array(payoff, dtype=float)
+        self.target_has_pure = target_has_pure
+        m, n = self.payoff.shape[:2]
+        self.m, self.n = m, n
+        self.col_best = self.payoff[..., 0].max(axis=0)  # best u_row in each column
+        self.row_best = self.payoff[..., 1].max(axis=1)  # best u_col in each row
+        mask = (self.payoff[..., 0] == self.col_best[None, :]) & (self.payoff[..., 1] == self.row_best[:, None])
+        self.equilibria = {(int(i), int(j)) for i, j in np.argwhere(mask)}
+
+    def _is_equilibrium(self, i: int, j: int) -> bool:
+        return self.payoff[i, j, 0] == self.col_best[j] and self.payoff[i, j, 1] == self.row_best[i]
+
+    def set_cell(self, i: int, j: int, u_row: float, u_col: float) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Edit cell (i, j) (0-based); returns (added, removed) equilibria, 1-based."""
+        if not (0 <= i < self.m and 0 <= j < self.n):
+            raise ValueError(f"cell ({i + 1},{j + 1}) is outside the {self.m}x{self.n} matrix")
+        self.payoff[i, j] = (u_row, u_col)
+        self.col_best[j] = self.payoff[:, j, 0].max()
+        self.row_best[i] = self.payoff[i, :, 1].max()
+
+        added, removed = [], []
+        affected = [(k, j) for k in range(self.m)] + [(i, l) for l in range(self.n) if l != j]
+        for cell in affected:
+            now = self._is_equilibrium(*cell)
+            before = cell in self.equilibria
+            if now and not before:
+                self.equilibria.add(cell)
+                added.append((cell[0] + 1, cell[1] + 1))
+            elif before and not now:
+                self.equilibria.discard(cell)
+                removed.append((cell[0] + 1, cell[1] + 1))
+        return sorted(added), sorted(removed)
+
+    def state(self) -> Dict[str, Any]:
+        has_pure = bool(self.equilibria)
+        return {
+            "rows": self.m,
+            "cols": self.n,
+            "has_pure_nash": has_pure,
+            "equilibria": sorted((i + 1, j + 1) for i, j in self.equilibria),
+            "meets_target": None if self.target_has_pure is None else has_pure == self.target_has_pure,
+        }
+
+def check_editor_size(rows: int, cols: int) -> None:
+    if not (0 < rows <= MAX_EDITOR_SIZE and 0 < cols <= MAX_EDITOR_SIZE):
+        raise ValueError(f"rows and cols must be between 1 and {MAX_EDITOR_SIZE}")
+
+def open_session(payoff: np.ndarray, target_has_pure: Optional[bool] = None) -> Tuple[str, IncrementalNashAnalyzer]:
+    check_editor_size(*np.shape(payoff)[:2])
+    session_id = str(uuid.uuid4())
+    analyzer = IncrementalNashAnalyzer(payoff, target_has_pure)
+    with _sessions_lock:
+        _sessions[session_id] = analyzer
+        while len(_sessions) > _MAX_SESSIONS:
+            _sessions.popitem(last=False)
+    return session_id, analyzer
+
+def get_session(session_id: str) -> Optional[IncrementalNashAnalyzer]:
+    with _sessions_lock:
+        analyzer = _sessions.get(session_id)
+        if analyzer is not None:
+            _sessions.move_to_end(session_id)
+    return analyzer
+
+def close_session(session_id: str) -> bool:
+    with _sessions_lock:
+        return _sessions.pop(session_id, None) is not None
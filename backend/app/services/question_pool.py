@@ -0,0 +1,127 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from app.config import settings
+
+# producer(difficulty, ensure, count) -> list of generated (and solved) questions
+Producer = Callable[[Optional[str], str, int], List[Any]]
+BucketKey = Tuple[str, Optional[str], str]
+# longest pause between refill attempts of a failing bucket (seconds)
+_MAX_BACKOFF = 300.0
+
+class QuestionPool:
+    """
+    Stock of pre-generated questions per (type, difficulty, ensure) bucket.
+    Routers register a producer per question type at import time and serve
+    /generate with take(); a daemon thread tops every bucket back up to
+    QUESTION_POOL_SIZE in the background. When a bucket runs dry (or the pool is
+    disabled) take() falls back to generating the missing items in the request.
+    """
+
+    def __init__(self):
+        self._producers: Dict[str, Producer] = {}
+        self._buckets: Dict[BucketKey, Deque[Any]] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # bucket -> (consecutive failures, monotonic time before which it is not retried)
+        self._backoff: Dict[BucketKey, Tuple[int, float]] = {}
+
+    def register(self, kind: str, producer: Producer,
+                 difficulties: Iterable[Optional[str]] = (None,), ensures: Iterable[str] = ("any",)) -> None:
+        """Register the producer for `kind` and the buckets to keep stocked from startup."""
+        with self._lock:
+            self._producers[kind] = producer
+            for difficulty in difficulties:
+                for ensure in ensures:
+                    self._buckets.setdefault((kind, difficulty, ensure), deque())
+        self._wake.set()
+
+    def take(self, kind: str, count: int = 1, difficulty: Optional[str] = None, ensure: str = "any") -> List[Any]:
+        """Pop `count` questions, generating synchronously whatever the bucket lacks."""
+        producer = self._producers[kind]
+        key = (kind, difficulty, ensure)
+        taken: List[Any] = []
+        if settings.QUESTION_POOL_ENABLED:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                while bucket and len(taken) < count:
+                    taken.append(bucket.popleft())
+        if len(taken) < count:
+            # unregistered buckets (e.g. an unknown difficulty) are always generated here
+            taken.extend(producer(difficulty, ensure, count - len(taken)))
+        self._wake.set()
+        return taken
+
+    def discard(self, kind: str) -> None:
+        """Drop the stocked questions of `kind` (e.g. after its source data changed); refilled in the background."""
+        with self._lock:
+            for key, bucket in self._buckets.items():
+                if key[0] == kind:
+                    bucket.clear()
+        self._wake.set()
+
+    def stock(self) -> Dict[str, int]:
+        with self._lock:
+            return {"/".join(str(part) for part in key): len(bucket) for key, bucket in self._buckets.items()}
+
+    def start(self) -> None:
+        if not settings.QUESTION_POOL_ENABLED or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="question-pool", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            still_short = self._refill_once()
+            if not still_short:
+                self._wake.wait(settings.QUESTION_POOL_INTERVAL)
+                self._wake.clear()
+
+    def _refill_once(self) -> bool:
+        """One pass over the buckets, at most QUESTION_POOL_BATCH items each; True if any is still short."""
+        size = settings.QUESTION_POOL_SIZE
+        now = time.monotonic()
+        with self._lock:
+            deficits = [(key, size - len(bucket)) for key, bucket in self._buckets.items()
+                        if len(bucket) < size and self._backoff.get(key, (0, 0.0))[1] <= now]
+        still_short = False
+        for (kind, difficulty, ensure), missing in deficits:
+            if self._stop.is_set():
+                return False
+            batch = min(missing, settings.QUESTION_POOL_BATCH)
+            key = (kind, difficulty, ensure)
+            try:
+                items = self._producers[kind](difficulty, ensure, batch)
+            except ValueError as e:
+                # the producer does not support this slot: stop stocking it
+                print(f"Question pool: dropping {kind}/{difficulty}/{ensure}: {e}")
+                with self._lock:
+                    self._buckets.pop(key, None)
+                    self._backoff.pop(key, None)
+                continue
+            except Exception as e:
+                # transient failure: keep the bucket, retry with exponential backoff
+                with self._lock:
+                    failures = self._backoff.get(key, (0, 0.0))[0] + 1
+                    delay = min(settings.QUESTION_POOL_INTERVAL * 2 ** failures, _MAX_BACKOFF)
+                    self._backoff[key] = (failures, time.monotonic() + delay)
+                print(f"Question pool: refill of {kind}/{difficulty}/{ensure} failed ({failures}x), retry in {delay:.0f}s: {e}")
+                continue
+            with self._lock:
+                self._backoff.pop(key, None)
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.extend(items)
+            still_short = still_short or batch < missing
+        return still_short
+
+question_pool = QuestionPool()
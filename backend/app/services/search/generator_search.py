@@ -1,13 +1,13 @@
 import random
 import uuid
 from typing import List, Dict, Any
-from app.services.search_custom.definitions import SCENARIOS, ProblemScenario
+from app.services.search_custom.catalog import get_catalog
 
 def generate_search_question() -> Dict[str, Any]:
     """
     Generates a dynamic search problem question based on a random scenario.
     """
-    scenario = random.choice(SCENARIOS)
+    scenario = random.choice(get_catalog().scenarios)
     qid = str(uuid.uuid4())
     
     # Build prompt dynamically
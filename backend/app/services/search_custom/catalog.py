@@ -0,0 +1,45 @@
+import threading
+import time
+from typing import Optional, Tuple
+
+from app.config import settings
+from app.services.search_custom.definitions import DEFAULT_SCENARIOS_PATH, ProblemScenario, load_scenarios
+from app.services.search_custom.index import ScenarioIndex
+
+class ScenarioCatalog:
+    """Immutable snapshot: the scenarios and their index, built together at load time."""
+    __slots__ = ("scenarios", "index", "path", "loaded_at")
+
+    def __init__(self, path: str):
+        self.scenarios: Tuple[ProblemScenario, ...] = tuple(load_scenarios(path))
+        self.index = ScenarioIndex(self.scenarios)
+        self.path = path
+        self.loaded_at = time.time()
+
+_reload_lock = threading.Lock()
+_catalog: Optional[ScenarioCatalog] = None
+
+def _catalog_path() -> str:
+    return settings.SEARCH_SCENARIOS_PATH or DEFAULT_SCENARIOS_PATH
+
+def get_catalog() -> ScenarioCatalog:
+    """
+    Current snapshot. Callers take it once per request and keep using it, so a
+    reload never changes the catalog in the middle of a request.
+    """
+    catalog = _catalog
+    if catalog is None:
+        catalog = reload_catalog()
+    return catalog
+
+def reload_catalog(path: Optional[str] = None) -> ScenarioCatalog:
+    """
+    Load and index the catalog off to the side, then swap it in with a single
+    assignment; readers are never blocked. A bad file raises ValueError and
+    leaves the current catalog in place.
+    """
+    global _catalog
+    with _reload_lock:
+        catalog = ScenarioCatalog(path or _catalog_path())
+        _catalog = catalog
+    return catalog
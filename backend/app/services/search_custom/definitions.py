@@ -1,10 +1,26 @@
-from typing import List
+import json
+import os
+import unicodedata
+from typing import Any, Dict, List
+
+# catalogul de scenarii (editabil fără modificări de cod; vezi catalog.reload_catalog)
+DEFAULT_SCENARIOS_PATH = os.path.join(os.path.dirname(__file__), "scenarios.json")
+
+def normalize_text(text: str) -> str:
+    return ''.join(c for c in unicodedata.normalize('NFD', text) if unicodedata.category(c) != 'Mn').lower()
 
 class ProblemScenario:
-    def __init__(self, 
-                 problem_name: str, 
-                 instance_text: str, 
-                 required_strategy: str, 
+    __slots__ = (
+        "problem_name", "instance_text", "required_strategy", "required_heuristic",
+        "prompt_hint", "explanation", "keywords",
+        # normalized once, used by the matcher
+        "norm_name", "norm_instance", "norm_keywords",
+    )
+
+    def __init__(self,
+                 problem_name: str,
+                 instance_text: str,
+                 required_strategy: str,
                  required_heuristic: str,
                  prompt_hint: str,
                  explanation: str,
@@ -16,116 +32,36 @@ class ProblemScenario:
         self.prompt_hint = prompt_hint
         self.explanation = explanation
         self.keywords = keywords if keywords is not None else []
+        self.norm_name = normalize_text(problem_name)
+        self.norm_instance = normalize_text(instance_text)
+        self.norm_keywords = tuple(normalize_text(kw) for kw in self.keywords)
 
-# --- LISTA EXTINSĂ DE SCENARII ---
-SCENARIOS = [
-    # ---------------------------------------------------------
-    # 1. GENERALIZED HANOI & PATHFINDING (A* vs Greedy vs BFS)
-    # ---------------------------------------------------------
-    ProblemScenario(
-        problem_name="Generalized Hanoi",
-        instance_text="Mutarea discurilor între tije cu număr minim de mutări.",
-        required_strategy="A*",
-        required_heuristic="Admisibilă",
-        prompt_hint="Se caută o soluție optimă (număr minim de pași) într-un timp rezonabil.",
-        explanation="A* garantează găsirea drumului optim dacă euristica este admisibilă (nu supraestimează niciodată costul real).",
-        keywords=["hanoi", "turnuri", "tije", "discuri", "towers", "mutari", "steps"]
-    ),
-    ProblemScenario(
-        problem_name="Generalized Hanoi",
-        instance_text="Găsirea unei soluții valide rapid, fără garanția optimului.",
-        required_strategy="Greedy Best-First",
-        required_heuristic="Informată", 
-        prompt_hint="Se dorește o soluție cât mai rapidă; nu contează dacă facem câteva mutări în plus.",
-        explanation="Greedy expandează starea care pare cea mai aproape de final. Este rapidă, dar poate fi prinsă în bucle sau poate găsi soluții neoptimale (similar cu DFS în worst-case).",
-        keywords=["hanoi", "turnuri", "rapid", "fast", "fara garantie"]
-    ),
-    ProblemScenario(
-        problem_name="Generalized Hanoi",
-        instance_text="Spațiul stărilor este mic, se cere drumul optim, dar nu avem o euristică bună.",
-        required_strategy="BFS (Breadth First Search)",
-        required_heuristic="Niciuna (Neinformată)",
-        prompt_hint="Strategie neinformată care garantează drumul cel mai scurt.",
-        explanation="În lipsa unei euristici, BFS este singura strategie neinformată care garantează soluția optimă (drumul cel mai scurt), deși consumă multă memorie.",
-        keywords=["hanoi", "turnuri", "fara euraristica", "mic", "small"]
-    ),
-
-    # ---------------------------------------------------------
-    # 2. N-QUEENS & LOCAL SEARCH (Hill Climbing, Sim. Annealing)
-    # ---------------------------------------------------------
-    ProblemScenario(
-        problem_name="N-Queens",
-        instance_text="Găsirea unei singure configurații valide pentru N=1000.",
-        required_strategy="Hill Climbing",
-        required_heuristic="Min-Conflicts (sau Obiectiv)",
-        prompt_hint="Spațiul este imens. Căutăm un maxim local/global rapid, nu un drum.",
-        explanation="Hill Climbing este cea mai rapidă strategie generală pentru optimizare, dar riscă să se blocheze în maxime locale. Aici euristica nu este o distanță, ci o funcție de fitness (h(FS)=max).",
-        keywords=["queens", "regine", "sah", "configuratie", "n=1000", "mare", "large"]
-    ),
-    ProblemScenario(
-        problem_name="N-Queens",
-        instance_text="Rezolvarea problemei evitând blocarea în maxime locale.",
-        required_strategy="Simulated Annealing",
-        required_heuristic="Obiectiv",
-        prompt_hint="Strategie care acceptă uneori stări mai proaste pentru a scăpa din optimuri locale.",
-        explanation="Simulated Annealing este o variantă de Hill Climbing care permite alegerea unor stări mai 'slabe' cu o probabilitate descrescătoare, pentru a evita blocarea în maxime locale.",
-        keywords=["queens", "regine", "evitare", "maxime locale", "annealing", "calire"]
-    ),
-    ProblemScenario(
-        problem_name="N-Queens",
-        instance_text="Găsirea TUTUROR soluțiilor pentru N=8.",
-        required_strategy="Backtracking",
-        required_heuristic="Niciuna (Implicită)",
-        prompt_hint="Se cere explorare sistematică și exhaustivă.",
-        explanation="Backtracking este ideal pentru enumerarea tuturor soluțiilor deoarece poate evita buclele fără a memora stările vizitate și explorează sistematic.",
-        keywords=["queens", "regine", "toate solutiile", "all solutions", "n=8", "backtracking"]
-    ),
+_FIELDS = ("problem_name", "instance_text", "required_strategy", "required_heuristic", "prompt_hint", "explanation")
 
-    # ---------------------------------------------------------
-    # 3. MEMORY CONSTRAINTS & COMPLEX PATHS (SMA*, Beam)
-    # ---------------------------------------------------------
-    ProblemScenario(
-        problem_name="Pathfinding in Large Graph",
-        instance_text="Căutare A* unde memoria RAM se umple înainte de a găsi soluția.",
-        required_strategy="SMA* (Simplified Memory Bounded A*)",
-        required_heuristic="Consistentă",
-        prompt_hint="Strategie care 'uită' noduri când memoria e plină, dar le poate regenera.",
-        explanation="SMA* elimină (prunes) stările cele mai puțin promițătoare când memoria e plină și memorează costul pentru a le regenera dacă este nevoie.",
-        keywords=["memorie", "memory", "ram", "plina", "full", "limitata", "bounded"]
-    ),
-    ProblemScenario(
-        problem_name="Complex Search",
-        instance_text="Căutare într-un spațiu vast, păstrând doar cele mai bune k opțiuni la fiecare pas.",
-        required_strategy="Beam Search",
-        required_heuristic="Informată",
-        prompt_hint="Este un BFS optimizat care limitează memoria păstrând o listă sortată de mărime fixă.",
-        explanation="Beam Search este un BFS care păstrează doar cele mai bune 'k' stări vizitate. Este eficient mem-wise, dar nu garantează optimul, putând rata soluția.",
-        keywords=["k opțiuni", "k options", "vast", "beam"]
-    ),
+def scenario_from_dict(entry: Dict[str, Any]) -> ProblemScenario:
+    if not isinstance(entry, dict):
+        raise ValueError("scenario must be an object")
+    missing = [f for f in _FIELDS if not isinstance(entry.get(f), str)]
+    if missing:
+        raise ValueError(f"scenario is missing text fields: {', '.join(missing)}")
+    keywords = entry.get("keywords", [])
+    if not isinstance(keywords, list) or not all(isinstance(kw, str) for kw in keywords):
+        raise ValueError(f"keywords of '{entry['problem_name']}' must be a list of strings")
+    return ProblemScenario(**{f: entry[f] for f in _FIELDS}, keywords=list(keywords))
 
-    # ---------------------------------------------------------
-    # 4. GAME THEORY / INTERACTIVE
-    # ---------------------------------------------------------
-    ProblemScenario(
-        problem_name="Chess / Board Game",
-        instance_text="Joc interactiv unde adversarul încearcă să ne minimizeze câștigul.",
-        required_strategy="Minimax (sau Alpha-Beta)", # Deși cursul atinge jocurile la final
-        required_heuristic="Evaluare Pozițională",
-        prompt_hint="Problemă decizională interactivă (Games). Soluția depinde de adversar.",
-        explanation="Jocurile sunt cele mai grele probleme rezolvabile. Aici nu căutăm o simplă stare finală, ci o strategie împotriva unui adversar optim.",
-        keywords=["chess", "sah", "joc", "adversar", "interactiv", "minimax", "board game"]
-    ),
-    
-    # ---------------------------------------------------------
-    # 5. GRAPH COLORING / CSP
-    # ---------------------------------------------------------
-    ProblemScenario(
-        problem_name="Graph Coloring",
-        instance_text="Verificarea rapidă a posibilității de colorare (fail-fast).",
-        required_strategy="Backtracking",
-        required_heuristic="MRV (Minimum Remaining Values)",
-        prompt_hint="Se alege variabila cea mai constrânsă pentru a detecta eșecul cât mai devreme.",
-        explanation="În problemele CSP, Backtracking cu euristici precum MRV ajută la 'pruning'-ul ramurilor invalide mult mai devreme.",
-        keywords=["colorarea", "hartilor", "coloring", "maps", "noduri", "nodes", "mrv", "csp", "constransa"]
-    )
-]
+def load_scenarios(path: str) -> List[ProblemScenario]:
+    """Read a JSON list of scenarios; ValueError if the file is missing or malformed."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"cannot read scenario catalog {path}: {e}")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("scenario catalog must be a non-empty JSON list")
+    scenarios = []
+    for i, entry in enumerate(entries):
+        try:
+            scenarios.append(scenario_from_dict(entry))
+        except ValueError as e:
+            raise ValueError(f"scenario #{i + 1}: {e}")
+    return scenarios
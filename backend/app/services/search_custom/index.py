@@ -0,0 +1,156 @@
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from app.services.search_custom.definitions import ProblemScenario, normalize_text
+
+class AhoCorasick:
+    """Multi-pattern substring matcher: one pass over the text finds every pattern it contains."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for pid, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(pid)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> Set[int]:
+        """Ids of the patterns occurring in text."""
+        found: Set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            found.update(self._out[state])
+        return found
+
+# Strategy indicators: (prompt words, predicate on required_strategy, bonus)
+STRATEGY_BOOSTS: Tuple[Tuple[frozenset, object, int], ...] = (
+    # "Toate solutiile" (All solutions) -> Strong indicator for Backtracking
+    (frozenset({"toate", "all", "exhaustiv"}), lambda s: "backtracking" in s.lower(), 15),
+    # "Optim" / "Minim" -> Indicator for A* / BFS
+    (frozenset({"optim", "minim", "scurt"}), lambda s: s in ["A*", "BFS"], 5),
+    # "Rapid" / "Mare" -> Indicator for Greedy / Hill Climbing
+    (frozenset({"rapid", "mare", "mii"}), lambda s: s in ["Greedy Best-First", "Hill Climbing"], 5),
+)
+
+def _postings(pairs: Iterable[Tuple[str, int]], weight: int) -> Dict[str, List[Tuple[int, int]]]:
+    """term -> [(id, weight * occurrences)], ids in ascending order."""
+    counts: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    for term, i in pairs:
+        counts[term][i] += weight
+    return {term: sorted(by_id.items()) for term, by_id in counts.items()}
+
+class ScenarioIndex:
+    """
+    Everything solve_prompt needs from the catalog (fields normalized by ProblemScenario):
+    - keyword and problem-name phrases in one Aho-Corasick automaton
+      (a keyword found anywhere in the prompt: +15; the whole name: +10);
+    - name words (+3, only when the whole name is absent) and instance words (+2)
+      as posting lists keyed by the word;
+    - the strategy indicators as a bonus per scenario group.
+    Scoring touches only the postings of what the prompt contains, so its cost
+    depends on the prompt, not on the number of scenarios.
+    """
+
+    def __init__(self, scenarios: Sequence[ProblemScenario]):
+        self.scenarios = list(scenarios)
+        names: Dict[str, int] = {}
+        self._name_of: List[int] = []
+        for sc in self.scenarios:
+            self._name_of.append(names.setdefault(sc.norm_name, len(names)))
+        name_list = list(names)
+
+        keyword_pairs = [(kw, sid) for sid, sc in enumerate(self.scenarios) for kw in sc.norm_keywords]
+        self._keywords = _postings(keyword_pairs, 15)
+        self._name_words = _postings(
+            ((w, nid) for nid, name in enumerate(name_list) for w in name.split() if len(w) > 3), 3)
+        self._instance_words = _postings(
+            ((w, sid) for sid, sc in enumerate(self.scenarios)
+             for w in sc.norm_instance.split() if len(w) > 3), 2)
+        self._scenarios_of_name: List[List[int]] = [[] for _ in name_list]
+        for sid, nid in enumerate(self._name_of):
+            self._scenarios_of_name[nid].append(sid)
+
+        # phrases: keyword patterns first, then the names (the empty string is in every prompt)
+        self._phrases = [kw for kw in self._keywords if kw]
+        self._name_ids = [nid for nid, name in enumerate(name_list) if name]
+        self._matcher = AhoCorasick(self._phrases + [name_list[nid] for nid in self._name_ids])
+        self._always: Dict[int, int] = defaultdict(int)
+        for sid, w in self._keywords.get("", []):
+            self._always[sid] += w
+        for nid, name in enumerate(name_list):
+            if not name:
+                for sid in self._scenarios_of_name[nid]:
+                    self._always[sid] += 10
+
+        # scenarios grouped by which indicators apply to them; the first of a group
+        # wins any tie among members that only have the bonus
+        self._boost_group: List[Tuple[bool, ...]] = [
+            tuple(applies(sc.required_strategy) for _, applies, _ in STRATEGY_BOOSTS) for sc in self.scenarios
+        ]
+        self._group_first: Dict[Tuple[bool, ...], int] = {}
+        for sid, group in enumerate(self._boost_group):
+            if any(group):
+                self._group_first.setdefault(group, sid)
+
+    def best_match(self, user_prompt: str) -> Tuple[int, int]:
+        """(scenario id, score) of the first highest-scoring scenario; (-1, 0) if none scores."""
+        clean_prompt = normalize_text(user_prompt)
+        prompt_words = set(clean_prompt.split())
+        scores: Dict[int, int] = defaultdict(int, self._always)
+
+        found = self._matcher.find(clean_prompt)
+        found_names = set()
+        for pid in found:
+            if pid < len(self._phrases):
+                for sid, w in self._keywords[self._phrases[pid]]:
+                    scores[sid] += w
+            else:
+                nid = self._name_ids[pid - len(self._phrases)]
+                found_names.add(nid)
+                for sid in self._scenarios_of_name[nid]:
+                    scores[sid] += 10
+
+        for word in prompt_words:
+            for nid, w in self._name_words.get(word, ()):
+                if nid not in found_names:
+                    for sid in self._scenarios_of_name[nid]:
+                        scores[sid] += w
+            for sid, w in self._instance_words.get(word, ()):
+                scores[sid] += w
+
+        active = tuple(bool(words & prompt_words) for words, _, _ in STRATEGY_BOOSTS)
+        bonus_of = {
+            group: sum(b for on, applies, (_, _, b) in zip(active, group, STRATEGY_BOOSTS) if on and applies)
+            for group in self._group_first
+        }
+        candidates = set(scores) | {sid for group, sid in self._group_first.items() if bonus_of[group]}
+
+        best, max_score = -1, 0
+        for sid in sorted(candidates):
+            score = scores.get(sid, 0) + bonus_of.get(self._boost_group[sid], 0)
+            if score > max_score:
+                best, max_score = sid, score
+        return best, max_score
@@ -93,6 +93,13 @@ export async function getQuestion(id: string) {
   return handleResponse(res);
 }
 
+// Explanation rendered on demand (optionally for one evaluation of the question)
+export async function explainQuestion(id: string, evaluationId?: number) {
+  const qs = buildQuery({ evaluation_id: evaluationId });
+  const res = await fetch(`${API_BASE}/api/questions/${encodeURIComponent(id)}/explain${qs}`);
+  return handleResponse(res);
+}
+
 // Original submitAnswer for Nash/General (legacy?)
 export async function submitAnswer(qid: string, text?: string, pdfFile?: File) {
   const form = new FormData();
@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from "react";
-import { getQuestion, submitAnswer, submitGameTheoryAnswer } from "../api";
+import { explainQuestion, getQuestion, submitAnswer, submitGameTheoryAnswer } from "../api";
 import CustomNash from "./NashCustom";
 import SearchQuestion from "../components/SearchQuestion";
 import { useNavigate } from "react-router-dom";
@@ -48,12 +48,14 @@ export default function QuestionView({ id, onBack }: { id: string; onBack: () =>
         setSelectedProfiles([]);
 
         // If it's a solved custom question, show the result immediately
-        if (q.data?.solution && q.data?.explanation) {
+        // (the explanation is rendered on demand for rows that no longer store it)
+        if (q.data?.solution && (q.data?.explanation || q.data?.is_solver)) {
+          const explanation = q.data.explanation ?? (await explainQuestion(id)).explanation;
           setResult({
             result: {
               feedback: "Analysis from Solver",
               score_percent: 100, // It's a solver result, so it's "correct"
-              explanation: q.data.explanation,
+              explanation,
               // We can also show the solution text somewhere? 
               // The explanation usually contains the solution in our generator. 
               // But let's append solution to explanation if needed or just rely on explanation.